@@ -1,18 +1,49 @@
+from .test_banner_writer import (
+    TestBannerWriter_write)
 from .test_birthday_notifier import (
     TestBirthdayNotifier__init__, TestBirthdayNotifier_time_machine,
-    TestBirthdayNotifier_print_birthdays, TestBirthdayNotifier_get_str
+    TestBirthdayNotifier_print_birthdays, TestBirthdayNotifier_upcoming,
+    TestBirthdayNotifier_notifications, TestBirthdayNotifier_find,
+    TestBirthdayNotifier_milestones,
+    TestBirthdayNotifier_get_str
     )
 from .test_birthday import (
     TestBirthday__init__)
+from .test_birthday_store import (
+    TestBirthdayStore_import_data, TestBirthdayStore_birthday_window)
+from .test_compiled_data import (
+    TestCompiledData_compile_data, TestCompiledDataFile__init__,
+    TestCompiledDataFile_birthday_window
+    )
 from .test_data_loader import (
     TestDataLoader__init__, TestDataLoader_construct_birthdays,
-    TestDataLoader_construct_time_tags
+    TestDataLoader_construct_time_tags, TestDataLoader_from_records,
+    TestDataLoader_open_data_file, TestDataLoader_include
+    )
+from .test_exporters import (
+    TestExporters_write_ical)
+from .test_importers import (
+    TestImporters_read_csv_records, TestImporters_read_vcard_records,
+    TestImporters_read_ical_records
     )
+from .test_package import (
+    TestPackage__getattr__)
+from .test_parsers import (
+    TestParsers_parse_dates, TestParsers_parse_times)
 from .test_primary_prompt import (
     TestPrimaryPrompt__init__, TestPrimaryPrompt_get_str,
-    TestPrimaryPrompt_get_prompt
+    TestPrimaryPrompt_load_failed, TestPrimaryPrompt_get_prompt,
+    TestPrimaryPrompt_get_time_tags_bulk
     )
 from .test_secondary_prompt import (
     TestSecondaryPrompt__init__, TestSecondaryPrompt_get_str)
 from .test_time_tag import (
-    TestTimeTag__init__)
+    TestTimeTag__init__, TestTimeTag_applies_on)
+from .test_time_tag_schedule import (
+    TestTimeTagSchedule_active_at, TestTimeTagSchedule_next_transition,
+    TestTimeTagSchedule_active_bulk
+    )
+from .test_validation import (
+    TestValidation_validate_file, TestValidation_validate_files)
+from .test_zone_clock import (
+    TestZoneClock_from_utc)
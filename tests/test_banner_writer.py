@@ -0,0 +1,48 @@
+import textwrap
+import unittest
+
+from time_tag_birthday_prompt.banner_writer import BannerWriter
+
+
+class TestBannerWriter_write(unittest.TestCase):
+    """Test `BannerWriter` object `write()` method."""
+
+    def assertMatchesFill(self, pieces, width):
+        writer = BannerWriter(width)
+        for piece in pieces:
+            writer.write(piece)
+        self.assertEqual(
+            writer.getvalue(), textwrap.fill(''.join(pieces), width))
+
+    def testWordsSplitAcrossWrites(self):
+        self.assertMatchesFill(
+            ['Birthday of Aba', 'cus (15) to', 'morrow, Bacil', 'lus today'],
+            12)
+
+    def testWhitespaceRunSplitAcrossWrites(self):
+        self.assertMatchesFill(['one ', '  two  ', ' three', '   '], 5)
+
+    def testLongWordsAndHyphens(self):
+        self.assertMatchesFill(
+            ['Birthday of Long-Hyphenated-Name', 'X' * 30, ' and A--B'], 10)
+
+    def testTabsAndNewlines(self):
+        self.assertMatchesFill(['a\tb', 'c\td\n', '\te\rf\tg'], 20)
+
+    def testEmpty(self):
+        self.assertEqual(BannerWriter(10).getvalue(), '')
+
+    def testAppendsToGivenList(self):
+        lines = ['first']
+        writer = BannerWriter(10, lines)
+        writer.write('aaa bbb ccc')
+        self.assertIs(writer.close(), lines)
+        self.assertEqual(lines, ['first', 'aaa bbb', 'ccc'])
+
+    def testIncorrectWidth(self):
+        with self.assertRaises(ValueError):
+            BannerWriter(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
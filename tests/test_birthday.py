@@ -6,7 +6,7 @@ from time_tag_birthday_prompt.birthday import Birthday
 from .extend_unittest import assertGroupMatchesExceptions
 from time_tag_birthday_prompt.exceptions import (
     BirthdayInitGroup, IncorrectParameterTypeError, IncorrectDateFormatError,
-    NullYearError, DateDoesntExistError
+    NullYearError, DateDoesntExistError, UnknownEventTypeError
     )
 
 
@@ -86,6 +86,24 @@ class TestBirthday__init__(unittest.TestCase):
         assertGroupMatchesExceptions(
             self, cm.exception, [DateDoesntExistError])
 
+    def testParam_event_type(self):
+        self.assertEqual(Birthday('06-10', 'name').event_type, 'birthday')
+        self.assertEqual(
+            Birthday('06-10', 'name', event_type='nameday').event_type,
+            'nameday')
+
+    def testParam_event_type_UnknownEventTypeError(self):
+        with self.assertRaises(BirthdayInitGroup) as cm:
+            Birthday('06-10', 'name', event_type='holiday')
+        assertGroupMatchesExceptions(
+            self, cm.exception, [UnknownEventTypeError])
+
+    def testParam_event_type_incorrectType(self):
+        with self.assertRaises(BirthdayInitGroup) as cm:
+            Birthday('06-10', 'name', event_type=1)
+        assertGroupMatchesExceptions(
+            self, cm.exception, [IncorrectParameterTypeError])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,9 +1,11 @@
-from datetime import date
+from datetime import date, timedelta
 from tempfile import TemporaryFile
+from unittest import mock
 import unittest
 
 from .extend_unittest import OverridePrint
-from time_tag_birthday_prompt.birthday_notifier import BirthdayNotifier
+from time_tag_birthday_prompt.birthday_notifier import (
+    BirthdayNotifier, UpcomingBirthday, Milestone)
 
 from time_tag_birthday_prompt.primary_prompt import PrimaryPrompt
 from time_tag_birthday_prompt.data_loader import DataLoader
@@ -13,7 +15,8 @@ from time_tag_birthday_prompt.exceptions import (
 
 
 def get_birthday_notifier(
-        birthday_array_text, birthday_notify_days=30) -> BirthdayNotifier:
+        birthday_array_text, birthday_notify_days=30, **kwargs
+        ) -> BirthdayNotifier:
     bn = None
     with TemporaryFile(mode='w+', encoding='utf-8') as tf:
         tf.write(
@@ -23,7 +26,8 @@ def get_birthday_notifier(
         bn = BirthdayNotifier(
             data_loader=DataLoader(file_obj=tf, path='<testing>'),
             birthday_notify_days=birthday_notify_days,
-            line_width=70
+            line_width=70,
+            **kwargs
             )
     return bn
 
@@ -120,11 +124,236 @@ class TestBirthdayNotifier_print_birthdays(unittest.TestCase):
                 match_count += 1
         self.assertEqual(match_count, 3)
 
+    def testParam_pager(self):
+        bn = get_birthday_notifier('["2008-06-16", "Abacus"]')
+        with mock.patch('pydoc.pager') as pager:
+            bn.print_birthdays(pager=True)
+        pager.assert_called_once()
+        self.assertIn('2008-06-16  Abacus\n', pager.call_args.args[0])
+
+
+class TestBirthdayNotifier_upcoming(unittest.TestCase):
+    """Test `BirthdayNotifier` object `upcoming()` method."""
+
+    def testRecords(self):
+        bn = get_birthday_notifier(
+            '["2008-06-16", "Abacus"], ["06-11", "Bacillus"], '
+            '["2000-02-29", "Cecil"]'
+            )
+        self.assertEqual(
+            bn.upcoming(today=date(2023, 6, 10)),
+            [UpcomingBirthday('Bacillus', date(2023, 6, 11), None, 1,
+                              'tomorrow'),
+             UpcomingBirthday('Abacus', date(2023, 6, 16), 15, 6,
+                              'on Friday')]
+            )
+
+    def testParam_limit(self):
+        bn = get_birthday_notifier(
+            '["06-11", "Cecil"], ["06-11", "Abacus"], ["06-10", "Dora"], '
+            '["06-12", "Bacillus"]'
+            )
+        self.assertEqual(
+            [bd.name for bd in bn.upcoming(date(2023, 6, 10), limit=3)],
+            ['Dora', 'Abacus', 'Cecil']
+            )
+
+    def testParam_horizon(self):
+        bn = get_birthday_notifier('["2000-02-29", "Cecil"]')
+        upcoming = bn.upcoming(date(2023, 1, 1), horizon=365)
+        self.assertEqual(
+            upcoming,
+            [UpcomingBirthday('Cecil', date(2023, 2, 28), 23, 58,
+                              'in 58 days')]
+            )
+
+    def testParam_today_incorrectType(self):
+        bn = get_birthday_notifier('["06-11", "Abacus"]')
+        with self.assertRaises(IncorrectParameterTypeError):
+            bn.upcoming(today='2023-06-10')
+
+
+class TestBirthdayNotifier_notifications(unittest.TestCase):
+    """Test `BirthdayNotifier` object `notifications()` method."""
+
+    def testRange(self):
+        bn = get_birthday_notifier(
+            '["2000-03-01", "Abacus"], '
+            '["2004-02-29", "Bacillus", {"notifyDays": 1}]',
+            birthday_notify_days=2
+            )
+        self.assertEqual(
+            [(day, [(rec.name, rec.date, rec.age, rec.days_until)
+                    for rec in records])
+             for day, records in bn.notifications(
+                date(2023, 2, 26), date(2023, 3, 1))],
+            [(date(2023, 2, 26), []),
+             (date(2023, 2, 27), [
+                 ('Bacillus', date(2023, 2, 28), 19, 1),
+                 ('Abacus', date(2023, 3, 1), 23, 2)]),
+             (date(2023, 2, 28), [
+                 ('Bacillus', date(2023, 2, 28), 19, 0),
+                 ('Abacus', date(2023, 3, 1), 23, 1)]),
+             (date(2023, 3, 1), [('Abacus', date(2023, 3, 1), 23, 0)])]
+            )
+
+    def testMatchesGetStr(self):
+        bn = get_birthday_notifier(
+            '["2000-06-16", "Abacus"], ["06-11", "Bacillus"], '
+            '["1990-07-20", "Cecil", {"notifyDays": 60}]',
+            birthday_notify_days=7
+            )
+        for day, records in bn.notifications(
+                date(2023, 5, 20), date(2023, 7, 1)):
+            fresh = get_birthday_notifier(
+                '["2000-06-16", "Abacus"], ["06-11", "Bacillus"], '
+                '["1990-07-20", "Cecil", {"notifyDays": 60}]',
+                birthday_notify_days=7
+                )
+            self.assertEqual(
+                records, [
+                    rec for rec in fresh.upcoming(day, horizon=60)
+                    if rec.name == 'Cecil' or rec.days_until <= 7
+                    ])
+
+    def testRecordsGetStr(self):
+        data = (
+            '["2000-06-16", "Abacus"], ["06-11", "Bacillus"], '
+            '["06-11", "Cecil", {"type": "nameDay"}], '
+            '["1990-07-20", "Dorothy", {"notifyDays": 60}]')
+        bn = get_birthday_notifier(data, birthday_notify_days=7)
+        fresh = get_birthday_notifier(data, birthday_notify_days=7)
+        for day, records in bn.notifications(
+                date(2023, 5, 20), date(2023, 7, 1)):
+            self.assertEqual(
+                bn.get_str(today=day, records=records),
+                fresh.get_str(today=day))
+
+    def testEmptyRange(self):
+        bn = get_birthday_notifier('["06-11", "Bacillus"]')
+        self.assertEqual(
+            list(bn.notifications(date(2023, 6, 2), date(2023, 6, 1))), [])
+
+    def test_IncorrectParameterTypeError(self):
+        bn = get_birthday_notifier('["06-11", "Bacillus"]')
+        with self.assertRaises(IncorrectParameterTypeError):
+            list(bn.notifications('2023-06-01', date(2023, 6, 2)))
+
+
+class TestBirthdayNotifier_find(unittest.TestCase):
+    """Test `BirthdayNotifier` object `find()` method."""
+
+    def setUp(self):
+        self.bn = get_birthday_notifier(
+            '["2008-06-16", "Jasper Pääkkönen"], ["06-11", "Jaana Virta"], '
+            '["2000-02-29", "Paavo Jasper"], ["03-01", "Ömer"]'
+            )
+
+    def testPrefixOfName(self):
+        self.assertEqual(
+            [bd.name for bd in self.bn.find('ja')],
+            ['Jaana Virta', 'Jasper Pääkkönen', 'Paavo Jasper']
+            )
+
+    def testPrefixOfWord(self):
+        self.assertEqual(
+            [bd.name for bd in self.bn.find('PAA')],
+            ['Jasper Pääkkönen', 'Paavo Jasper']
+            )
+
+    def testAsciiFolded(self):
+        self.assertEqual(
+            [bd.name for bd in self.bn.find('jasper paakk')],
+            ['Jasper Pääkkönen']
+            )
+        self.assertEqual(
+            [bd.name for bd in self.bn.find('o\u0308mer')], ['Ömer'])
+
+    def testNotFound(self):
+        self.assertEqual(self.bn.find('x'), [])
+
+    def testParam_prefix_incorrectType(self):
+        with self.assertRaises(IncorrectParameterTypeError):
+            self.bn.find(None)
+
+    def testPrintBirthdays(self):
+        op = OverridePrint()
+        self.bn.print_birthdays(print_func=op, prefix='virta')
+        self.assertIn('     06-11  Jaana Virta\n', op.text)
+        self.assertNotIn('Jasper', op.text)
+
+
+class TestBirthdayNotifier_milestones(unittest.TestCase):
+    """Test `BirthdayNotifier` object `milestones()` method."""
+
+    def setUp(self):
+        self.bn = get_birthday_notifier(
+            '["1973-06-16", "Abacus"], ["1963-06-11", "Bacillus"], '
+            '["1964-02-29", "Cecil"], ["06-11", "Dora"], '
+            '["1973-01-02", "Eemil"]'
+            )
+
+    def testRoundAges(self):
+        self.assertEqual(
+            self.bn.milestones(2023),
+            [Milestone('Eemil', date(2023, 1, 2), 50),
+             Milestone('Bacillus', date(2023, 6, 11), 60),
+             Milestone('Abacus', date(2023, 6, 16), 50)]
+            )
+
+    def testParam_ages(self):
+        self.assertEqual(
+            self.bn.milestones(2023, ages=[59]),
+            [Milestone('Cecil', date(2023, 2, 28), 59)]
+            )
+
+    def testParam_year_incorrectType(self):
+        with self.assertRaises(IncorrectParameterTypeError):
+            self.bn.milestones('2023')
+
+    def testEventTypes(self):
+        bn = get_birthday_notifier(
+            '["1973-06-16", "Wedding", {"type": "anniversary"}], '
+            '["1973-06-11", "Aino", {"type": "nameday"}]'
+            )
+        self.assertEqual(
+            bn.milestones(2023),
+            [Milestone('Wedding', date(2023, 6, 16), 50, 'anniversary')]
+            )
 
 
 class TestBirthdayNotifier_get_str(unittest.TestCase):
     """Test `BirthdayNotifier` object `get_str()` method."""
 
+    def testEventTypes(self):
+        bn = get_birthday_notifier(
+            '["2008-06-16", "Abacus"], '
+            '["2001-06-11", "Wedding", {"type": "anniversary"}], '
+            '["06-11", "Aino", {"type": "nameday"}], '
+            '["2000-06-11", "Bacillus"], '
+            '["06-30", "Taxes", {"type": "deadline"}]',
+            milestone_ages=[22]
+            )
+        gs = ' '.join(bn.get_str(today=date(2023, 6, 10)).split())
+        self.assertIn(
+            'Birthday of Bacillus (23), anniversary of Wedding (22 years!) '
+            'and name day of Aino tomorrow, birthday of Abacus (15) on '
+            'Friday, deadline Taxes in 20 days -', gs)
+
+    def testEventTypesUpcoming(self):
+        bn = get_birthday_notifier(
+            '["2001-06-11", "Wedding", {"type": "anniversary"}], '
+            '["2000-06-11", "Aino", {"type": "nameday"}]'
+            )
+        self.assertEqual(
+            bn.upcoming(date(2023, 6, 10)),
+            [UpcomingBirthday(
+                'Wedding', date(2023, 6, 11), 22, 1, 'tomorrow',
+                'anniversary'),
+             UpcomingBirthday(
+                 'Aino', date(2023, 6, 11), None, 1, 'tomorrow', 'nameday')]
+            )
+
     def testDaysFridayInWeek(self):
         bn = get_birthday_notifier(
                 '["2008-06-16", "Abacus"]',
@@ -323,6 +552,150 @@ class TestBirthdayNotifier_get_str(unittest.TestCase):
         gs = ' '.join(gs.split())
         self.assertIn(', 2023-06-30 -', gs)
 
+    def testNotifyDays365Yesterday(self):
+        # From 2024-01-10 to 2025-01-09 is 365 days, as 2024 is leap.
+        bn = get_birthday_notifier(
+                '["2000-01-10", "Abacus"], '
+                '["2000-01-09", "Bacillus"]',
+                birthday_notify_days=365
+                )
+        gs = bn.get_str(today=date(2024, 1, 10))
+        gs = ' '.join(gs.split())
+        self.assertIn(
+            'Birthday of Abacus (24) today, Bacillus (25) in 365 days -', gs)
+
+    def testNotifyDays365TodayOnlyOnce(self):
+        bn = get_birthday_notifier(
+                '["2000-01-10", "Abacus"], '
+                '["2000-02-29", "Bacillus"]',
+                birthday_notify_days=365
+                )
+        gs = bn.get_str(today=date(2023, 1, 10))
+        self.assertEqual(gs.count('Abacus'), 1)
+        gs = bn.get_str(today=date(2024, 2, 29))
+        gs = ' '.join(gs.split())
+        self.assertIn('Bacillus (24) today, Abacus (25) in 316 days -', gs)
+
+    def testLeapDayBirthdayInCommonYear(self):
+        bn = get_birthday_notifier(
+                '["2008-02-29", "Abacus"]',
+                birthday_notify_days=30
+                )
+        gs = bn.get_str(today=date(2023, 2, 27))
+        gs = ' '.join(gs.split())
+        self.assertIn('Birthday of Abacus (15) tomorrow -', gs)
+
+    def testLeapDayBirthdayInLeapYear(self):
+        bn = get_birthday_notifier(
+                '["2008-02-29", "Abacus"]',
+                birthday_notify_days=30
+                )
+        gs = bn.get_str(today=date(2024, 2, 28))
+        gs = ' '.join(gs.split())
+        self.assertIn('Birthday of Abacus (16) tomorrow -', gs)
+
+    def testRolloverMatchesFreshWindow(self):
+        bda = (
+            '["2008-08-01", "Abacus"], '
+            '["2007-07-31", "Bacillus"], '
+            '["07-02", "Cecil"]'
+            )
+        bn = get_birthday_notifier(bda, birthday_notify_days=30)
+        today = date(2023, 6, 25)
+        for _ in range(40):
+            rolled = bn.get_str(today=today)
+            fresh = get_birthday_notifier(
+                bda, birthday_notify_days=30).get_str(today=today)
+            self.assertEqual(rolled, fresh)
+            today += timedelta(1)
+
+    def testWeekdayAcrossNewYear(self):
+        # 2023-12-29 is a Friday and 2024-01-05 a Friday of next week.
+        bn = get_birthday_notifier('["01-05", "Abacus"]')
+        gs = bn.get_str(today=date(2023, 12, 29))
+        gs = ' '.join(gs.split())
+        self.assertIn('Birthday of Abacus on Friday next week -', gs)
+
+    def testDaysAcrossNewYear(self):
+        bn = get_birthday_notifier('["01-20", "Abacus"]')
+        gs = bn.get_str(today=date(2023, 12, 29))
+        gs = ' '.join(gs.split())
+        self.assertIn('Birthday of Abacus in 22 days -', gs)
+
+    def testMaxNames(self):
+        bn = get_birthday_notifier(
+            '["06-11", "Abacus"], ["06-11", "Bacillus"], '
+            '["06-11", "Cecil"], ["06-12", "Dora"]',
+            max_names=2
+            )
+        gs = bn.get_str(today=date(2023, 6, 10))
+        gs = ' '.join(gs.split())
+        self.assertIn(
+            'Birthday of Abacus and Bacillus tomorrow and 2 more -', gs)
+
+    def testMilestoneAges(self):
+        bn = get_birthday_notifier(
+            '["1973-06-11", "Abacus"], ["1972-06-12", "Bacillus"]',
+            milestone_ages={50}
+            )
+        gs = bn.get_str(today=date(2023, 6, 10))
+        gs = ' '.join(gs.split())
+        self.assertIn(
+            'Birthday of Abacus (50!) tomorrow, Bacillus (51) on Monday -',
+            gs)
+
+    def testMaxNamesNotReached(self):
+        bn = get_birthday_notifier(
+            '["06-11", "Abacus"], ["06-12", "Bacillus"]', max_names=2)
+        gs = bn.get_str(today=date(2023, 6, 10))
+        gs = ' '.join(gs.split())
+        self.assertIn(
+            'Birthday of Abacus tomorrow, Bacillus on Monday -', gs)
+        self.assertNotIn('more', gs)
+
+    def testMaxLines(self):
+        bda = ', '.join(f'["06-11", "Name{i:03}"]' for i in range(100))
+        bn = get_birthday_notifier(bda, max_lines=2)
+        lines = bn.get_str(today=date(2023, 6, 10)).split('\n')
+        self.assertEqual(len(lines), 6)
+        self.assertTrue(lines[-2].endswith(' more'))
+        self.assertTrue(all(len(line) <= 70 for line in lines))
+
+    def testPerBirthdayNotifyDays(self):
+        bn = get_birthday_notifier(
+            '["06-20", "Abacus", {"notifyDays": 3}], '
+            '["06-21", "Bacillus", {"notifyDays": 60}], '
+            '["06-22", "Cecil"], ["08-01", "Dora", {"notifyDays": 60}], '
+            '["08-02", "Eve"]',
+            birthday_notify_days=30
+            )
+        gs = bn.get_str(today=date(2023, 6, 10))
+        gs = ' '.join(gs.split())
+        self.assertIn(
+            'Birthday of Bacillus in 11 days, Cecil in 12 days, '
+            'Dora in 52 days -', gs)
+        gs = bn.get_str(today=date(2023, 6, 17))
+        gs = ' '.join(gs.split())
+        self.assertIn('Birthday of Abacus on Tuesday, Bacillus on', gs)
+
+    def testParam_birthday_groups(self):
+        bda = (
+            '["06-11", "Abacus", {"groups": ["family"]}], '
+            '["06-12", "Bacillus", {"groups": ["team-a", "family"]}], '
+            '["06-13", "Cecil", {"groups": ["team-a"]}], '
+            '["06-14", "Dora"]'
+            )
+        bn = get_birthday_notifier(bda, birthday_groups={'family'})
+        gs = ' '.join(bn.get_str(today=date(2023, 6, 10)).split())
+        self.assertIn(
+            'Birthday of Abacus tomorrow, Bacillus on Monday -', gs)
+        bn = get_birthday_notifier(bda, birthday_groups=['team-a', 'none'])
+        gs = ' '.join(bn.get_str(today=date(2023, 6, 10)).split())
+        self.assertIn(
+            'Birthday of Bacillus on Monday, Cecil on Tuesday -', gs)
+        bn = get_birthday_notifier(bda)
+        self.assertEqual(len(bn.upcoming(date(2023, 6, 10))), 4)
+
     def testNotifyDays0Today(self):
         bn = get_birthday_notifier(
                 '["2008-07-01", "Abacus"]',
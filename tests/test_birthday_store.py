@@ -0,0 +1,188 @@
+from datetime import date
+from tempfile import TemporaryDirectory, TemporaryFile
+import os.path
+import sqlite3
+import unittest
+
+from time_tag_birthday_prompt.birthday_notifier import BirthdayNotifier
+from time_tag_birthday_prompt.birthday_store import BirthdayStore
+from time_tag_birthday_prompt.data_loader import DataLoader
+from time_tag_birthday_prompt.primary_prompt import PrimaryPrompt
+from time_tag_birthday_prompt.exceptions import ConstructBirthdaysGroup
+
+
+def get_birthday_store(
+        birthday_array_text, time_tag_array_text='null') -> BirthdayStore:
+    store = BirthdayStore(':memory:')
+    with TemporaryFile(mode='w+', encoding='utf-8') as tf:
+        tf.write(
+            '{"timeTags": ' + time_tag_array_text + ', "birthdays": '
+            + birthday_array_text + '}'
+            )
+        tf.seek(0)
+        store.import_data(DataLoader(file_obj=tf, path='<testing>'))
+    return store
+
+
+class TestBirthdayStore_import_data(unittest.TestCase):
+    """Test `BirthdayStore` object `import_data()` method."""
+
+    def testRoundTrip(self):
+        store = get_birthday_store(
+            '[["2008-06-16", "Abacus"], '
+            '["06-11", "Bacillus", {"notifyDays": 3, "groups": ["a"]}]]',
+            '[["10:00", "11:00", "tag", {"weekdays": "Mon"}]]'
+            )
+        birthdays = store.construct_birthdays()
+        self.assertEqual(
+            [(bd.date, bd.name, bd.date_obj, bd.notify_days, bd.groups)
+             for bd in birthdays],
+            [('2008-06-16', 'Abacus', date(2008, 6, 16), None, None),
+             ('06-11', 'Bacillus', date(1, 6, 11), 3, ['a'])]
+            )
+        time_tags = store.construct_time_tags()
+        self.assertEqual(
+            [(tag.start, tag.stop, tag.text, tag.weekdays)
+             for tag in time_tags],
+            [('10:00', '11:00', 'tag', 'Mon')]
+            )
+
+    def testNullBirthdays(self):
+        store = get_birthday_store('null')
+        self.assertTrue(store.birthdays_disabled)
+        self.assertIsNone(store.construct_birthdays())
+        self.assertIsNone(store.construct_time_tags())
+
+    def testEventTypes(self):
+        store = get_birthday_store(
+            '[["2001-06-16", "Wedding", {"type": "anniversary"}], '
+            '["06-10", "Aino", {"type": "nameday"}], ["06-11", "Abacus"]]')
+        self.assertEqual(
+            [bd.event_type for bd in store.construct_birthdays()],
+            ['anniversary', 'nameday', 'birthday'])
+
+    def testSchemaVersion1(self):
+        with TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'data.sqlite')
+            connection = sqlite3.connect(path)
+            connection.executescript(
+                'CREATE TABLE birthdays (position INTEGER PRIMARY KEY, '
+                'date TEXT NOT NULL, name TEXT NOT NULL, month INTEGER NOT '
+                'NULL, day INTEGER NOT NULL, ordinal INTEGER NOT NULL, '
+                'notify_days INTEGER, groups TEXT); '
+                "INSERT INTO birthdays VALUES (1, '06-11', 'Abacus', 6, 11, "
+                '162, NULL, NULL); PRAGMA user_version = 1;'
+                )
+            connection.close()
+            store = BirthdayStore(path)
+            birthdays = store.construct_birthdays()
+            store.close()
+        self.assertEqual(
+            [(bd.name, bd.event_type) for bd in birthdays],
+            [('Abacus', 'birthday')])
+
+    def testInvalidDataKeepsStore(self):
+        store = get_birthday_store('[["2008-06-16", "Abacus"]]')
+        with TemporaryFile(mode='w+', encoding='utf-8') as tf:
+            tf.write(
+                '{"timeTags": null, "birthdays": [["2008-06-31", "Cecil"]]}')
+            tf.seek(0)
+            with self.assertRaises(ConstructBirthdaysGroup):
+                store.import_data(DataLoader(tf, '<testing>'))
+        self.assertEqual(
+            [bd.name for bd in store.construct_birthdays()], ['Abacus'])
+
+
+class TestBirthdayStore_birthday_window(unittest.TestCase):
+    """Test `BirthdayStore` object `birthday_window()` method."""
+
+    def setUp(self):
+        self.store = get_birthday_store(
+            '[["2008-06-16", "Abacus"], ["12-30", "Bacillus"], '
+            '["2000-02-29", "Cecil"], ["01-02", "Dora"]]'
+            )
+
+    def testWindow(self):
+        self.assertEqual(
+            [bd.name for bd in self.store.birthday_window(
+                date(2023, 6, 10), 7)],
+            ['Abacus']
+            )
+
+    def testWindowOverNewYear(self):
+        self.assertEqual(
+            sorted(bd.name for bd in self.store.birthday_window(
+                date(2023, 12, 25), 10)),
+            ['Bacillus', 'Dora']
+            )
+
+    def testLeapDayInCommonYear(self):
+        self.assertEqual(
+            [bd.name for bd in self.store.birthday_window(
+                date(2023, 2, 20), 9)],
+            ['Cecil']
+            )
+        self.assertEqual(
+            self.store.birthday_window(date(2024, 2, 20), 9), [])
+
+    def testGroups(self):
+        store = get_birthday_store(
+            '[["06-10", "Abacus", {"groups": ["a", "b"]}], '
+            '["06-11", "Bacillus", {"groups": ["b"]}], '
+            '["06-12", "Cecil"], ["12-30", "Dora", {"groups": ["c"]}]]'
+            )
+        for first, days in ((date(2023, 6, 1), 30), (date(2023, 12, 1), 200),
+                            (date(2023, 1, 1), 365)):
+            self.assertEqual(
+                sorted(bd.name for bd in store.birthday_window(
+                    first, days, frozenset({'a', 'c'}))),
+                [name for name in ('Abacus', 'Dora')
+                 if name in [bd.name for bd in store.birthday_window(
+                     first, days)]]
+                )
+        self.assertEqual(
+            [bd.name for bd in store.birthday_window(
+                date(2023, 6, 1), 30, frozenset({'b'}))],
+            ['Abacus', 'Bacillus']
+            )
+        self.assertEqual(
+            store.birthday_window(date(2023, 6, 1), 30, frozenset()), [])
+
+    def testNotifierMatchesDataLoader(self):
+        text = (
+            '{"timeTags": null, "birthdays": [["2008-06-16", "Abacus"], '
+            '["06-11", "Bacillus", {"notifyDays": 1}], '
+            '["06-12", "Cecil", {"groups": ["b"]}], '
+            '["06-13", "Dora", {"groups": ["a", "b"]}]]}'
+            )
+        with TemporaryFile(mode='w+', encoding='utf-8') as tf:
+            tf.write(text)
+            tf.seek(0)
+            store = BirthdayStore(':memory:')
+            store.import_data(DataLoader(tf, '<testing>'))
+            tf.seek(0)
+            data_loader = DataLoader(tf, '<testing>')
+        for groups in (None, {'b'}, {'a', 'c'}):
+            from_json = BirthdayNotifier(
+                data_loader, 30, 70, birthday_groups=groups)
+            from_store = BirthdayNotifier(
+                store, 30, 70, birthday_groups=groups)
+            for day in (
+                    date(2023, 6, 9), date(2023, 6, 10), date(2023, 6, 12)):
+                self.assertEqual(
+                    from_store.get_str(day), from_json.get_str(day))
+                self.assertEqual(
+                    from_store.upcoming(day), from_json.upcoming(day))
+
+    def testPrimaryPromptPath(self):
+        with TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'data.sqlite')
+            pp = PrimaryPrompt(json_path=path)
+            self.assertTrue(os.path.exists(path))
+            self.assertTrue(pp.birthday_notifier.birthdays)
+            self.assertTrue(pp.time_tags)
+            pp.birthday_notifier._window_source.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,200 @@
+from datetime import date
+from tempfile import TemporaryDirectory
+import io
+import os.path
+import unittest
+
+from time_tag_birthday_prompt.birthday_notifier import BirthdayNotifier
+from time_tag_birthday_prompt.compiled_data import (
+    CompiledDataFile, compile_data)
+from time_tag_birthday_prompt.data_loader import DataLoader
+from time_tag_birthday_prompt.primary_prompt import PrimaryPrompt
+from time_tag_birthday_prompt.exceptions import (
+    CompiledDataFileError, ConstructBirthdaysGroup)
+
+
+class CompiledDataTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.path = os.path.join(self.tmp_dir.name, 'data.ttbp')
+
+    def compile(self, birthday_array_text, time_tag_array_text='null'):
+        text = ('{"timeTags": ' + time_tag_array_text + ', "birthdays": '
+                + birthday_array_text + '}')
+        compile_data(DataLoader(io.StringIO(text), '<testing>'), self.path)
+        compiled = CompiledDataFile(self.path)
+        self.addCleanup(compiled.close)
+        return compiled
+
+
+class TestCompiledData_compile_data(CompiledDataTestCase):
+    """Test `compile_data()` function."""
+
+    def testRoundTrip(self):
+        compiled = self.compile(
+            '[["2008-06-16", "Abacus"], '
+            '["06-11", "Pääkkö", {"notifyDays": 3, "groups": ["a"]}]]',
+            '[["10:00", "11:00", "tag", {"weekdays": "Mon"}]]'
+            )
+        self.assertEqual(
+            [(bd.date, bd.name, bd.date_obj, bd.notify_days, bd.groups)
+             for bd in compiled.construct_birthdays()],
+            [('2008-06-16', 'Abacus', date(2008, 6, 16), None, None),
+             ('06-11', 'Pääkkö', date(1, 6, 11), 3, ['a'])]
+            )
+        self.assertEqual(
+            [(tag.start, tag.stop, tag.text, tag.weekdays, tag.dates)
+             for tag in compiled.construct_time_tags()],
+            [('10:00', '11:00', 'tag', 'Mon', None)]
+            )
+        self.assertEqual(compiled.max_notify_days(1), 3)
+        self.assertEqual(compiled.max_notify_days(30), 30)
+
+    def testEventTypes(self):
+        compiled = self.compile(
+            '[["2001-06-16", "Wedding", {"type": "anniversary"}], '
+            '["06-10", "Aino", {"type": "deadline"}], ["06-11", "Abacus"]]')
+        self.assertEqual(
+            [bd.event_type for bd in compiled.construct_birthdays()],
+            ['anniversary', 'deadline', 'birthday'])
+
+    def testNullRecords(self):
+        compiled = self.compile('null')
+        self.assertTrue(compiled.birthdays_disabled)
+        self.assertFalse(compiled.has_birthdays())
+        self.assertIsNone(compiled.construct_birthdays())
+        self.assertIsNone(compiled.construct_time_tags())
+
+    def testInvalidDataKeepsFile(self):
+        self.compile('[["2008-06-16", "Abacus"]]')
+        with self.assertRaises(ConstructBirthdaysGroup):
+            self.compile('[["2008-06-31", "Cecil"]]')
+        compiled = CompiledDataFile(self.path)
+        self.assertEqual(
+            [bd.name for bd in compiled.construct_birthdays()], ['Abacus'])
+        compiled.close()
+
+    def testFailedWriteRemovesTempFile(self):
+        # A lone surrogate in a time tag fails to encode while writing.
+        with self.assertRaises(UnicodeEncodeError):
+            self.compile(
+                '[["2008-06-16", "Abacus"]]',
+                '[["10:00", "11:00", "\\ud800"]]')
+        self.assertEqual(os.listdir(self.tmp_dir.name), [])
+
+
+class TestCompiledDataFile__init__(CompiledDataTestCase):
+    """Test `CompiledDataFile` object `__init__()` method."""
+
+    def test_CompiledDataFileError_notCompiled(self):
+        with open(self.path, 'w', encoding='utf-8') as fp:
+            fp.write('{"timeTags": null, "birthdays": null}' + 50 * ' ')
+        with self.assertRaises(CompiledDataFileError):
+            CompiledDataFile(self.path)
+
+    def test_CompiledDataFileError_version(self):
+        self.compile('[]').close()
+        with open(self.path, 'r+b') as fp:
+            fp.seek(4)
+            fp.write(b'\xff\x00')
+        with self.assertRaises(CompiledDataFileError):
+            CompiledDataFile(self.path)
+
+    def test_CompiledDataFileError_truncated(self):
+        self.compile('[["2008-06-16", "Abacus"]]').close()
+        with open(self.path, 'r+b') as fp:
+            fp.truncate(100)
+        with self.assertRaises(CompiledDataFileError):
+            CompiledDataFile(self.path)
+
+
+class TestCompiledDataFile_birthday_window(CompiledDataTestCase):
+    """Test `CompiledDataFile` object `birthday_window()` method."""
+
+    def setUp(self):
+        super().setUp()
+        self.compiled = self.compile(
+            '[["2008-06-16", "Abacus"], ["12-30", "Bacillus"], '
+            '["2000-02-29", "Cecil"], ["01-02", "Dora"]]'
+            )
+
+    def testWindow(self):
+        self.assertEqual(
+            [bd.name for bd in self.compiled.birthday_window(
+                date(2023, 6, 10), 7)],
+            ['Abacus']
+            )
+
+    def testWindowOverNewYear(self):
+        self.assertEqual(
+            [bd.name for bd in self.compiled.birthday_window(
+                date(2023, 12, 25), 10)],
+            ['Bacillus', 'Dora']
+            )
+
+    def testLeapDayInCommonYear(self):
+        self.assertEqual(
+            [bd.name for bd in self.compiled.birthday_window(
+                date(2023, 2, 20), 9)],
+            ['Cecil']
+            )
+        self.assertEqual(
+            self.compiled.birthday_window(date(2024, 2, 20), 9), [])
+
+    def testGroups(self):
+        compiled = self.compile(
+            '[["06-10", "Abacus", {"groups": ["a", "b"]}], '
+            '["06-11", "Bacillus", {"groups": ["b"]}], '
+            '["06-12", "Cecil"], ["12-30", "Dora", {"groups": ["c"]}]]'
+            )
+        for first, days in ((date(2023, 6, 1), 30), (date(2023, 12, 1), 200),
+                            (date(2023, 1, 1), 365)):
+            self.assertEqual(
+                sorted(bd.name for bd in compiled.birthday_window(
+                    first, days, frozenset({'a', 'c'}))),
+                [name for name in ('Abacus', 'Dora')
+                 if name in [bd.name for bd in compiled.birthday_window(
+                     first, days)]]
+                )
+        self.assertEqual(
+            [bd.name for bd in compiled.birthday_window(
+                date(2023, 6, 1), 30, frozenset({'b'}))],
+            ['Abacus', 'Bacillus']
+            )
+        self.assertEqual(
+            compiled.birthday_window(date(2023, 6, 1), 30, frozenset()), [])
+
+    def testNotifierMatchesDataLoader(self):
+        text = (
+            '{"timeTags": null, "birthdays": [["2008-06-16", "Abacus"], '
+            '["06-11", "Bacillus", {"notifyDays": 1}], '
+            '["06-12", "Cecil", {"groups": ["b"]}], '
+            '["06-13", "Dora", {"groups": ["a", "b"]}]]}'
+            )
+        compiled = self.compile(text[text.index('['):-1])
+        for groups in (None, {'b'}, {'a', 'c'}):
+            from_json = BirthdayNotifier(
+                DataLoader(io.StringIO(text), '<testing>'), 30, 70,
+                birthday_groups=groups)
+            from_compiled = BirthdayNotifier(
+                compiled, 30, 70, birthday_groups=groups)
+            for day in (
+                    date(2023, 6, 9), date(2023, 6, 10), date(2023, 6, 12)):
+                self.assertEqual(
+                    from_compiled.get_str(day), from_json.get_str(day))
+                self.assertEqual(
+                    from_compiled.upcoming(day), from_json.upcoming(day))
+
+    def testPrimaryPromptPath(self):
+        path = os.path.join(self.tmp_dir.name, 'sample.ttbp')
+        pp = PrimaryPrompt(json_path=path)
+        self.assertTrue(os.path.exists(path))
+        self.assertTrue(pp.birthday_notifier.birthdays)
+        self.assertTrue(pp.time_tags)
+        pp.birthday_notifier._window_source.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
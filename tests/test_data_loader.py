@@ -1,15 +1,23 @@
-from tempfile import TemporaryFile
+from datetime import date
+from tempfile import TemporaryDirectory, TemporaryFile
 from typing import List
+import gzip
+from unittest import mock
+import os.path
 import unittest
 
-from time_tag_birthday_prompt.data_loader import DataLoader
+from time_tag_birthday_prompt import data_loader
+from time_tag_birthday_prompt.data_loader import DataLoader, open_data_file
 
 from .extend_unittest import assertGroupMatchesExceptions
 from time_tag_birthday_prompt.exceptions import (
     ConstructBirthdaysGroup, ConstructTimeTagsGroup, DataLoaderInitGroup,
     IncorrectDateFormatError, DateDoesntExistError, TimeDoesntExistError,
-    IncorrectTimeFormatError
+    IncorrectTimeFormatError, IncorrectWeekdaysError, IncorrectDateRangeError,
+    NotifyDaysLessThanZeroError, IncorrectParameterTypeError,
+    CorruptJSONFileError, IncludedFileError, UnknownEventTypeError
     )
+from time_tag_birthday_prompt.primary_prompt import PrimaryPrompt
 
 
 def assertMethodRaisesGroup(
@@ -134,8 +142,26 @@ class TestDataLoader__init__(unittest.TestCase):
 
     def testJSON_CorruptJSONFileError_birthdayWith4Items(self):
         self.matchCorruptJSONFileErrorMsg(
-            r'{"birthdays": [["", ""], ["", "", ""]], "timeTags": null}',
-            ["Array 'birthdays' index 1 length is not 2."]
+            r'{"birthdays": [["", ""], ["", "", {}, ""]], "timeTags": null}',
+            ["Array 'birthdays' index 1 length is not 2 or 3."]
+            )
+
+    def testJSON_birthdayWithOptions(self):
+        self.matchCorruptJSONFileErrorMsg(
+            r'{"birthdays": [["", "nm", {"notifyDays": 60}]], "timeTags": null}',
+            []
+            )
+
+    def testJSON_CorruptJSONFileError_birthdayGroupsAsStr(self):
+        self.matchCorruptJSONFileErrorMsg(
+            r'{"birthdays": [["", "nm", {"groups": "family"}]], "timeTags": null}',
+            ["Array 'birthdays' index 0 (name 'nm') field[2] options key 'groups' is not an array."]
+            )
+
+    def testJSON_CorruptJSONFileError_birthdayNotifyDaysAsStr(self):
+        self.matchCorruptJSONFileErrorMsg(
+            r'{"birthdays": [["", "nm", {"notifyDays": "60"}]], "timeTags": null}',
+            ["Array 'birthdays' index 0 (name 'nm') field[2] options key 'notifyDays' is not an integer."]
             )
 
     def testJSON_CorruptJSONFileError_birthdayDateAsInt(self):
@@ -160,7 +186,31 @@ class TestDataLoader__init__(unittest.TestCase):
     def testJSON_CorruptJSONFileError_timeTagsWith3Items(self):
         self.matchCorruptJSONFileErrorMsg(
             r'{"timeTags": [["", "", ""], ["", ""]], "birthdays": null}',
-            ["Array 'timeTags' index 1 length is not 3."]
+            ["Array 'timeTags' index 1 length is not 3 or 4."]
+            )
+
+    def testJSON_timeTagsWithOptions(self):
+        self.matchCorruptJSONFileErrorMsg(
+            r'{"timeTags": [["", "", "tx", {"weekdays": "Mon-Fri", "dates": "12-24"}]], "birthdays": null}',
+            []
+            )
+
+    def testJSON_CorruptJSONFileError_timeTagsOptionsAsStr(self):
+        self.matchCorruptJSONFileErrorMsg(
+            r'{"timeTags": [["", "", "tx", "Mon-Fri"]], "birthdays": null}',
+            ["Array 'timeTags' index 0 (text 'tx') field[3] options is not an object."]
+            )
+
+    def testJSON_CorruptJSONFileError_timeTagsOptionsUnknownKey(self):
+        self.matchCorruptJSONFileErrorMsg(
+            r'{"timeTags": [["", "", "tx", {"weekday": "Mon"}]], "birthdays": null}',
+            ["Array 'timeTags' index 0 (text 'tx') field[3] options key 'weekday' is unknown."]
+            )
+
+    def testJSON_CorruptJSONFileError_timeTagsOptionsWeekdaysAsArray(self):
+        self.matchCorruptJSONFileErrorMsg(
+            r'{"timeTags": [["", "", "tx", {"weekdays": ["Mon"]}]], "birthdays": null}',
+            ["Array 'timeTags' index 0 (text 'tx') field[3] options key 'weekdays' is not a string."]
             )
 
     def testJSON_CorruptJSONFileError_timeTagsStartTimeAsArray(self):
@@ -217,6 +267,49 @@ class TestDataLoader_construct_birthdays(unittest.TestCase):
              DateDoesntExistError]
             )
 
+    def test_ConstructBirthdaysGroup_groupNotString(self):
+        self.assertConstructBirthdaysRaisesGroup(
+            '["2023-01-01", "name", {"groups": ["family", 5]}]',
+            [IncorrectParameterTypeError]
+            )
+
+    def test_ConstructBirthdaysGroup_unknownEventType(self):
+        self.assertConstructBirthdaysRaisesGroup(
+            '["2023-01-01", "name", {"type": "holiday"}]',
+            [UnknownEventTypeError]
+            )
+
+    def test_ConstructBirthdaysGroup_notifyDaysLessThanZero(self):
+        self.assertConstructBirthdaysRaisesGroup(
+            '["2023-01-01", "name", {"notifyDays": -1}], '
+            '["2023-01-01", "name2", {"notifyDays": 0}]',
+            [NotifyDaysLessThanZeroError]
+            )
+
+
+    def test_ConstructBirthdaysGroup_errorsInRowOrder(self):
+        self.assertConstructBirthdaysRaisesGroup(
+            '["2023-01-01", "name", {"notifyDays": -1}], '
+            '["191x-01-01", "name2"], '
+            '["2023-01-01", "name3", {"type": "holiday"}]',
+            [NotifyDaysLessThanZeroError, IncorrectDateFormatError,
+             UnknownEventTypeError]
+            )
+
+    def testOptionsOfRows(self):
+        with TemporaryFile(mode='w+', encoding='utf-8') as tf:
+            tf.write(
+                '{"timeTags": null, "birthdays": [["2000-02-29", "a"], '
+                '["12-31", "b", {"notifyDays": 3, "groups": ["x"], '
+                '"type": "nameday"}]]}')
+            tf.seek(0)
+            birthdays = DataLoader(tf, '<testing>').construct_birthdays()
+        self.assertEqual(
+            [(bday.date, bday.name, bday.date_obj, bday.notify_days,
+              bday.groups, bday.event_type) for bday in birthdays],
+            [('2000-02-29', 'a', date(2000, 2, 29), None, None, 'birthday'),
+             ('12-31', 'b', date(1, 12, 31), 3, ['x'], 'nameday')]
+            )
 
 class TestDataLoader_construct_time_tags(unittest.TestCase):
     """Test `DataLoader` object `construct_time_tags()` method."""
@@ -259,6 +352,230 @@ class TestDataLoader_construct_time_tags(unittest.TestCase):
              TimeDoesntExistError]
             )
 
+    def test_ConstructTimeTagsGroup_optionExceptions(self):
+        self.assertConstructTimeTagsRaisesGroup(
+            '["09:00", "15:00", "text", {"weekdays": "Mon-Xyz"}], '
+            '["09:00", "15:00", "text", {"dates": "12-24..2023-12-26"}]',
+            [IncorrectWeekdaysError, IncorrectDateRangeError]
+            )
+
+
+
+class TestDataLoader_from_records(unittest.TestCase):
+    """Test `DataLoader` class `from_records()` method."""
+
+    def testIsLazy(self):
+        consumed = []
+
+        def records():
+            for i in range(3):
+                consumed.append(i)
+                yield (f'2000-01-{i + 1:02}', f'name{i}')
+
+        dl = DataLoader.from_records(records())
+        self.assertEqual(consumed, [])
+        birthdays = dl.construct_birthdays()
+        self.assertEqual(consumed, [0, 1, 2])
+        self.assertEqual(
+            [(bd.name, bd.date_obj.day) for bd in birthdays],
+            [('name0', 1), ('name1', 2), ('name2', 3)]
+            )
+
+    def testOptions(self):
+        dl = DataLoader.from_records(
+            iter([['06-11', 'name', {'notifyDays': 3, 'groups': ['a']}]]),
+            iter([('09:00', '15:00', 'text', {'weekdays': 'Mon-Fri'})])
+            )
+        bday, = dl.construct_birthdays()
+        self.assertEqual((bday.notify_days, bday.groups), (3, ['a']))
+        ttag, = dl.construct_time_tags()
+        self.assertEqual(ttag.weekdays, 'Mon-Fri')
+
+    def testNullRecords(self):
+        dl = DataLoader.from_records(None)
+        self.assertTrue(dl.birthdays_disabled)
+        self.assertIsNone(dl.construct_birthdays())
+        self.assertIsNone(dl.construct_time_tags())
+
+    def test_ConstructBirthdaysGroup_streamed(self):
+        dl = DataLoader.from_records(iter([
+            ('2000-01-01', 'name'), 'not a record', ('2000-02-30', 'name'),
+            ('2000-01-01', 5), ('2000-01-01', 'name', {'notifyDays': -1})
+            ]))
+        with self.assertRaises(ConstructBirthdaysGroup) as cm:
+            dl.construct_birthdays()
+        assertGroupMatchesExceptions(
+            self, cm.exception,
+            [CorruptJSONFileError, DateDoesntExistError,
+             CorruptJSONFileError, NotifyDaysLessThanZeroError]
+            )
+
+    def test_ConstructTimeTagsGroup_streamed(self):
+        dl = DataLoader.from_records(
+            [], iter([('09:00', '15:00'), ('09:00', '25:00', 'text')]))
+        with self.assertRaises(ConstructTimeTagsGroup) as cm:
+            dl.construct_time_tags()
+        assertGroupMatchesExceptions(
+            self, cm.exception, [CorruptJSONFileError, TimeDoesntExistError])
+
+    def testPrimaryPrompt(self):
+        pp = PrimaryPrompt(data_loader=DataLoader.from_records(
+            iter([('2000-01-01', 'name')]),
+            iter([('09:00', '15:00', 'text')])
+            ))
+        self.assertEqual(
+            [bd.name for bd in pp.birthday_notifier.birthdays], ['name'])
+        self.assertEqual([tag.text for tag in pp.time_tags], ['text'])
+
+
+
+class TestDataLoader_open_data_file(unittest.TestCase):
+    """Test `open_data_file()` function."""
+
+    def testCompressedRoundTrip(self):
+        text = '{"timeTags": null, "birthdays": [["2000-01-01", "Pääkkö"]]}'
+        with TemporaryDirectory() as tmp_dir:
+            for name in ('data.json', 'data.json.gz', 'data.json.xz'):
+                path = os.path.join(tmp_dir, name)
+                with open_data_file(path, 'w') as fp:
+                    fp.write(text)
+                with open_data_file(path) as fp:
+                    dl = DataLoader(fp, path)
+                self.assertEqual(
+                    [bd.name for bd in dl.construct_birthdays()], ['Pääkkö'])
+            with gzip.open(os.path.join(tmp_dir, 'data.json.gz'), 'rt',
+                           encoding='utf-8') as fp:
+                self.assertEqual(fp.read(), text)
+
+    def testCorruptCompressedData(self):
+        with TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'data.json.xz')
+            with open(path, 'wb') as fp:
+                fp.write(b'not xz data')
+            with open_data_file(path) as fp:
+                with self.assertRaises(DataLoaderInitGroup) as cm:
+                    DataLoader(fp, path)
+        assertGroupMatchesExceptions(
+            self, cm.exception, [CorruptJSONFileError])
+
+    def testPrimaryPrompt(self):
+        with TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'data.json.gz')
+            with open_data_file(path, 'w') as fp:
+                fp.write(
+                    '{"timeTags": null, "birthdays": [["2000-01-01", "a"]]}')
+            pp = PrimaryPrompt(json_path=path)
+        self.assertEqual(
+            [bd.name for bd in pp.birthday_notifier.birthdays], ['a'])
+
+
+class TestDataLoader_include(unittest.TestCase):
+    """Test field 'include' of `DataLoader` objects."""
+
+    def setUp(self):
+        self.tmp_dir = TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def write(self, name, text):
+        path = os.path.join(self.tmp_dir.name, name)
+        with open_data_file(path, 'w') as fp:
+            fp.write(text)
+        return path
+
+    def load(self, text):
+        path = self.write('data.json', text)
+        with open_data_file(path) as fp:
+            return DataLoader(fp, path)
+
+    def testMergeOrder(self):
+        self.write('a.json', '{"birthdays": [["01-01", "a"]]}')
+        self.write(
+            'b.json.gz', '{"timeTags": [["10:00", "11:00", "b"]]}')
+        dl = self.load(
+            '{"include": ["a.json", "b.json.gz"], "timeTags": '
+            '[["12:00", "13:00", "root"]], "birthdays": [["01-02", "root"]]}'
+            )
+        self.assertEqual(
+            [bd.name for bd in dl.construct_birthdays()], ['a', 'root'])
+        self.assertEqual(
+            [tag.text for tag in dl.construct_time_tags()], ['b', 'root'])
+
+    def test_IncludedFileError(self):
+        self.write('a.json', '{"birthdays": [["2000-02-30", "a"]]}')
+        dl = self.load(
+            '{"include": ["a.json"], "timeTags": null, '
+            '"birthdays": [["191x-01-01", "root"]]}'
+            )
+        with self.assertRaises(ConstructBirthdaysGroup) as cm:
+            dl.construct_birthdays()
+        assertGroupMatchesExceptions(
+            self, cm.exception, [IncludedFileError, IncorrectDateFormatError])
+        self.assertTrue(str(cm.exception.exceptions[0]).startswith('a.json: '))
+
+    def test_IncludedFileError_init(self):
+        self.write('a.json', '{"include": [], "birthdays": "x"}')
+        with self.assertRaises(DataLoaderInitGroup) as cm:
+            self.load(
+                '{"include": ["a.json", "missing.json"], "timeTags": null, '
+                '"birthdays": null}'
+                )
+        assertGroupMatchesExceptions(
+            self, cm.exception,
+            [IncludedFileError, IncludedFileError, IncludedFileError])
+
+    def test_CorruptJSONFileError_includeAsStr(self):
+        with self.assertRaises(DataLoaderInitGroup) as cm:
+            self.load(
+                '{"include": "a.json", "timeTags": null, "birthdays": null}')
+        assertGroupMatchesExceptions(
+            self, cm.exception, [CorruptJSONFileError])
+
+    def testCache(self):
+        text = '{"include": ["a.json"], "timeTags": null, "birthdays": []}'
+        path = self.write('a.json', '{"birthdays": [["01-01", "a"]]}')
+        dl1 = self.load(text)
+        dl2 = self.load(text)
+        self.assertIs(dl1._includes[0][1], dl2._includes[0][1])
+
+        self.write('a.json', '{"birthdays": [["01-01", "changed"]]}')
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        dl3 = self.load(text)
+        self.assertIsNot(dl1._includes[0][1], dl3._includes[0][1])
+        self.assertEqual(
+            [bd.name for bd in dl3.construct_birthdays()], ['changed'])
+
+    def testCacheKeepsOnlyResults(self):
+        path = self.write('a.json', '{"birthdays": [["01-01", "a"]]}')
+        self.load('{"include": ["a.json"], "timeTags": null, "birthdays": []}')
+        self.assertEqual(
+            set(data_loader._include_cache[path][1]),
+            {'birthdays', 'timeTags'})
+
+    def testCacheEviction(self):
+        removed = self.write('removed.json', '{"birthdays": []}')
+        self.load(
+            '{"include": ["removed.json"], "timeTags": null, '
+            '"birthdays": []}')
+        os.remove(removed)
+        with self.assertRaises(DataLoaderInitGroup):
+            self.load(
+                '{"include": ["removed.json"], "timeTags": null, '
+                '"birthdays": []}')
+        self.assertNotIn(removed, data_loader._include_cache)
+
+        with mock.patch.object(data_loader, '_MAX_INCLUDE_CACHE_SIZE', 2):
+            paths = [
+                self.write(f'{name}.json', '{"birthdays": []}')
+                for name in 'abc']
+            self.load(
+                '{"include": ["a.json", "b.json", "c.json"], '
+                '"timeTags": null, "birthdays": []}')
+            self.assertLessEqual(len(data_loader._include_cache), 2)
+            self.load(
+                '{"include": ["a.json"], "timeTags": null, "birthdays": []}')
+            self.assertIn(paths[0], data_loader._include_cache)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,91 @@
+from datetime import datetime, timezone
+import io
+import unittest
+
+from time_tag_birthday_prompt.data_loader import DataLoader
+from time_tag_birthday_prompt.exporters import write_ical
+from time_tag_birthday_prompt.importers import read_ical_records
+
+
+def export(birthday_array_text, **kwargs) -> str:
+    data_loader = DataLoader(io.StringIO(
+        '{"timeTags": null, "birthdays": [' + birthday_array_text + ']}'),
+        '<testing>')
+    file_obj = io.StringIO(newline='')
+    write_ical(
+        data_loader.iter_birthdays(), file_obj,
+        stamp=datetime(2024, 1, 1, tzinfo=timezone.utc), **kwargs)
+    return file_obj.getvalue()
+
+
+class TestExporters_write_ical(unittest.TestCase):
+    """Test `write_ical()` function."""
+
+    def testRoundTrip(self):
+        text = export(
+            '["1980-07-15", "Abacus; Jr.", {"groups": ["a,b", "c"]}], '
+            '["07-16", "Bacillus"], ["2000-02-29", "Cecil"]')
+        self.assertEqual(
+            list(read_ical_records(io.StringIO(text, newline=''))),
+            [('1980-07-15', 'Abacus; Jr.', {'groups': ['a,b', 'c']}),
+             ('07-16', 'Bacillus'), ('2000-02-29', 'Cecil')]
+            )
+
+    def testRoundTripEventTypes(self):
+        text = export(
+            '["1980-07-15", "Abacus", {"type": "anniversary"}], '
+            '["07-16", "Bacillus", {"type": "nameday"}], '
+            '["2024-12-31", "Cecil"]')
+        self.assertEqual(
+            list(read_ical_records(io.StringIO(text, newline=''))),
+            [('1980-07-15', 'Abacus', {'type': 'anniversary'}),
+             ('07-16', 'Bacillus', {'type': 'nameday'}),
+             ('2024-12-31', 'Cecil')]
+            )
+
+    def testDuplicateRecordsHaveUniqueUids(self):
+        records = '["07-16", "Bacillus"], ["07-16", "Bacillus"]'
+        for kwargs, count in ({}, 2), ({'years': 2, 'first_year': 2000}, 4):
+            uids = [
+                line for line in export(records, **kwargs).split('\r\n')
+                if line.startswith('UID:')]
+            self.assertEqual(len(set(uids)), count)
+            # The UIDs stay the same when exported again.
+            self.assertIn(uids[0], export(records, **kwargs))
+
+    def testRecurrence(self):
+        lines = export('["07-16", "Bacillus"], ["2000-02-29", "Cecil"]'
+                       ).split('\r\n')
+        self.assertIn(
+            'DTSTART;VALUE=DATE;X-APPLE-OMIT-YEAR=1604:16040716', lines)
+        self.assertIn('DTSTART;VALUE=DATE:20000229', lines)
+        self.assertIn('RRULE:FREQ=YEARLY;BYMONTH=2;BYMONTHDAY=-1', lines)
+        self.assertEqual(lines.count('BEGIN:VEVENT'), 2)
+        self.assertEqual(lines[-1], '')
+
+    def testExpandedOccurrences(self):
+        lines = export(
+            '["2000-02-29", "Cecil"], ["07-16", "Bacillus"]',
+            years=3, first_year=1999).split('\r\n')
+        self.assertEqual(
+            [line for line in lines if line.startswith(('DTSTART', 'SUM'))],
+            ['DTSTART;VALUE=DATE:20000229', 'SUMMARY:Cecil',
+             'DTSTART;VALUE=DATE:20010228', 'SUMMARY:Cecil (1)',
+             'DTSTART;VALUE=DATE:19990716', 'SUMMARY:Bacillus',
+             'DTSTART;VALUE=DATE:20000716', 'SUMMARY:Bacillus',
+             'DTSTART;VALUE=DATE:20010716', 'SUMMARY:Bacillus']
+            )
+        self.assertNotIn('RRULE', ''.join(lines))
+
+    def testLineFolding(self):
+        name = 40 * 'Pää'
+        text = export(f'["07-16", "{name}"]')
+        for line in text.split('\r\n'):
+            self.assertLessEqual(len(line.encode('utf-8')), 75)
+        self.assertEqual(
+            list(read_ical_records(io.StringIO(text, newline=''))),
+            [('07-16', name)])
+
+
+if __name__ == '__main__':
+    unittest.main()
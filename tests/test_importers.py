@@ -0,0 +1,106 @@
+import io
+import unittest
+
+from time_tag_birthday_prompt.birthday_store import BirthdayStore
+from time_tag_birthday_prompt.data_loader import DataLoader
+from time_tag_birthday_prompt.importers import (
+    read_csv_records, read_vcard_records, read_ical_records)
+
+from .extend_unittest import assertGroupMatchesExceptions
+from time_tag_birthday_prompt.exceptions import (
+    ConstructBirthdaysGroup, ImportColumnMissingError,
+    IncorrectDateFormatError, CorruptJSONFileError
+    )
+
+
+class TestImporters_read_csv_records(unittest.TestCase):
+    """Test `read_csv_records()` function."""
+
+    def testRecords(self):
+        csv_file = io.StringIO(
+            'name,date,groups,notifyDays\n'
+            'Abacus,1980-07-15,family; work,\n'
+            'Bacillus,07-16,,3\n'
+            )
+        self.assertEqual(
+            list(read_csv_records(csv_file)),
+            [('1980-07-15', 'Abacus', {'groups': ['family', 'work']}),
+             ('07-16', 'Bacillus', {'notifyDays': 3})]
+            )
+
+    def testParam_date_column(self):
+        csv_file = io.StringIO('Name,Birthday\nAbacus,1980-07-15\n')
+        self.assertEqual(
+            list(read_csv_records(
+                csv_file, date_column='Birthday', name_column='Name')),
+            [('1980-07-15', 'Abacus')]
+            )
+
+    def test_ImportColumnMissingError(self):
+        with self.assertRaises(ImportColumnMissingError):
+            list(read_csv_records(io.StringIO('name,birthday\n')))
+
+    def testValidationErrors(self):
+        csv_file = io.StringIO(
+            'name,date,notifyDays\nAbacus,15.7.1980,\nBacillus,07-16,x\n')
+        data_loader = DataLoader.from_records(read_csv_records(csv_file))
+        with self.assertRaises(ConstructBirthdaysGroup) as cm:
+            data_loader.construct_birthdays()
+        assertGroupMatchesExceptions(
+            self, cm.exception,
+            [IncorrectDateFormatError, CorruptJSONFileError])
+
+
+class TestImporters_read_vcard_records(unittest.TestCase):
+    """Test `read_vcard_records()` function."""
+
+    def testRecords(self):
+        vcard_file = io.StringIO(
+            'BEGIN:VCARD\r\nVERSION:3.0\r\n'
+            'FN:Jasper P\\, Jr.\r\n'
+            'BDAY;X-APPLE-OMIT-YEAR=1604:1604-07-15\r\n'
+            'CATEGORIES:family,friends\r\nEND:VCARD\r\n'
+            'BEGIN:VCARD\r\nN:Doe;John;;;\r\nBDAY:19800229\r\nEND:VCARD\r\n'
+            'BEGIN:VCARD\r\nFN:No Birthday\r\nEND:VCARD\r\n'
+            'BEGIN:VCARD\r\nFN:Folded\r\n  Name\r\n'
+            'item1.BDAY:--0102\r\nEND:VCARD\r\n'
+            )
+        self.assertEqual(
+            list(read_vcard_records(vcard_file)),
+            [('07-15', 'Jasper P, Jr.', {'groups': ['family', 'friends']}),
+             ('1980-02-29', 'John Doe'),
+             ('01-02', 'Folded Name')]
+            )
+
+    def testImportIntoStore(self):
+        vcard_file = io.StringIO(
+            'BEGIN:VCARD\nFN:Abacus\nBDAY:1980-07-15\nEND:VCARD\n')
+        store = BirthdayStore(':memory:')
+        counts = store.import_data(
+            DataLoader.from_records(read_vcard_records(vcard_file)))
+        self.assertEqual(counts, (1, 0))
+        self.assertEqual(
+            [bd.name for bd in store.construct_birthdays()], ['Abacus'])
+
+
+class TestImporters_read_ical_records(unittest.TestCase):
+    """Test `read_ical_records()` function."""
+
+    def testRecords(self):
+        ical_file = io.StringIO(
+            'BEGIN:VCALENDAR\r\n'
+            'BEGIN:VEVENT\r\nSUMMARY:Abacus\r\n'
+            'DTSTART;VALUE=DATE:19800715\r\nRRULE:FREQ=YEARLY\r\n'
+            'CATEGORIES:work\r\nEND:VEVENT\r\n'
+            'BEGIN:VEVENT\r\nSUMMARY:Meeting\r\n'
+            'DTSTART:20240101T100000\r\nEND:VEVENT\r\n'
+            'END:VCALENDAR\r\n'
+            )
+        self.assertEqual(
+            list(read_ical_records(ical_file)),
+            [('1980-07-15', 'Abacus', {'groups': ['work']})]
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
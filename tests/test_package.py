@@ -0,0 +1,37 @@
+import subprocess
+import sys
+import unittest
+
+import time_tag_birthday_prompt
+from time_tag_birthday_prompt import birthday_store, validation
+
+
+class TestPackage__getattr__(unittest.TestCase):
+    """Test the lazy attributes of the package."""
+
+    def testLazyAttribute(self):
+        self.assertIs(
+            time_tag_birthday_prompt.BirthdayStore,
+            birthday_store.BirthdayStore)
+        self.assertIs(
+            time_tag_birthday_prompt.validate_files,
+            validation.validate_files)
+
+    def testUnknownAttribute(self):
+        with self.assertRaises(AttributeError):
+            time_tag_birthday_prompt.not_an_attribute
+
+    def testDir(self):
+        self.assertIn('compile_data', dir(time_tag_birthday_prompt))
+
+    def testStartupImports(self):
+        # Backends and command line modules are not loaded on import.
+        modules = [
+            'sqlite3', 'mmap', 'multiprocessing', 'pydoc', 'csv',
+            'concurrent.futures']
+        result = subprocess.run(
+            [sys.executable, '-c',
+             'import sys, time_tag_birthday_prompt; '
+             f'print([m for m in {modules!r} if m in sys.modules])'],
+            capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), '[]')
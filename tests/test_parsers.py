@@ -0,0 +1,61 @@
+from datetime import date
+import unittest
+
+from time_tag_birthday_prompt.parsers import parse_dates, parse_times
+from time_tag_birthday_prompt.exceptions import (
+    IncorrectDateFormatError, NullYearError, DateDoesntExistError,
+    IncorrectTimeFormatError, TimeDoesntExistError
+    )
+
+
+class TestParsers_parse_dates(unittest.TestCase):
+    """Test `parse_dates()` function."""
+
+    def testValidDates(self):
+        date_strs = ['2023-06-13', '06-13', '2023-1-2', '2000-02-29']
+        ordinals, errors = parse_dates(date_strs, ['name'] * 4)
+        self.assertEqual(errors, [])
+        self.assertEqual(list(ordinals), [
+            date(2023, 6, 13).toordinal(), date(1, 6, 13).toordinal(),
+            date(2023, 1, 2).toordinal(), date(2000, 2, 29).toordinal()
+            ])
+
+    def testErrorClassification(self):
+        date_strs = [
+            '2023-06-13', 'date_str', '2023-W01-1', f'{date.min.year:04}-01-01',
+            '2023-02-30', '02-29', '2023-01-01-5'
+            ]
+        ordinals, errors = parse_dates(date_strs, ['name'] * 7)
+        self.assertEqual(
+            [(i, type(err)) for i, err in errors],
+            [(1, IncorrectDateFormatError), (2, IncorrectDateFormatError),
+             (3, NullYearError), (4, DateDoesntExistError),
+             (5, DateDoesntExistError), (6, IncorrectDateFormatError)]
+            )
+        self.assertEqual(list(ordinals[1:]), [0] * 6)
+
+
+class TestParsers_parse_times(unittest.TestCase):
+    """Test `parse_times()` function."""
+
+    def testValidTimes(self):
+        seconds, parts, errors = parse_times(
+            'start', ['00:00', '12:30', '23:59:59'], ['text'] * 3)
+        self.assertEqual(errors, [])
+        self.assertEqual(list(seconds), [0, 45000, 86399])
+        self.assertEqual(list(parts), [2, 2, 3])
+
+    def testErrorClassification(self):
+        seconds, parts, errors = parse_times(
+            'stop', ['12', '12:xx', '24:00', '12:00:60', '12:00'],
+            ['text'] * 5)
+        self.assertEqual(
+            [(i, type(err)) for i, err in errors],
+            [(0, IncorrectTimeFormatError), (1, IncorrectTimeFormatError),
+             (2, TimeDoesntExistError), (3, TimeDoesntExistError)]
+            )
+        self.assertEqual(list(seconds), [0, 0, 0, 0, 43200])
+
+
+if __name__ == '__main__':
+    unittest.main()
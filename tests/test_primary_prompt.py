@@ -1,6 +1,7 @@
 from datetime import datetime
-from tempfile import TemporaryFile
+from tempfile import TemporaryDirectory, TemporaryFile
 from typing import Tuple
+import os.path
 import unittest
 
 from time_tag_birthday_prompt.primary_prompt import PrimaryPrompt
@@ -8,7 +9,8 @@ from time_tag_birthday_prompt.primary_prompt import PrimaryPrompt
 from time_tag_birthday_prompt.data_loader import DataLoader
 from time_tag_birthday_prompt.exceptions import (
     BirthdayNotifyDaysLessThanZeroError, IncorrectParameterTypeError,
-    LineWidthLessThanTenError
+    LineWidthLessThanTenError, TimeZoneNotFoundError,
+    BirthdayLimitLessThanOneError
     )
 
 TDAY = 2023, 6, 10
@@ -45,6 +47,34 @@ class TestPrimaryPrompt__init__(unittest.TestCase):
         with self.assertRaises(LineWidthLessThanTenError):
             PrimaryPrompt(line_width=-1)
 
+    def testParam_birthday_max_names_incorrectType(self):
+        with self.assertRaises(IncorrectParameterTypeError):
+            PrimaryPrompt(birthday_max_names='5')
+
+    def testParam_birthday_max_lines_BirthdayLimitLessThanOneError_zero(self):
+        with self.assertRaises(BirthdayLimitLessThanOneError):
+            PrimaryPrompt(birthday_max_lines=0)
+
+    def testParam_birthday_groups_incorrectType(self):
+        with self.assertRaises(IncorrectParameterTypeError):
+            PrimaryPrompt(birthday_groups='family')
+
+    def testParam_birthday_milestones_incorrectType(self):
+        with self.assertRaises(IncorrectParameterTypeError):
+            PrimaryPrompt(birthday_milestones={'50'})
+
+    def testParam_time_zone_incorrectType(self):
+        with self.assertRaises(IncorrectParameterTypeError):
+            PrimaryPrompt(time_zone=2)
+
+    def testParam_time_zone_TimeZoneNotFoundError(self):
+        with self.assertRaises(TimeZoneNotFoundError):
+            PrimaryPrompt(time_zone='Europe/Atlantis')
+
+    def testParam_time_zone_isResolved(self):
+        pp = PrimaryPrompt(time_zone='Europe/Helsinki')
+        self.assertEqual(str(pp.time_zone), 'Europe/Helsinki')
+
 
 class TestPrimaryPrompt_get_str(unittest.TestCase):
     """Test `PrimaryPrompt` object `get_str()` method."""
@@ -78,7 +108,7 @@ class TestPrimaryPrompt_get_str(unittest.TestCase):
             return_second_call=False
             )
         gs = ' '.join(gs.split())
-        self.assertIn("Incorrect start time format 'xx:00' for tag 'text'. Expected HH:MM.", gs)
+        self.assertIn("Incorrect start time format 'xx:00' for tag 'text'. Expected HH:MM or HH:MM:SS.", gs)
 
     def testPrologMessagesBirthdayFormatError(self):
         gs = self.call_get_str(
@@ -96,7 +126,7 @@ class TestPrimaryPrompt_get_str(unittest.TestCase):
             )
         gs = ' '.join(gs.split())
         self.assertTrue(
-            "Incorrect start time format 'xx:00' for tag 'text'. Expected HH:MM." in gs
+            "Incorrect start time format 'xx:00' for tag 'text'. Expected HH:MM or HH:MM:SS." in gs
             and "Incorrect birthday format 'xxxx-01-01' for 'name'. Expected YYYY-MM-DD or MM-DD." in gs
             )
 
@@ -106,7 +136,7 @@ class TestPrimaryPrompt_get_str(unittest.TestCase):
             return_second_call=True
             )
         gs = ' '.join(gs.split())
-        self.assertNotIn("Incorrect start time format 'xx:00' for tag 'text'. Expected HH:MM.", gs)
+        self.assertNotIn("Incorrect start time format 'xx:00' for tag 'text'. Expected HH:MM or HH:MM:SS.", gs)
 
     def testPrologMessagesBirthdayFormatErrorSecondCall(self):
         gs = self.call_get_str(
@@ -124,7 +154,7 @@ class TestPrimaryPrompt_get_str(unittest.TestCase):
             )
         gs = ' '.join(gs.split())
         self.assertTrue(
-            "Incorrect start time format 'xx:00' for tag 'text'. Expected HH:MM." not in gs
+            "Incorrect start time format 'xx:00' for tag 'text'. Expected HH:MM or HH:MM:SS." not in gs
             and "Incorrect birthday format 'xxxx-01-01' for 'name'. Expected YYYY-MM-DD or MM-DD." not in gs
             )
 
@@ -161,6 +191,45 @@ class TestPrimaryPrompt_get_str(unittest.TestCase):
         pass
 
 
+class TestPrimaryPrompt_load_failed(unittest.TestCase):
+    """Test `PrimaryPrompt` object `load_failed` attribute."""
+
+    def get_primary_prompt(self, json: str) -> PrimaryPrompt:
+        with TemporaryFile(mode='w+', encoding='utf-8') as tf:
+            tf.write(json)
+            tf.seek(0)
+            dl = DataLoader(tf, '<testing>')
+        return PrimaryPrompt(data_loader=dl)
+
+    def testValidData(self):
+        pp = self.get_primary_prompt(
+            '{"timeTags": [["12:00", "13:00", "lunch"]], '
+            '"birthdays": [["1950-06-16", "name"]]}')
+        self.assertFalse(pp.load_failed)
+        self.assertEqual(pp.messages, [])
+
+    def testTimeTagFormatError(self):
+        pp = self.get_primary_prompt(
+            '{"timeTags": [["xx:00", "15:00", "text"]], "birthdays": null}')
+        self.assertTrue(pp.load_failed)
+        self.assertEqual(len(pp.messages), 1)
+
+    def testBirthdayFormatError(self):
+        pp = self.get_primary_prompt(
+            '{"timeTags": null, "birthdays": [["xxxx-01-01", "name"]]}')
+        self.assertTrue(pp.load_failed)
+        self.assertEqual(len(pp.messages), 1)
+
+    def testCorruptFile(self):
+        with TemporaryDirectory() as tmp_dir:
+            json_path = os.path.join(tmp_dir, 'data.json')
+            with open(json_path, 'w', encoding='utf-8') as fp:
+                fp.write('{"timeTags": ')
+            pp = PrimaryPrompt(json_path=json_path)
+        self.assertTrue(pp.load_failed)
+        self.assertIn(f'Path: {json_path}', pp.messages)
+
+
 class TestPrimaryPrompt_get_prompt(unittest.TestCase):
     """Test `PrimaryPrompt` object `get_prompt()` method."""
 
@@ -333,5 +402,31 @@ class TestPrimaryPrompt_get_prompt(unittest.TestCase):
             )
 
 
+class TestPrimaryPrompt_get_time_tags_bulk(unittest.TestCase):
+    """Test `PrimaryPrompt` object `get_time_tags_bulk()` method."""
+
+    def get_primary_prompt(self) -> PrimaryPrompt:
+        dl = None
+        with TemporaryFile(mode='w+', encoding='utf-8') as tf:
+            tf.write(
+                '{"timeTags": [["09:00", "15:00", "text"], '
+                '["14:00", "16:00", "str"]], "birthdays": null}')
+            tf.seek(0)
+            dl = DataLoader(tf, '<testing>')
+        return PrimaryPrompt(data_loader=dl)
+
+    def testTexts(self):
+        pp = self.get_primary_prompt()
+        stamps = [datetime(*(TDAY + time)) for time in ((8, 59), (9, 0), (15, 0))]
+        self.assertEqual(
+            pp.get_time_tags_bulk(stamps), [None, 'text', 'str'])
+
+    def testIndices(self):
+        pp = self.get_primary_prompt()
+        stamps = [datetime(*(TDAY + time)) for time in ((8, 59), (9, 0), (15, 0))]
+        self.assertEqual(
+            pp.get_time_tags_bulk(stamps, as_indices=True), [-1, 0, 1])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,10 +1,12 @@
+from datetime import date
 import unittest
 
 from time_tag_birthday_prompt.time_tag import TimeTag
 
 from time_tag_birthday_prompt.exceptions import (
     TimeTagInitGroup, IncorrectParameterTypeError,
-    IncorrectTimeFormatError, TimeDoesntExistError
+    IncorrectTimeFormatError, TimeDoesntExistError, IncorrectWeekdaysError,
+    IncorrectDateRangeError
     )
 
 
@@ -106,6 +108,81 @@ class TestTimeTag__init__(unittest.TestCase):
             TimeTag('09:00', '15:-1', 'text')
         assertExceptionInGroup(self, TimeDoesntExistError, cm.exception)
 
+    def testParam_start_withSeconds(self):
+        tt = TimeTag('09:00:30', '15:00', 'text')
+        self.assertEqual(tt.start_tuple, (9, 0, 30))
+        self.assertEqual(tt.stop_tuple, (15, 0))
+
+    def testParam_start_IncorrectTimeFormatError_fourParts(self):
+        with self.assertRaises(TimeTagInitGroup) as cm:
+            TimeTag('09:00:00:00', '15:00', 'text')
+        assertExceptionInGroup(self, IncorrectTimeFormatError, cm.exception)
+
+    def testParam_start_TimeDoesntExistError_second60(self):
+        with self.assertRaises(TimeTagInitGroup) as cm:
+            TimeTag('09:00:60', '15:00', 'text')
+        assertExceptionInGroup(self, TimeDoesntExistError, cm.exception)
+
+    def testParam_weekdays_range(self):
+        tt = TimeTag('09:00', '15:00', 'text', weekdays='Mon-Wed, sat')
+        self.assertEqual(tt.weekday_set, {0, 1, 2, 5})
+
+    def testParam_weekdays_rangeOverSunday(self):
+        tt = TimeTag('09:00', '15:00', 'text', weekdays='Friday-Monday')
+        self.assertEqual(tt.weekday_set, {4, 5, 6, 0})
+
+    def testParam_weekdays_incorrectType(self):
+        with self.assertRaises(TimeTagInitGroup) as cm:
+            TimeTag('09:00', '15:00', 'text', weekdays=['Mon'])
+        assertExceptionInGroup(self, IncorrectParameterTypeError, cm.exception)
+
+    def testParam_weekdays_IncorrectWeekdaysError_unknownName(self):
+        with self.assertRaises(TimeTagInitGroup) as cm:
+            TimeTag('09:00', '15:00', 'text', weekdays='Mon-Fry')
+        assertExceptionInGroup(self, IncorrectWeekdaysError, cm.exception)
+
+    def testParam_weekdays_IncorrectWeekdaysError_threeEnds(self):
+        with self.assertRaises(TimeTagInitGroup) as cm:
+            TimeTag('09:00', '15:00', 'text', weekdays='Mon-Wed-Fri')
+        assertExceptionInGroup(self, IncorrectWeekdaysError, cm.exception)
+
+    def testParam_dates_IncorrectDateRangeError_mixedYears(self):
+        with self.assertRaises(TimeTagInitGroup) as cm:
+            TimeTag('09:00', '15:00', 'text', dates='2023-12-24..12-26')
+        assertExceptionInGroup(self, IncorrectDateRangeError, cm.exception)
+
+    def testParam_dates_IncorrectDateRangeError_reversed(self):
+        with self.assertRaises(TimeTagInitGroup) as cm:
+            TimeTag('09:00', '15:00', 'text', dates='2023-12-26..2023-12-24')
+        assertExceptionInGroup(self, IncorrectDateRangeError, cm.exception)
+
+    def testParam_dates_IncorrectDateRangeError_dayOver(self):
+        with self.assertRaises(TimeTagInitGroup) as cm:
+            TimeTag('09:00', '15:00', 'text', dates='12-32')
+        assertExceptionInGroup(self, IncorrectDateRangeError, cm.exception)
+
+
+class TestTimeTag_applies_on(unittest.TestCase):
+    """Test `TimeTag` object `applies_on()` method."""
+
+    def testRecurringOverNewYear(self):
+        tt = TimeTag('09:00', '15:00', 'text', dates='12-30..01-02')
+        self.assertTrue(tt.applies_on(date(2023, 12, 31)))
+        self.assertTrue(tt.applies_on(date(2024, 1, 2)))
+        self.assertFalse(tt.applies_on(date(2024, 1, 3)))
+
+    def testFixedRange(self):
+        tt = TimeTag('09:00', '15:00', 'text', dates='2023-12-30..2024-01-02')
+        self.assertTrue(tt.applies_on(date(2024, 1, 1)))
+        self.assertFalse(tt.applies_on(date(2024, 12, 31)))
+
+    def testWeekdaysAndDates(self):
+        tt = TimeTag(
+            '09:00', '15:00', 'text', weekdays='Sat,Sun', dates='06-01..06-30')
+        self.assertTrue(tt.applies_on(date(2023, 6, 10)))
+        self.assertFalse(tt.applies_on(date(2023, 6, 12)))
+        self.assertFalse(tt.applies_on(date(2023, 7, 1)))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,204 @@
+from datetime import datetime
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from time_tag_birthday_prompt.time_tag import TimeTag
+from time_tag_birthday_prompt.time_tag_schedule import TimeTagSchedule
+
+TDAY = 2023, 6, 10
+
+
+def get_schedule(*tag_values) -> TimeTagSchedule:
+    return TimeTagSchedule([TimeTag(*values) for values in tag_values])
+
+
+class TestTimeTagSchedule_active_at(unittest.TestCase):
+    """Test `TimeTagSchedule` object `active_at()` method."""
+
+    def assertActiveText(self, schedule, time, expect):
+        tag = schedule.active_at(datetime(*(TDAY + time)))
+        self.assertEqual(None if tag is None else tag.text, expect)
+
+    def testNoTags(self):
+        self.assertActiveText(get_schedule(), (12, 0), None)
+
+    def testOverlapLaterWins(self):
+        ts = get_schedule(
+            ('14:00', '15:00', 'text'), ('09:00', '15:00', 'str'))
+        self.assertActiveText(ts, (14, 30), 'str')
+        self.assertActiveText(ts, (9, 0), 'str')
+        self.assertActiveText(ts, (15, 0), None)
+
+    def testOverlapInnerTagEnds(self):
+        ts = get_schedule(
+            ('09:00', '15:00', 'text'), ('10:00', '11:00', 'str'))
+        self.assertActiveText(ts, (10, 59), 'str')
+        self.assertActiveText(ts, (11, 0), 'text')
+
+    def testWrapOverMidnight(self):
+        ts = get_schedule(('23:00', '02:00', 'text'))
+        self.assertActiveText(ts, (23, 0), 'text')
+        self.assertActiveText(ts, (1, 59), 'text')
+        self.assertActiveText(ts, (2, 0), None)
+
+    def testZeroLengthCoversMinute(self):
+        ts = get_schedule(('12:00', '12:00', 'text'))
+        self.assertActiveText(ts, (12, 0, 59), 'text')
+        self.assertActiveText(ts, (12, 1), None)
+
+    def testSecondsResolution(self):
+        ts = get_schedule(('09:14:30', '09:15:00', 'standup'))
+        self.assertActiveText(ts, (9, 14, 29), None)
+        self.assertActiveText(ts, (9, 14, 30), 'standup')
+        self.assertActiveText(ts, (9, 14, 59), 'standup')
+        self.assertActiveText(ts, (9, 15, 0), None)
+
+    def testZeroLengthWithSecondsCoversSecond(self):
+        ts = get_schedule(('12:00:00', '12:00:00', 'text'))
+        self.assertActiveText(ts, (12, 0, 0), 'text')
+        self.assertActiveText(ts, (12, 0, 1), None)
+
+    def testDenseTableForWholeMinutes(self):
+        ts = get_schedule(('09:00', '15:00', 'text'))
+        self.assertIsNotNone(ts._week_table)
+
+    def testBoundaryIndexForSeconds(self):
+        ts = get_schedule(('09:00:01', '15:00', 'text'))
+        self.assertIsNone(ts._week_table)
+
+    def testWeekdaysSkipSaturday(self):
+        # TDAY is a Saturday
+        ts = get_schedule(('10:50', '11:50', 'lunch', 'Mon-Fri'))
+        self.assertActiveText(ts, (11, 0), None)
+        tag = ts.active_at(datetime(2023, 6, 12, 11, 0))
+        self.assertEqual(tag.text, 'lunch')
+
+    def testWeekdaysWrapIntoNextDay(self):
+        ts = get_schedule(('23:00', '02:00', 'late', 'Fri'))
+        self.assertActiveText(ts, (1, 0), 'late')
+        self.assertIsNone(ts.active_at(datetime(2023, 6, 11, 1, 0)))
+
+    def testWeekdaysWrapOverSunday(self):
+        ts = get_schedule(('23:00', '02:00', 'late', 'Sun'))
+        tag = ts.active_at(datetime(2023, 6, 12, 1, 0))
+        self.assertEqual(tag.text, 'late')
+
+    def testDatesOverrideWeeklyTag(self):
+        ts = get_schedule(
+            ('09:00', '15:00', 'work'), ('09:00', '15:00', 'holiday', None,
+                                         '06-10..06-11'))
+        self.assertActiveText(ts, (10, 0), 'holiday')
+        tag = ts.active_at(datetime(2023, 6, 12, 10, 0))
+        self.assertEqual(tag.text, 'work')
+
+    def testDatesWrapIntoNextDay(self):
+        ts = get_schedule(('23:00', '02:00', 'party', None, '2023-06-09'))
+        self.assertActiveText(ts, (1, 0), 'party')
+        self.assertActiveText(ts, (2, 0), None)
+        self.assertActiveText(ts, (23, 0), None)
+
+
+class TestTimeTagSchedule_next_transition(unittest.TestCase):
+    """Test `TimeTagSchedule` object `next_transition()` method."""
+
+    def testNoTags(self):
+        self.assertIsNone(
+            get_schedule().next_transition(datetime(*TDAY, 12, 0)))
+
+    def testAllDayTag(self):
+        ts = get_schedule(('00:00', '00:00', 'a'), ('00:01', '00:00', 'a2'))
+        self.assertEqual(
+            ts.next_transition(datetime(*TDAY, 12, 0)),
+            datetime(2023, 6, 11, 0, 0))
+
+    def testWithinDay(self):
+        ts = get_schedule(('09:00', '15:00', 'text'))
+        self.assertEqual(
+            ts.next_transition(datetime(*TDAY, 8, 59, 30)),
+            datetime(*TDAY, 9, 0))
+        self.assertEqual(
+            ts.next_transition(datetime(*TDAY, 9, 0)),
+            datetime(*TDAY, 15, 0))
+
+    def testNextDay(self):
+        ts = get_schedule(('09:00', '15:00', 'text'))
+        self.assertEqual(
+            ts.next_transition(datetime(*TDAY, 15, 0)),
+            datetime(2023, 6, 11, 9, 0))
+
+    def testWrapContinuesPastMidnight(self):
+        ts = get_schedule(('23:00', '02:00', 'text'))
+        self.assertEqual(
+            ts.next_transition(datetime(*TDAY, 23, 30)),
+            datetime(2023, 6, 11, 2, 0))
+
+    def testWithinMinute(self):
+        ts = get_schedule(('09:14:30', '09:15:00', 'standup'))
+        self.assertEqual(
+            ts.next_transition(datetime(*TDAY, 9, 14, 0)),
+            datetime(*TDAY, 9, 14, 30))
+
+    def testNextWeekday(self):
+        ts = get_schedule(('10:50', '11:50', 'lunch', 'Mon-Fri'))
+        self.assertEqual(
+            ts.next_transition(datetime(*TDAY, 12, 0)),
+            datetime(2023, 6, 12, 10, 50))
+
+    def testNextExceptionDate(self):
+        ts = get_schedule(('09:00', '15:00', 'text', None, '12-24'))
+        self.assertEqual(
+            ts.next_transition(datetime(*TDAY, 12, 0)),
+            datetime(2023, 12, 24, 9, 0))
+
+    def testAdjacentTags(self):
+        ts = get_schedule(('09:00', '15:00', 'a'), ('15:00', '16:00', 'b'))
+        self.assertEqual(
+            ts.next_transition(datetime(*TDAY, 14, 0)),
+            datetime(*TDAY, 15, 0))
+
+    def testSameTagOnBothSidesOfGap(self):
+        ts = get_schedule(('09:00', '12:00', 'a'), ('13:00', '15:00', 'a'))
+        self.assertEqual(
+            ts.next_transition(datetime(*TDAY, 11, 0)),
+            datetime(*TDAY, 12, 0))
+        self.assertIsNone(ts.active_at(datetime(*TDAY, 12, 30)))
+        self.assertEqual(
+            ts.next_transition(datetime(*TDAY, 12, 30)),
+            datetime(*TDAY, 13, 0))
+        self.assertEqual(ts.active_at(datetime(*TDAY, 13, 0)).text, 'a')
+
+
+class TestTimeTagSchedule_active_bulk(unittest.TestCase):
+    """Test `TimeTagSchedule` object `active_bulk()` method."""
+
+    TIMESTAMPS = [
+        datetime(2023, 6, 10, 8, 0), datetime(2023, 6, 12, 11, 0),
+        datetime(2023, 6, 10, 11, 0), datetime(2023, 12, 24, 1, 30),
+        datetime(2023, 12, 23, 23, 59, 59)
+        ]
+
+    def get_schedule(self):
+        return get_schedule(
+            ('06:00', '08:30', 'coffee'),
+            ('10:50', '11:50', 'lunch', 'Mon-Fri'),
+            ('23:00', '02:00', 'eve', None, '12-23'))
+
+    def testSequenceMatchesActiveAt(self):
+        ts = self.get_schedule()
+        self.assertEqual(ts.active_bulk(self.TIMESTAMPS), [0, 1, -1, 2, 2])
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def testNumpyMatchesActiveAt(self):
+        ts = self.get_schedule()
+        stamps = numpy.array(
+            self.TIMESTAMPS + [None], dtype='datetime64[s]')
+        self.assertEqual(
+            ts.active_bulk(stamps).tolist(), [0, 1, -1, 2, 2, -1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+from tempfile import TemporaryDirectory
+import os.path
+import unittest
+
+from time_tag_birthday_prompt.validation import validate_file, validate_files
+
+
+class TestValidation_validate_file(unittest.TestCase):
+    """Test `validate_file()` function."""
+
+    def setUp(self):
+        self.tmp_dir = TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def write(self, name, text):
+        path = os.path.join(self.tmp_dir.name, name)
+        with open(path, 'w', encoding='utf-8') as fp:
+            fp.write(text)
+        return path
+
+    def testValid(self):
+        path = self.write(
+            'data.json',
+            '{"timeTags": null, "birthdays": [["2000-01-01", "a"]]}')
+        self.assertEqual(
+            validate_file(path),
+            {'path': path, 'ok': True, 'birthdays': 1, 'timeTags': None,
+             'errors': []}
+            )
+
+    def testConstructErrors(self):
+        path = self.write(
+            'data.json',
+            '{"timeTags": [["25:00", "11:00", "t"]], '
+            '"birthdays": [["2000-02-30", "a"]]}'
+            )
+        result = validate_file(path)
+        self.assertFalse(result['ok'])
+        self.assertEqual(len(result['errors']), 2)
+
+    def testCorruptJSON(self):
+        result = validate_file(self.write('data.json', '{'))
+        self.assertFalse(result['ok'])
+        self.assertEqual(len(result['errors']), 1)
+
+    def testMissingFile(self):
+        result = validate_file(os.path.join(self.tmp_dir.name, 'x.json'))
+        self.assertFalse(result['ok'])
+
+    def testCSV(self):
+        path = self.write('data.csv', 'name,date\na,2000-01-01\nb,x\n')
+        result = validate_file(path)
+        self.assertFalse(result['ok'])
+        self.assertEqual(result['timeTags'], None)
+        self.assertEqual(len(result['errors']), 1)
+
+
+class TestValidation_validate_files(unittest.TestCase):
+    """Test `validate_files()` function."""
+
+    def testOrderOnProcessPool(self):
+        with TemporaryDirectory() as tmp_dir:
+            paths = []
+            for i in range(6):
+                path = os.path.join(tmp_dir, f'{i}.json')
+                with open(path, 'w', encoding='utf-8') as fp:
+                    fp.write(
+                        '{"timeTags": [], "birthdays": '
+                        + ('[]' if i % 2 else 'null') + '}')
+                paths.append(path)
+            results = list(validate_files(paths, max_workers=2))
+        self.assertEqual([result['path'] for result in results], paths)
+        self.assertEqual(
+            [result['birthdays'] for result in results],
+            [None, 0, None, 0, None, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()
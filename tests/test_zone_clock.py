@@ -0,0 +1,50 @@
+from datetime import datetime, timedelta
+import unittest
+import zoneinfo
+
+from time_tag_birthday_prompt.zone_clock import ZoneClock
+
+
+class TestZoneClock_from_utc(unittest.TestCase):
+    """Test `ZoneClock` object `from_utc()` method."""
+
+    def get_zone_clock(self) -> ZoneClock:
+        return ZoneClock(zoneinfo.ZoneInfo('Europe/Helsinki'))
+
+    def testWinterTime(self):
+        zc = self.get_zone_clock()
+        self.assertEqual(
+            zc.from_utc(datetime(2023, 3, 26, 0, 59, 59)),
+            datetime(2023, 3, 26, 2, 59, 59))
+
+    def testSummerTime(self):
+        zc = self.get_zone_clock()
+        self.assertEqual(
+            zc.from_utc(datetime(2023, 3, 26, 1, 0)),
+            datetime(2023, 3, 26, 4, 0))
+
+    def testOffsetCachedUntilTransition(self):
+        zc = self.get_zone_clock()
+        zc.from_utc(datetime(2023, 3, 1, 12, 0))
+        self.assertEqual(zc._valid_until, datetime(2023, 3, 26, 1, 0))
+
+    def testCrossesTransitionWithCache(self):
+        zc = self.get_zone_clock()
+        utc = datetime(2023, 10, 28, 23, 0)
+        local_times = []
+        for _ in range(4):
+            local_times.append(zc.from_utc(utc))
+            utc += timedelta(hours=1)
+        self.assertEqual(local_times, [
+            datetime(2023, 10, 29, 2, 0), datetime(2023, 10, 29, 3, 0),
+            datetime(2023, 10, 29, 3, 0), datetime(2023, 10, 29, 4, 0)
+            ])
+
+    def testNoTransitions(self):
+        zc = ZoneClock(zoneinfo.ZoneInfo('UTC'))
+        self.assertEqual(
+            zc.from_utc(datetime(2023, 6, 1)), datetime(2023, 6, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
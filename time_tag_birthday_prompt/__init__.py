@@ -31,8 +31,43 @@ __version__ = '1.0.1'
 
 from .primary_prompt import PrimaryPrompt
 from .secondary_prompt import SecondaryPrompt
+from .birthday_notifier import UpcomingBirthday, Milestone
+from .data_loader import DataLoader
+from .data_source import DataSource, WindowedDataSource
 
 from .exceptions import (
     IncorrectParameterTypeError, LineWidthLessThanTenError,
-    BirthdayNotifyDaysLessThanZeroError
+    BirthdayNotifyDaysLessThanZeroError, BirthdayLimitLessThanOneError,
+    TimeZoneNotFoundError
     )
+
+# Modules mostly used by the command line interface are imported on first
+# access, so that they do not slow down the interpreter startup.
+_LAZY_ATTRIBUTES = {
+    'BirthdayStore': 'birthday_store',
+    'CompiledDataFile': 'compiled_data',
+    'compile_data': 'compiled_data',
+    'write_ical': 'exporters',
+    'read_csv_records': 'importers',
+    'read_vcard_records': 'importers',
+    'read_ical_records': 'importers',
+    'iter_file_records': 'importers',
+    'validate_file': 'validation',
+    'validate_files': 'validation',
+    }
+
+
+def __getattr__(name: str) -> object:
+    """Import the attributes in `_LAZY_ATTRIBUTES` on first access."""
+    from importlib import import_module
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(
+            f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
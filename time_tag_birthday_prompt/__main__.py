@@ -1,10 +1,157 @@
-from . import __doc__ as init_doc, package_name, __version__, PrimaryPrompt
+from . import (
+    __doc__ as init_doc, package_name, __version__, PrimaryPrompt,
+    BirthdayStore
+    )
+from .compiled_data import compile_data
+from .exporters import write_ical
+from .data_loader import DataLoader, compressed_suffixes, open_data_file
+from .exceptions import (
+    ConstructBirthdaysGroup, ConstructTimeTagsGroup, DataLoaderInitGroup,
+    ImportColumnMissingError
+    )
+from .importers import import_suffixes, iter_file_records
+from .validation import validate_files
+from datetime import date
 import argparse
+import contextlib
+import csv
+import json
+import os.path
+import sqlite3
+import sys
 
 
-def print_birthdays():
+def print_birthdays(pager=False):
     print('Defined birthdays in JSON\n=========================', end='')
-    primary_prompt.print_birthdays()
+    primary_prompt.print_birthdays(pager=pager)
+
+
+def find_birthdays(prefix, pager=False):
+    title = f'Birthdays found for {prefix!r}'
+    print(title + '\n' + len(title) * '=', end='')
+    primary_prompt.print_birthdays(pager=pager, prefix=prefix)
+
+
+def migrate(json_path, store_path=None):
+    def write(data_loader, path):
+        store = BirthdayStore(path)
+        try:
+            return count_summary(*store.import_data(data_loader))
+        finally:
+            store.close()
+    convert(json_path, store_path, '.sqlite', write)
+
+
+def compile_data_file(json_path, compiled_path=None):
+    def write(data_loader, path):
+        return count_summary(*compile_data(data_loader, path))
+    convert(json_path, compiled_path, '.ttbp', write)
+
+
+def export_ical(json_path, ical_path=None, years=None, first_year=None):
+    def write(data_loader, path):
+        # Written next to the target first, as birthday errors are only
+        # raised after the last birthday.
+        tmp_path = path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8', newline='') as fp:
+                count = write_ical(
+                    data_loader.iter_birthdays(), fp, years=years,
+                    first_year=first_year)
+        except BaseException:
+            # The file does not exist if opening it failed.
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmp_path)
+            raise
+        os.replace(tmp_path, path)
+        return f'Wrote {count} birthday events.'
+    convert(json_path, ical_path, '.ics', write)
+
+
+def count_summary(birthday_count, time_tag_count):
+    return (f'Wrote {birthday_count} birthdays and {time_tag_count} time '
+            'tags.')
+
+
+def convert(json_path, output_path, output_suffix, write):
+    json_path = os.path.abspath(os.path.expanduser(json_path))
+    if output_path is None:
+        output_path = json_path
+        for suffix in compressed_suffixes + ('.json',) + import_suffixes:
+            if output_path.lower().endswith(suffix):
+                output_path = output_path[:-len(suffix)]
+        output_path += output_suffix
+    output_path = os.path.abspath(os.path.expanduser(output_path))
+    messages = []
+    try:
+        if json_path.lower().endswith(import_suffixes):
+            data_loader = DataLoader.from_records(iter_file_records(json_path))
+        else:
+            with open_data_file(json_path) as fp:
+                data_loader = DataLoader(fp, json_path)
+        summary = write(data_loader, output_path)
+    except DataLoaderInitGroup as err_group:
+        messages = err_group.get_messages()
+    except (ConstructBirthdaysGroup, ConstructTimeTagsGroup) as err_group:
+        messages = ['Errors in data file.', f'Path: {json_path}']
+        messages.extend(str(err) for err in err_group.exceptions)
+    except (OSError, ValueError, csv.Error, sqlite3.DatabaseError,
+            ImportColumnMissingError) as err:
+        messages = [str(err)]
+    if messages:
+        print('\n'.join(messages), file=sys.stderr)
+        sys.exit(1)
+    print(f'{summary}\nPath: {output_path}')
+
+
+def validate(paths, jobs=None):
+    all_ok = True
+    for result in validate_files(paths, max_workers=jobs):
+        all_ok = all_ok and result['ok']
+        print(json.dumps(result, ensure_ascii=False), flush=True)
+    if not all_ok:
+        sys.exit(1)
+
+
+def print_upcoming(first=None, last=None, output_format='text'):
+    primary_prompt = PrimaryPrompt(tag_end_prompt='')
+    # Written to stderr, so that an empty output means no birthdays and
+    # not a broken data file.
+    if primary_prompt.messages:
+        print('\n'.join(primary_prompt.messages), file=sys.stderr)
+    if primary_prompt.load_failed:
+        sys.exit(1)
+    notifier = primary_prompt.birthday_notifier
+    if first is None:
+        first = primary_prompt.now().date()
+    if last is None:
+        last = first
+    if output_format == 'text':
+        for day, records in notifier.notifications(first, last):
+            print(notifier.get_str(today=day, records=records), flush=True)
+        return
+    writer = csv.writer(sys.stdout, lineterminator='\n')
+    if output_format == 'csv':
+        writer.writerow(
+            ['day', 'name', 'date', 'age', 'days_until', 'description',
+             'type'])
+    for day, records in notifier.notifications(first, last):
+        if output_format == 'json':
+            print(json.dumps({
+                'day': day.isoformat(),
+                'birthdays': [{
+                    'name': rec.name, 'date': rec.date.isoformat(),
+                    'age': rec.age, 'daysUntil': rec.days_until,
+                    'description': rec.weekday_desc, 'type': rec.event_type
+                    } for rec in records]
+                }, ensure_ascii=False), flush=True)
+        else:
+            writer.writerows(
+                [day.isoformat(), rec.name, rec.date.isoformat(),
+                 '' if rec.age is None else rec.age, rec.days_until,
+                 rec.weekday_desc, rec.event_type]
+                for rec in records)
+            sys.stdout.flush()
 
 
 def print_time_tags():
@@ -29,12 +176,141 @@ parser.add_argument(
     '-b', '--birthdays', action='store_true',
     help='Show all birthdays defined in JSON.'
     )
+parser.add_argument(
+    '-f', '--find', metavar='NAME',
+    help='Show birthdays whose name or a word of it starts with NAME.'
+    )
+parser.add_argument(
+    '-p', '--pager', action='store_true',
+    help=('Show the birthdays of option --birthdays or --find in the '
+          'system pager.')
+    )
 parser.add_argument(
     '-d', '--doc', action='store_true',
     help='Show package documentation.'
     )
+subparsers = parser.add_subparsers(dest='command', metavar='COMMAND')
+migrate_parser = subparsers.add_parser(
+    'migrate',
+    help='Import a data file into a SQLite data file.',
+    description=('Import a JSON data file, or the birthdays of a CSV, vCard '
+                 '(.vcf) or iCalendar (.ics) file, into a SQLite data file, '
+                 'which can be given to PrimaryPrompt as json_path. '
+                 'Existing data in the SQLite file is replaced.')
+    )
+migrate_parser.add_argument(
+    'json_path', nargs='?', default='~/time_tag_birthday.json',
+    help=('JSON, CSV, vCard or iCalendar data file. Defaults to '
+          '~/time_tag_birthday.json.')
+    )
+migrate_parser.add_argument(
+    '-o', '--output', metavar='PATH',
+    help='SQLite data file. Defaults to the JSON path with suffix .sqlite.'
+    )
+compile_parser = subparsers.add_parser(
+    'compile',
+    help='Compile a data file into a binary data file.',
+    description=('Compile a JSON data file, or the birthdays of a CSV, vCard '
+                 '(.vcf) or iCalendar (.ics) file, into a memory-mapped '
+                 'binary data file (.ttbp), which can be given to '
+                 'PrimaryPrompt as json_path.')
+    )
+compile_parser.add_argument(
+    'json_path', nargs='?', default='~/time_tag_birthday.json',
+    help=('JSON, CSV, vCard or iCalendar data file. Defaults to '
+          '~/time_tag_birthday.json.')
+    )
+compile_parser.add_argument(
+    '-o', '--output', metavar='PATH',
+    help='Compiled data file. Defaults to the JSON path with suffix .ttbp.'
+    )
+export_parser = subparsers.add_parser(
+    'export',
+    help='Export the birthdays into an iCalendar file.',
+    description=('Export the birthdays of a data file into an iCalendar '
+                 '(.ics) file that calendars can subscribe to. Each '
+                 'birthday is an event recurring yearly, or with --years '
+                 'one event per year.')
+    )
+export_parser.add_argument(
+    'json_path', nargs='?', default='~/time_tag_birthday.json',
+    help=('JSON, CSV, vCard or iCalendar data file. Defaults to '
+          '~/time_tag_birthday.json.')
+    )
+export_parser.add_argument(
+    '-o', '--output', metavar='PATH',
+    help='iCalendar file. Defaults to the JSON path with suffix .ics.'
+    )
+export_parser.add_argument(
+    '--years', type=int, metavar='N',
+    help='Expand the birthdays into one event per year over N years.'
+    )
+export_parser.add_argument(
+    '--first-year', type=int, metavar='YEAR',
+    help='First year of the expanded events. Defaults to the current year.'
+    )
+upcoming_parser = subparsers.add_parser(
+    'upcoming',
+    help='Show the birthday notifications of a range of days.',
+    description=('Show the birthday notifications of each day from --from '
+                 'to --to. Format text writes the notification banner of '
+                 'each day, json one JSON line per day and csv one row per '
+                 'notified birthday.')
+    )
+upcoming_parser.add_argument(
+    '--from', dest='first', type=date.fromisoformat, metavar='DATE',
+    help='First day in format YYYY-MM-DD. Defaults to today.'
+    )
+upcoming_parser.add_argument(
+    '--to', dest='last', type=date.fromisoformat, metavar='DATE',
+    help='Last day in format YYYY-MM-DD. Defaults to the first day.'
+    )
+upcoming_parser.add_argument(
+    '--format', choices=('text', 'json', 'csv'), default='text',
+    help='Output format. Defaults to text.'
+    )
+validate_parser = subparsers.add_parser(
+    'validate',
+    help='Validate data files in parallel.',
+    description=('Validate JSON, CSV, vCard or iCalendar data files on a '
+                 'process pool. One JSON line is written for each file, in '
+                 'the order of the paths, with keys path, ok, birthdays, '
+                 'timeTags and errors. Exits with status 1 if any file has '
+                 'errors.')
+    )
+validate_parser.add_argument(
+    'paths', nargs='+', metavar='PATH',
+    help='Data file to validate.'
+    )
+validate_parser.add_argument(
+    '-j', '--jobs', type=int, metavar='N',
+    help='Number of worker processes. Defaults to the number of CPUs.'
+    )
 args = parser.parse_args()
 
+if args.command == 'migrate':
+    migrate(args.json_path, args.output)
+    sys.exit()
+
+if args.command == 'compile':
+    compile_data_file(args.json_path, args.output)
+    sys.exit()
+
+if args.command == 'export':
+    export_ical(args.json_path, args.output, args.years, args.first_year)
+    sys.exit()
+
+if args.command == 'upcoming':
+    if (args.first is not None and args.last is not None
+            and args.last < args.first):
+        upcoming_parser.error('--to is before --from')
+    print_upcoming(args.first, args.last, args.format)
+    sys.exit()
+
+if args.command == 'validate':
+    validate(args.paths, args.jobs)
+    sys.exit()
+
 
 prepend = '\n'
 primary_prompt = None
@@ -53,7 +329,14 @@ if args.birthdays:
     print(prepend, end='')
     if not primary_prompt:
         primary_prompt = PrimaryPrompt(tag_end_prompt='')
-    print_birthdays()
+    print_birthdays(pager=args.pager)
+    prepend = ''
+
+if args.find is not None:
+    print(prepend, end='')
+    if not primary_prompt:
+        primary_prompt = PrimaryPrompt(tag_end_prompt='')
+    find_birthdays(args.find, pager=args.pager)
     prepend = ''
 
 if args.doc:
@@ -64,6 +347,7 @@ if args.doc:
     print(init_doc.strip())
     prepend = ''
 
-if not (args.version or args.time_tags or args.birthdays or args.doc):
+if not (args.version or args.time_tags or args.birthdays
+        or args.find is not None or args.doc):
     print()
     parser.print_help()
@@ -0,0 +1,167 @@
+"""
+Define `BannerWriter` class.
+
+`BannerWriter` objects are used internally by `BirthdayNotifier` to wrap
+the birthday banner into lines while it is being written.
+
+"""
+
+from typing import Any, List, Tuple
+import textwrap
+
+_TAB_SIZE = 8
+
+
+class BannerWriter:
+    """
+    Class for wrapping text into lines incrementally.
+
+    The lines are the same as those of `textwrap.wrap()` with the
+    default options for the whole text written, but the text is wrapped
+    while it is written. Only the text after the last run of whitespace
+    is kept pending, as a line break can only come between the chunks
+    of words and whitespace that `textwrap` splits text into.
+
+    Attributes
+    ----------
+    width : int
+        Maximum length of the lines.
+    lines : list of str
+        Completed lines. Lines are appended as soon as they are known.
+    line_count : int
+        Number of lines completed by the writer.
+    """
+
+    _wordsep_re = textwrap.TextWrapper.wordsep_re
+    _whitespace_trans = textwrap.TextWrapper.unicode_whitespace_trans
+
+    def __init__(self, width: int, lines: List[str] | None = None) -> None:
+        """
+        Initialize a banner writer.
+
+        Parameters
+        ----------
+        width : int
+            Maximum length of the lines. Must be greater than zero.
+        lines : list of str, optional
+            List to append the completed lines to. By default a new
+            list is created.
+        """
+        if width <= 0:
+            raise ValueError(f'invalid width {width!r} (must be > 0)')
+        self.width = width
+        """Maximum length of the lines."""
+        self.lines: List[str] = [] if lines is None else lines
+        """Completed lines."""
+
+        self.line_count = 0
+        """Number of lines completed by the writer."""
+
+        self._pending = ''
+        self._column = 0
+        self._line_start = True
+        self._cur_line: List[str] = []
+        self._cur_len = 0
+
+    def write(self, text: str) -> None:
+        """
+        Write `text` to the banner.
+
+        Parameters
+        ----------
+        text : str
+            Text to be wrapped.
+        """
+        if '\t' in text:
+            # Tab stops depend on the column since the last line break.
+            indent = self._column % _TAB_SIZE
+            text = (indent * ' ' + text).expandtabs(_TAB_SIZE)[indent:]
+        last_break = max(text.rfind('\n'), text.rfind('\r'))
+        if last_break >= 0:
+            self._column = len(text) - last_break - 1
+        else:
+            self._column += len(text)
+
+        self._pending += text.translate(self._whitespace_trans)
+        space = self._pending.rfind(' ')
+        if space < 0:
+            return
+        cut = len(self._pending[:space].rstrip(' '))
+        if cut > 0:
+            self._wrap(self._pending[:cut])
+            self._pending = self._pending[cut:]
+
+    def close(self) -> List[str]:
+        """Wrap the pending text, complete the last line and return `lines`."""
+        self._wrap(self._pending)
+        self._pending = ''
+        self._end_line()
+        return self.lines
+
+    def getvalue(self) -> str:
+        """Close the writer and return the lines joined by newlines."""
+        return '\n'.join(self.close())
+
+    def snapshot(self) -> Tuple[Any, ...]:
+        """
+        Return the state of the writer for `restore()`.
+
+        Allows trying out how a text would be wrapped.
+        """
+        return (
+            self._pending, self._column, self.line_count, self._line_start,
+            list(self._cur_line), self._cur_len, len(self.lines)
+            )
+
+    def restore(self, state: Tuple[Any, ...]) -> None:
+        """
+        Return the writer to a state given by `snapshot()`.
+
+        Lines completed after the snapshot are removed from `lines`.
+
+        Parameters
+        ----------
+        state : tuple
+            State returned by `snapshot()`.
+        """
+        (self._pending, self._column, self.line_count, self._line_start,
+         cur_line, self._cur_len, lines_len) = state
+        self._cur_line = list(cur_line)
+        del self.lines[lines_len:]
+
+    def _wrap(self, text: str) -> None:
+        for chunk in self._wordsep_re.split(text):
+            if chunk:
+                self._add_chunk(chunk)
+
+    def _add_chunk(self, chunk: str) -> None:
+        # Port of `textwrap.TextWrapper._wrap_chunks()` that is fed one
+        # chunk at a time.
+        while True:
+            if self._line_start:
+                self._line_start = False
+                if chunk.strip() == '' and self.line_count:
+                    return
+            if self._cur_len + len(chunk) <= self.width:
+                self._cur_line.append(chunk)
+                self._cur_len += len(chunk)
+                return
+            if len(chunk) > self.width:
+                space_left = self.width - self._cur_len
+                end = space_left
+                hyphen = chunk.rfind('-', 0, space_left)
+                if hyphen > 0 and any(c != '-' for c in chunk[:hyphen]):
+                    end = hyphen + 1
+                self._cur_line.append(chunk[:end])
+                chunk = chunk[end:]
+            self._end_line()
+
+    def _end_line(self) -> None:
+        if self._cur_line and self._cur_line[-1].strip() == '':
+            del self._cur_line[-1]
+        if self._cur_line:
+            self.lines.append(''.join(self._cur_line))
+            self.line_count += 1
+        self._cur_line = []
+        self._cur_len = 0
+        self._line_start = True
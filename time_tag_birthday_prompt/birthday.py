@@ -2,17 +2,40 @@
 Define `Birthday` class.
 
 `Birthday` objects are initiated, stored and used internally by
-`BirthdayNotifier`.
+`BirthdayNotifier`. Besides birthdays they describe other events
+recurring yearly on the same date, such as anniversaries, name days and
+deadlines, told apart by their event type.
 
 """
 
-from typing import List
+from typing import Any, Dict, List, Sequence
+import collections
 import datetime
 
 from .exceptions import (
-    BirthdayInitGroup, IncorrectParameterTypeError, IncorrectDateFormatError,
-    NullYearError, DateDoesntExistError
+    BirthdayInitGroup, IncorrectParameterTypeError,
+    NotifyDaysLessThanZeroError, UnknownEventTypeError
     )
+from .parsers import parse_date
+
+EventType = collections.namedtuple(
+    'EventType', ['label', 'title', 'age_format'])
+EventType.__doc__ = """\
+Wording of an event type in the birthday notification.
+
+The fields are the label of the type in the list of birthdays, the
+title starting its names in the notification, and the format of the
+years passed, or None if they are not shown.
+"""
+
+# Event types by the value of record option 'type', in the order they are
+# notified of on the same day.
+EVENT_TYPES: Dict[str, EventType] = {
+    'birthday': EventType('birthday', 'Birthday of', '{}'),
+    'anniversary': EventType('anniversary', 'Anniversary of', '{} years'),
+    'nameday': EventType('name day', 'Name day of', None),
+    'deadline': EventType('deadline', 'Deadline', None),
+    }
 
 
 class Birthday:
@@ -25,10 +48,19 @@ class Birthday:
     ----------
     date
     name
+    notify_days : int or None
+        How many days before the birthday a notification is shown, or
+        None for the default of `BirthdayNotifier`.
+    groups : list of str or None
+        Labels of the groups the birthday belongs to.
+    event_type : str
+        Key of the event type in `EVENT_TYPES`, 'birthday' by default.
     date_obj : datetime.date
         Resolved date based on string `date`.
     """
-    def __init__(self, date: str, name: str):
+    def __init__(
+            self, date: str, name: str, notify_days: int | None = None,
+            groups: List[str] | None = None, event_type: str = 'birthday'):
         """
         Initialize a `Birthday` object.
 
@@ -38,16 +70,28 @@ class Birthday:
             Date in format YYYY-MM-DD or MM-DD.
         name : str
             Name of the person or thing having a birthday.
+        notify_days : int, optional
+            How many days before the birthday a notification is shown.
+        groups : list of str, optional
+            Labels of the groups the birthday belongs to, such as
+            'family'.
+        event_type : str, default 'birthday'
+            Type of the event: 'birthday', 'anniversary', 'nameday' or
+            'deadline'.
 
         Raises
         ------
         BirthdayInitGroup
             The `ExceptionGroup` may contain errors
             `IncorrectParameterTypeError`, `IncorrectDateFormatError`,
-            `NullYearError` and/or `DateDoesntExistError`.
+            `NullYearError`, `DateDoesntExistError`,
+            `NotifyDaysLessThanZeroError` and/or `UnknownEventTypeError`.
         """
         self.date = date
         self.name = name
+        self.notify_days = notify_days
+        self.groups = groups
+        self.event_type = event_type
         self.date_obj: datetime.date
 
         err_list = []
@@ -61,35 +105,119 @@ class Birthday:
             err_list.append(IncorrectParameterTypeError(
                 'name', type(name).__name__, 'birthday', expected_type='string'))
         
+        if notify_days is not None:
+            if not isinstance(notify_days, int) or isinstance(notify_days, bool):
+                err_list.append(IncorrectParameterTypeError(
+                    'notify_days', type(notify_days).__name__, 'birthday', name,
+                    'integer'))
+            elif notify_days < 0:
+                err_list.append(NotifyDaysLessThanZeroError(notify_days, name))
+        
+        if groups is not None:
+            if not isinstance(groups, list):
+                err_list.append(IncorrectParameterTypeError(
+                    'groups', type(groups).__name__, 'birthday', name,
+                    'array of strings'))
+            else:
+                for group in groups:
+                    if not isinstance(group, str):
+                        err_list.append(IncorrectParameterTypeError(
+                            'groups', type(group).__name__, 'birthday', name,
+                            'array of strings'))
+                        break
+        
+        if not isinstance(event_type, str):
+            err_list.append(IncorrectParameterTypeError(
+                'event_type', type(event_type).__name__, 'birthday', name,
+                'string'))
+        elif event_type not in EVENT_TYPES:
+            err_list.append(UnknownEventTypeError(event_type, name))
+        
         if len(err_list) > 0:
             raise BirthdayInitGroup('BirthdayInitGroup', tuple(err_list))
     
+    @classmethod
+    def from_parsed(
+            cls, date: str, name: str, date_obj: datetime.date,
+            notify_days: int | None = None, groups: List[str] | None = None,
+            event_type: str = 'birthday'
+            ) -> 'Birthday':
+        """
+        Create a `Birthday` object from an already parsed date without
+        validating it again. Invoked by DataLoader.
+
+        Parameters
+        ----------
+        date : str
+            Date in format YYYY-MM-DD or MM-DD.
+        name : str
+            Name of the person or thing having a birthday.
+        date_obj : datetime.date
+            Date resolved from `date`.
+        notify_days : int, optional
+            How many days before the birthday a notification is shown.
+        groups : list of str, optional
+            Labels of the groups the birthday belongs to.
+        event_type : str, default 'birthday'
+            Key of the event type in `EVENT_TYPES`.
+        """
+        bday = cls.__new__(cls)
+        bday.date = date
+        bday.name = name
+        bday.notify_days = notify_days
+        bday.groups = groups
+        bday.event_type = event_type
+        bday.date_obj = date_obj
+        return bday
+    
+    @classmethod
+    def from_parsed_columns(
+            cls, dates: Sequence[str], names: Sequence[str],
+            ordinals: Sequence[int],
+            options: Sequence[Dict[str, Any] | None]
+            ) -> List['Birthday']:
+        """
+        Create `Birthday` objects from columns of already parsed records
+        without validating them again. Invoked by DataLoader.
+
+        Same as `from_parsed()` for each row, but without a call and
+        keyword arguments per object, which dominate the time taken by
+        large data files.
+
+        Parameters
+        ----------
+        dates : sequence of str
+            Dates in format YYYY-MM-DD or MM-DD.
+        names : sequence of str
+            Names of the persons or things having a birthday.
+        ordinals : sequence of int
+            Proleptic Gregorian ordinals of the dates, e.g. from
+            `parse_dates()`.
+        options : sequence of dict or None
+            Keyword arguments `notify_days`, `groups` and `event_type`
+            of each row, or None for the defaults.
+        """
+        new = cls.__new__
+        fromordinal = datetime.date.fromordinal
+        birthdays: List[Birthday] = []
+        append = birthdays.append
+        for date, name, ordinal, rec_options in zip(
+                dates, names, ordinals, options):
+            bday = new(cls)
+            bday.date = date
+            bday.name = name
+            if rec_options is None:
+                bday.notify_days = None
+                bday.groups = None
+                bday.event_type = 'birthday'
+            else:
+                bday.notify_days = rec_options.get('notify_days')
+                bday.groups = rec_options.get('groups')
+                bday.event_type = rec_options.get('event_type', 'birthday')
+            bday.date_obj = fromordinal(ordinal)
+            append(bday)
+        return birthdays
+    
     def _resolve_date_obj(
             self, err_list: List[Exception]) -> datetime.date | None:
-        date_parts = self.date.split('-', 2)
-        try:
-            date_parts = [int(pt) for pt in date_parts]
-        except ValueError:
-            err_list.append(IncorrectDateFormatError(self.date, self.name))
-            return None
-        
-        if len(date_parts) == 3:
-            if date_parts[0] == datetime.date.min.year:
-                err_list.append(
-                    NullYearError(
-                        self.date, self.name, datetime.date.min.year))
-                return None
-        elif len(date_parts) == 2:
-            date_parts.insert(0, datetime.date.min.year)
-        else:
-            err_list.append(IncorrectDateFormatError(self.date, self.name))
-            return None
-        
-        date_obj = None
-        try:
-            date_obj = datetime.date(*date_parts)
-        except ValueError:
-            err_list.append(DateDoesntExistError(self.date, self.name))
-            return None
-        else:
-            return date_obj
+        return parse_date(self.date, self.name, err_list)
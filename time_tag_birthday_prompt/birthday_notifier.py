@@ -3,19 +3,96 @@ Define `BirthdayNotifier` class for birthday notification generation.
 
 """
 
-from datetime import datetime, date
-from typing import List, Callable
+from bisect import bisect_left
+from datetime import datetime, date, timedelta
+from typing import (
+    Callable, Collection, Deque, Dict, FrozenSet, Iterable, Iterator, List,
+    Tuple)
+import calendar
 import collections
+import functools
+import heapq
+import io
+import re
 import textwrap
+import unicodedata
 
-from .birthday import Birthday
-from .data_loader import DataLoader
+from .banner_writer import BannerWriter
+from .birthday import EVENT_TYPES, Birthday
+from .data_source import DataSource, WindowedDataSource
 from .exceptions import ConstructBirthdaysGroup, IncorrectParameterTypeError
 
+_LEAP_YEAR = 2000
+_LEAP_YEAR_START = date(_LEAP_YEAR, 1, 1).toordinal()
+_MAX_WINDOW_DAYS = 365
+_WORD_RE = re.compile(r'\w+')
+_ROUND_AGES = tuple(range(10, 101, 10))
+_EVENT_ORDER = {event_type: i for i, event_type in enumerate(EVENT_TYPES)}
+
+UpcomingBirthday = collections.namedtuple('UpcomingBirthday', [
+    'name', 'date', 'age', 'days_until', 'weekday_desc', 'event_type'],
+    defaults=['birthday'])
+UpcomingBirthday.__doc__ = """\
+Upcoming birthday returned by `BirthdayNotifier.upcoming()`.
+
+The fields are the name, the date of the birthday, the age turned or
+None if the birth year is not known or the event type has no age, the
+number of days until the birthday, its description such as 'tomorrow',
+'on Friday next week' or 'in 12 days', and the event type.
+"""
+
+Milestone = collections.namedtuple(
+    'Milestone', ['name', 'date', 'age', 'event_type'],
+    defaults=['birthday'])
+Milestone.__doc__ = """\
+Milestone birthday returned by `BirthdayNotifier.milestones()`.
+
+The fields are the name, the date of the birthday in the year asked,
+the age turned and the event type, 'birthday' or 'anniversary'.
+"""
+
 
 class BirthdayNotifier:
     """
     Class for printing birthday reminders on interactive mode startup.
+
+    Birthdays are kept in a ring of 366 day-of-year buckets. The
+    notification window from today to the notify horizon is a deque of
+    buckets that advances by one bucket when the date rolls over to the
+    next day, so rollover only touches the birthdays of the day leaving
+    and the day entering the window. Birthdays on 29 February are shown
+    on 28 February in common years.
+
+    Birthdays with their own notify horizon are grouped by horizon, each
+    group having its own buckets. The window covers the longest horizon
+    and a day of the window only reads the groups whose horizon reaches
+    it.
+
+    Group labels are numbered with bits and each birthday has a bitmask
+    of its groups, so selecting the birthdays of the notified groups is
+    one bitwise and per birthday. A `WindowedDataSource` is given the
+    notified groups with the window query and filters them itself, e.g.
+    the compiled data file by the bitmasks of its groups strings.
+
+    Names are searched from a sorted index of folded names and of their
+    word suffixes, built on the first search, so finding a name prefix
+    is a bisection.
+
+    Birthdays with a birth year are indexed by the year on the first
+    milestone query, so a query only reads the birth years of the ages
+    asked.
+
+    Anniversaries, name days and deadlines are birthdays of another
+    event type. They share the buckets and the window with birthdays
+    and are ordered by event type and name within a day, so a single
+    pass over the window merges all event types into one notification,
+    each type having its own wording.
+
+    With a `WindowedDataSource` such as `BirthdayStore` as the data
+    source no birthdays are loaded up front. The window is filled from a
+    window query of the source, e.g. a range query on the month and day
+    index of the store, and the whole list is only read when it is asked
+    for, e.g. by `print_birthdays()`.
     
     Attributes
     ----------
@@ -25,8 +102,20 @@ class BirthdayNotifier:
     line_width: int
         How many characters fit on one line. Copy of PrimaryPrompt
         value.
+    max_names: int or None
+        Maximum number of names in the birthday notification. The rest
+        are summarized as "and N more". Copy of PrimaryPrompt value.
+    max_lines: int or None
+        Maximum number of lines in the birthday notification. Copy of
+        PrimaryPrompt value.
+    birthday_groups: frozenset of str or None
+        Groups whose birthdays are notified of, or None for all
+        birthdays. Copy of PrimaryPrompt value.
+    milestone_ages: frozenset of int or None
+        Ages highlighted in the birthday notification. Copy of
+        PrimaryPrompt value.
     birthdays : list of Birthday or None
-        Serialized `Birthday` objects from JSON.
+        Serialized `Birthday` objects from the data source.
     messages : list of str
         Validation messages which arose from JSON data. Extracted from
         `ConstructBirthdaysGroup`.
@@ -34,48 +123,109 @@ class BirthdayNotifier:
 
     _BDTuple = collections.namedtuple('_BDTuple', ['date', 'name'])
     _Proximity = collections.namedtuple('_Proximity', [
-        'days_until', 'name', 'bd_age', 'weekday_desc'])
+        'days_until', 'name', 'bd_age', 'desc', 'event_type'])
     _WEEKDAYS = [
         'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday',
         'Sunday'
         ]
 
     def __init__(
-            self, data_loader: DataLoader | None, birthday_notify_days: int,
-            line_width: int
+            self, data_loader: DataSource | None,
+            birthday_notify_days: int,
+            line_width: int, max_names: int | None = None,
+            max_lines: int | None = None,
+            birthday_groups: Iterable[str] | None = None,
+            milestone_ages: Iterable[int] | None = None
             ) -> None:
         """
         Initialize a birthday notifier object. Invoked by PrimaryPrompt.
         
         Parameters
         ----------
-        data_loader : DataLoader or None
-            An instance of DataLoader object.
+        data_loader : DataSource or None
+            An instance of DataLoader object, a SQLite birthday store or
+            another data source.
         birthday_notify_days : int
             How many days before the birthday a notification is shown.
         line_width : int
             How many characters fit on one line.
+        max_names : int, optional
+            Maximum number of names in the birthday notification.
+        max_lines : int, optional
+            Maximum number of lines in the birthday notification.
+        birthday_groups : iterable of str, optional
+            Only notify of birthdays in these groups. By default all
+            birthdays are notified of.
+        milestone_ages : iterable of int, optional
+            Ages highlighted in the birthday notification as '(60!)'.
         """
         self.birthday_notify_days = birthday_notify_days
         """How many days before the birthday a notification is shown."""
         self.line_width = line_width
         """How many characters fit on one line."""
-        self.birthdays: List[Birthday] | None = None
-        """Serialized `Birthday` objects from JSON."""
+        self.max_names = max_names
+        """Maximum number of names in the birthday notification."""
+        self.max_lines = max_lines
+        """Maximum number of lines in the birthday notification."""
+        self.birthday_groups: FrozenSet[str] | None = None
+        """Groups whose birthdays are notified of or None for all."""
+        if birthday_groups is not None:
+            self.birthday_groups = frozenset(birthday_groups)
+        self.milestone_ages: FrozenSet[int] | None = None
+        """Ages highlighted in the birthday notification."""
+        if milestone_ages is not None:
+            self.milestone_ages = frozenset(milestone_ages)
         self.messages: List[str] = []
         """Validation messages which arose from JSON data. Extracted from
         `ConstructBirthdaysGroup`.
         """
 
+        self._birthdays: List[Birthday] | None = None
         self._birthdays_disabled = False
+        self._has_birthdays = False
+        self._window_source: WindowedDataSource | None = None
+        self._max_horizon = birthday_notify_days
+        self._buckets: List[List[Birthday]] = [[] for _ in range(366)]
+        self._horizon_groups: List[Tuple[int, List[List[Birthday]]]] = []
+        self._group_bits: Dict[str, int] = {}
+        self._group_masks: List[int] = []
+        self._window: Deque[List[Tuple[int, List[Birthday]]]] = (
+            collections.deque())
+        self._window_start: date | None = None
+        self._descriptors: List[str] = []
+        self._name_keys: List[str] | None = None
+        self._name_rows: List[int] = []
+        self._year_index: Dict[int, List[Birthday]] | None = None
 
-        if data_loader:
+        if isinstance(data_loader, WindowedDataSource):
+            self._window_source = data_loader
+            self._birthdays_disabled = data_loader.birthdays_disabled
+            self._has_birthdays = (
+                not self._birthdays_disabled and data_loader.has_birthdays())
+            self._max_horizon = data_loader.max_notify_days(
+                birthday_notify_days)
+        elif data_loader:
             self._birthdays_disabled = data_loader.birthdays_disabled
             try:
-                self.birthdays = data_loader.construct_birthdays()
+                self._birthdays = data_loader.construct_birthdays()
             except ConstructBirthdaysGroup as err_group:
                 self.messages.extend([
                     str(err) for err in err_group.exceptions])
+        if self._birthdays:
+            self._has_birthdays = True
+            self._index_groups()
+            self._fill_buckets()
+            if self._horizon_groups:
+                self._max_horizon = self._horizon_groups[0][0]
+
+    @property
+    def birthdays(self) -> List[Birthday] | None:
+        """Serialized `Birthday` objects from the data source."""
+        if (self._birthdays is None and self._window_source is not None
+                and not self._birthdays_disabled):
+            self._birthdays = (
+                self._window_source.construct_birthdays())
+        return self._birthdays
     
     def time_machine(
             self, date_string: str, print_func: Callable = print) -> None:
@@ -104,7 +254,182 @@ class BirthdayNotifier:
         d = date(dt.year, dt.month, dt.day)
         print_func(self.get_str(today=d))
         
-    def print_birthdays(self, print_func: Callable = print) -> None:
+    def upcoming(
+            self, today: date | None = None, limit: int | None = None,
+            horizon: int | None = None
+            ) -> List[UpcomingBirthday]:
+        """
+        Return the upcoming birthdays in the order they occur.
+
+        Birthdays on the same day are ordered by name. The birthdays are
+        read from the day-of-year buckets, so no sorting is needed.
+
+        Parameters
+        ----------
+        today : date, optional
+            Date to start from. Defaults to the current date.
+        limit : int, optional
+            Maximum number of birthdays to return.
+        horizon : int, optional
+            How many days ahead birthdays are returned. Defaults to
+            `birthday_notify_days`.
+        """
+        if not (isinstance(today, date) or today is None):
+            raise IncorrectParameterTypeError(
+                'today', type(today).__name__, 'BirthdayNotifier',
+                expected_type='date or None'
+                )
+        for param_name, value in (('limit', limit), ('horizon', horizon)):
+            if not (isinstance(value, int) or value is None):
+                raise IncorrectParameterTypeError(
+                    param_name, type(value).__name__, 'BirthdayNotifier',
+                    expected_type='integer or None'
+                    )
+        if today is None:
+            today = date.today()
+        if horizon is None:
+            horizon = self.birthday_notify_days
+
+        records: List[UpcomingBirthday] = []
+        if not self._has_birthdays:
+            return records
+        for days_until, bucket in self._iter_buckets(today, horizon):
+            if not bucket:
+                continue
+            day = today + timedelta(days_until)
+            desc = self._describe(today, days_until).lstrip()
+            for bday in bucket:
+                if len(records) == limit:
+                    return records
+                records.append(UpcomingBirthday(
+                    bday.name, day, _age(bday, day.year), days_until, desc,
+                    bday.event_type))
+        return records
+
+    def notifications(
+            self, first: date, last: date
+            ) -> Iterator[Tuple[date, List[UpcomingBirthday]]]:
+        """
+        Yield the birthdays notified of on each day from `first` to
+        `last`.
+
+        For each day a tuple of the day and its notified birthdays is
+        yielded, the birthdays being the ones `get_str()` shows on that
+        day in the same order. The notification window advances by one
+        day per day, so a long range costs about one window fill and a
+        bucket per day.
+
+        Parameters
+        ----------
+        first : date
+            First day of the range.
+        last : date
+            Last day of the range, inclusive.
+        """
+        for param_name, value in (('first', first), ('last', last)):
+            if not isinstance(value, date):
+                raise IncorrectParameterTypeError(
+                    param_name, type(value).__name__, 'BirthdayNotifier',
+                    expected_type='date'
+                    )
+        for days in range((last - first).days + 1):
+            today = first + timedelta(days)
+            records: List[UpcomingBirthday] = []
+            if self._has_birthdays and not self._birthdays_disabled:
+                for prox in self._iter_proximities(today):
+                    records.append(UpcomingBirthday(
+                        prox.name, today + timedelta(prox.days_until),
+                        prox.bd_age, prox.days_until, prox.desc.lstrip(),
+                        prox.event_type))
+            yield today, records
+
+    def find(self, prefix: str) -> List[Birthday]:
+        """
+        Return the birthdays whose name or a word of it starts with
+        `prefix`.
+
+        The match ignores case and accents, e.g. 'paak' finds
+        'Jasper Pääkkönen'. The birthdays are ordered by event type and
+        name.
+
+        Parameters
+        ----------
+        prefix : str
+            Beginning of the name or of a word in the name.
+        """
+        if not isinstance(prefix, str):
+            raise IncorrectParameterTypeError(
+                'prefix', type(prefix).__name__, 'BirthdayNotifier',
+                expected_type='string'
+                )
+        if not self.birthdays:
+            return []
+        if self._name_keys is None:
+            self._index_names()
+        key = _fold_name(prefix)
+        rows = set()
+        for i in range(bisect_left(self._name_keys, key),
+                       len(self._name_keys)):
+            if not self._name_keys[i].startswith(key):
+                break
+            rows.add(self._name_rows[i])
+        return sorted((self.birthdays[row] for row in rows), key=_sort_key)
+
+    def milestones(
+            self, year: int, ages: Iterable[int] = _ROUND_AGES
+            ) -> List[Milestone]:
+        """
+        Return the birthdays in `year` on which one of `ages` is turned.
+
+        The milestones are ordered by date and name. Birthdays without a
+        birth year are not included, and of the other event types only
+        anniversaries are.
+
+        Parameters
+        ----------
+        year : int
+            Year of the birthdays.
+        ages : iterable of int, default (10, 20, ..., 100)
+            Ages of the milestones.
+        """
+        if not isinstance(year, int):
+            raise IncorrectParameterTypeError(
+                'year', type(year).__name__, 'BirthdayNotifier',
+                expected_type='integer'
+                )
+        ages = set(ages)
+        for age in ages:
+            if not isinstance(age, int):
+                raise IncorrectParameterTypeError(
+                    'ages', type(age).__name__, 'BirthdayNotifier',
+                    expected_type='iterable of integers'
+                    )
+        if not self.birthdays:
+            return []
+        if self._year_index is None:
+            self._year_index = {}
+            for bday in self.birthdays:
+                if (bday.date_obj.year != date.min.year
+                        and EVENT_TYPES[bday.event_type].age_format):
+                    self._year_index.setdefault(
+                        bday.date_obj.year, []).append(bday)
+
+        records = []
+        for age in ages:
+            for bday in self._year_index.get(year - age, ()):
+                day = bday.date_obj
+                if (day.month == 2 and day.day == 29
+                        and not calendar.isleap(year)):
+                    day = day.replace(day=28)
+                records.append(Milestone(
+                    bday.name, day.replace(year), age, bday.event_type))
+        records.sort(key=lambda record: (record.date, record.name))
+        return records
+    
+    def print_birthdays(
+            self, print_func: Callable = print, pager: bool = False,
+            prefix: str | None = None
+            ) -> None:
         """
         Print the list of birthdays.
         
@@ -112,9 +437,28 @@ class BirthdayNotifier:
         ----------
         print_func : callable
             Override print function for testing purposes.
+        pager : bool, default False
+            Show the list in the system pager, e.g. `less`, instead of
+            printing it. Ignores `print_func`.
+        prefix : str, optional
+            Only print the birthdays found by `find()` with `prefix`.
         """
+        if pager:
+            # Imported here, as pydoc slows down the interpreter startup.
+            import pydoc
+            buffer = io.StringIO()
+            self.print_birthdays(
+                functools.partial(print, file=buffer), prefix=prefix)
+            pydoc.pager(buffer.getvalue())
+            return
         print_func()
-        if not self.birthdays:
+        if prefix is not None:
+            found = self.find(prefix)
+            for bday in found:
+                print_func(self._format_birthday(bday))
+            if not found:
+                print_func(f'No birthdays found for {prefix!r}.')
+        elif not self.birthdays:
             if self.messages:
                 print_func('\n' + self._format_messages() + '\n')
             else:
@@ -122,22 +466,47 @@ class BirthdayNotifier:
 
         else:
             for bday in self.birthdays:
-                date_str = None
-                if bday.date_obj.year == date.min.year:
-                    date_str = (5 * ' ') + bday.date_obj.strftime('%m-%d')
-                else:
-                    date_str = bday.date_obj.strftime('%Y-%m-%d')
-                print_func(f'{date_str}  {bday.name}')
+                print_func(self._format_birthday(bday))
         
             if len(self.birthdays) == 0:
                 print_func('No birthdays defined.')
         print_func()
     
+    @staticmethod
+    def _format_birthday(bday: Birthday) -> str:
+        if bday.date_obj.year == date.min.year:
+            date_str = (5 * ' ') + bday.date_obj.strftime('%m-%d')
+        else:
+            date_str = bday.date_obj.strftime('%Y-%m-%d')
+        details = list(bday.groups or [])
+        if bday.event_type != 'birthday':
+            details.insert(0, EVENT_TYPES[bday.event_type].label)
+        if bday.notify_days is not None:
+            details.insert(0, f'notify {bday.notify_days} days')
+        details = f'  ({", ".join(details)})' if details else ''
+        return f'{date_str}  {bday.name}{details}'
+
+    def _index_names(self) -> None:
+        # Every word start of the folded name is a key, and so is the
+        # whole name if it does not start with a word.
+        entries = []
+        for row, bday in enumerate(self.birthdays):
+            folded = _fold_name(bday.name)
+            entries.extend(
+                (folded[match.start():], row)
+                for match in _WORD_RE.finditer(folded))
+            if not folded[:1].isalnum():
+                entries.append((folded, row))
+        entries.sort()
+        self._name_keys = [key for key, _ in entries]
+        self._name_rows = [row for _, row in entries]
+
     def __str__(self) -> str:
         return self.get_str()
     
     def get_str(
-            self, today: date | None = None
+            self, today: date | None = None,
+            records: List[UpcomingBirthday] | None = None
             ) -> str:
         """
         Generate birthday notifications.
@@ -146,20 +515,28 @@ class BirthdayNotifier:
         ----------
         today : date, optional
             Override current date for testing purposes.
+        records : list of UpcomingBirthday, optional
+            The birthdays `notifications()` yielded for `today`, written
+            instead of finding the birthdays of `today` again.
         """
-        ret_str = ''
         if self._birthdays_disabled:
-            return ret_str
+            return ''
         if today is None:
             today = date.today()
-        ret_str += (
-            '\n' + self.line_width * '-' + '\n'
-            + self._format_date(today) + '\n'
-            )
-        if self.birthdays:
-            ret_str += self._format_birthdays(today) + '\n'
-        ret_str += self.line_width * '-'
-        return ret_str
+        lines = ['', self.line_width * '-']
+        date_writer = BannerWriter(self.line_width, lines)
+        date_writer.write(f'Today is {today:%A, %Y-%m-%d}\n')
+        date_writer.close()
+        if self._has_birthdays:
+            line_count = len(lines)
+            if records is None:
+                self._write_birthdays(today, lines)
+            else:
+                self._write_records(records, lines)
+            if len(lines) == line_count:
+                lines.append('')
+        lines.append(self.line_width * '-')
+        return '\n'.join(lines)
     
     def _format_messages(self) -> str:
         msg_list = []
@@ -171,78 +548,302 @@ class BirthdayNotifier:
             msg_list.append(first_line + msg)
         return '\n'.join(msg_list)
     
-    def _format_date(self, today: date) -> str:
-        d_str = datetime(today.year, today.month, today.day).strftime(
-            '%A, %Y-%m-%d')
-        return textwrap.fill(f'Today is {d_str}\n', self.line_width)
-    
-    def _format_birthdays(self, today: date) -> str:
-        prox_list = self._get_proximity_list(today)
-        prox_list.sort()
-        bday_string = self._format_proximity_list(prox_list)
-        if bday_string is not None:
-            return textwrap.fill(bday_string, self.line_width)
-        else:
-            return ''
+    def _write_birthdays(self, today: date, lines: List[str]) -> None:
+        writer = BannerWriter(self.line_width, lines)
+        self._advance_window(today)
+        total = sum(
+            len(bucket)
+            for days_until, groups in enumerate(self._window)
+            for horizon, bucket in groups if horizon >= days_until
+            )
+        self._write_proximities(writer, self._iter_proximities(today), total)
+        writer.close()
+    
+    def _write_records(
+            self, records: List[UpcomingBirthday], lines: List[str]
+            ) -> None:
+        writer = BannerWriter(self.line_width, lines)
+        # The descriptions of the records are stripped of the leading
+        # space the banner writes them with.
+        proximities = (
+            self._Proximity(
+                rec.days_until, rec.name, rec.age, ' ' + rec.weekday_desc,
+                rec.event_type)
+            for rec in records)
+        self._write_proximities(writer, proximities, len(records))
+        writer.close()
     
-    def _get_proximity_list(self, today: date) -> List[_Proximity]:
-        prox_list = []
+    def _index_groups(self) -> None:
         for bday in self.birthdays:
-            if (bday.date_obj.month == today.month and bday.date_obj.day < today.day
-                or bday.date_obj.month < today.month):
-                next_bd = date(today.year+1, bday.date_obj.month, bday.date_obj.day)
-            else:
-                next_bd = date(today.year, bday.date_obj.month, bday.date_obj.day)
-            days_until = (next_bd - today).days
-
-            bd_age = None
-            if bday.date_obj.year != date.min.year:
-                bd_age = next_bd.year - bday.date_obj.year
-            
-            weekday_desc = None
-            weeks_ahead = (
-                int(next_bd.strftime('%W')) - int(today.strftime('%W')))
-            if weeks_ahead <= 1 and days_until > 1:
-                weekday_desc = f' on {self._WEEKDAYS[next_bd.weekday()]}'
-                if weeks_ahead == 1 and days_until >= 7:
-                    weekday_desc += f' next week'
-
-            prox_list.append(self._Proximity(days_until, bday.name, bd_age, weekday_desc))
-        return prox_list
-    
-    def _format_proximity_list(self, prox_list) -> str:
-        bday_str = ''
-        last_i = len(prox_list) - 1
-        is_not_first = False
-        for i, prox in enumerate(prox_list):
-            if prox.days_until > self.birthday_notify_days:
-                break
-            next_prox_days = None if i == last_i else prox_list[i+1].days_until
-            if (is_not_first
-                    and prox_list[i-1].days_until == prox.days_until
-                    and next_prox_days != prox.days_until):
-                bday_str += ' and '
-            elif i != 0:
-                bday_str += ', '
-
-            if prox.name.strip():
-                bday_str += prox.name
-            else:
-                bday_str += '<empty>'
+            mask = 0
+            for group in bday.groups or ():
+                bit = self._group_bits.get(group)
+                if bit is None:
+                    bit = self._group_bits[group] = 1 << len(self._group_bits)
+                mask |= bit
+            self._group_masks.append(mask)
+    
+    def _fill_buckets(self) -> None:
+        wanted = None
+        if self.birthday_groups is not None:
+            wanted = 0
+            for group in self.birthday_groups:
+                wanted |= self._group_bits.get(group, 0)
+        groups: Dict[int, List[List[Birthday]]] = {}
+        for bday, mask in zip(self.birthdays, self._group_masks):
+            if wanted is not None and not mask & wanted:
+                continue
+            horizon = bday.notify_days
+            if horizon is None:
+                horizon = self.birthday_notify_days
+            if horizon not in groups:
+                groups[horizon] = [[] for _ in range(366)]
+            groups[horizon][_day_index(bday.date_obj)].append(bday)
+        for buckets in groups.values():
+            for bucket in buckets:
+                bucket.sort(key=_sort_key)
+        self._horizon_groups = sorted(groups.items(), reverse=True)
 
-            is_not_first = True
-            if prox.bd_age:
-                bday_str += f' ({prox.bd_age})'
-            if i == last_i or next_prox_days != prox.days_until:
-                if prox.weekday_desc:
-                    bday_str += prox.weekday_desc
+        if len(groups) == 1:
+            self._buckets = self._horizon_groups[0][1]
+        else:
+            for i, bucket in enumerate(self._buckets):
+                bucket.extend(heapq.merge(
+                    *(buckets[i] for buckets in groups.values()),
+                    key=_sort_key))
+    
+    def _bucket_for(
+            self, day: date, buckets: List[List[Birthday]] | None = None,
+            exclude: Collection[int] = ()
+            ) -> List[Birthday]:
+        if buckets is None:
+            buckets = self._buckets
+        day_index = _day_index(day)
+        bucket = [] if day_index in exclude else buckets[day_index]
+        if (day.month == 2 and day.day == 28 and not calendar.isleap(day.year)
+                and _LEAP_DAY_INDEX not in exclude):
+            leap_day_bucket = buckets[_LEAP_DAY_INDEX]
+            if leap_day_bucket:
+                bucket = sorted(bucket + leap_day_bucket, key=_sort_key)
+        return bucket
+    
+    def _iter_buckets(
+            self, today: date, horizon: int
+            ) -> Iterator[Tuple[int, List[Birthday]]]:
+        if self._window_source is None:
+            for days_until in range(horizon + 1):
+                day = today + timedelta(days_until)
+                yield days_until, self._bucket_for(day)
+            return
+        # Source windows are queried a year at most at a time, as a month
+        # and day can only occur once in a window.
+        for offset in range(0, horizon + 1, _MAX_WINDOW_DAYS):
+            days = min(_MAX_WINDOW_DAYS, horizon + 1 - offset)
+            window = self._store_window(today + timedelta(offset), days)
+            for days_until, groups in enumerate(window, offset):
+                buckets = [bucket for _, bucket in groups]
+                if len(buckets) == 1:
+                    yield days_until, buckets[0]
                 else:
-                    bday_str += self._format_days_until(prox.days_until)
-        
-        if bday_str == '':
-            return None
+                    yield days_until, list(
+                        heapq.merge(*buckets, key=_sort_key))
+
+    def _store_window(
+            self, first: date, days: int
+            ) -> List[List[Tuple[int, List[Birthday]]]]:
+        # Same layout as `_window`: for each day the groups of birthdays
+        # by horizon in descending order of horizon.
+        offsets: Dict[Tuple[int, int], int] = {}
+        for days_until in range(days):
+            day = first + timedelta(days_until)
+            offsets[day.month, day.day] = days_until
+            if (day.month == 2 and day.day == 28
+                    and not calendar.isleap(day.year)):
+                offsets[2, 29] = days_until
+        window: List[Dict[int, List[Birthday]]] = [{} for _ in range(days)]
+        for bday in self._window_source.birthday_window(
+                first, days, self.birthday_groups):
+            days_until = offsets.get((bday.date_obj.month, bday.date_obj.day))
+            if days_until is None:
+                continue
+            horizon = bday.notify_days
+            if horizon is None:
+                horizon = self.birthday_notify_days
+            window[days_until].setdefault(horizon, []).append(bday)
+        return [
+            [(horizon, sorted(bucket, key=_sort_key))
+             for horizon, bucket in sorted(groups.items(), reverse=True)]
+            for groups in window
+            ]
+
+    def _window_groups(
+            self, today: date, days_until: int
+            ) -> List[Tuple[int, List[Birthday]]]:
+        day = today + timedelta(days_until)
+        # A month and day shown today can come again a year later, at the
+        # end of the longest window. The birthdays are only shown today.
+        exclude: Collection[int] = ()
+        if days_until >= _MAX_WINDOW_DAYS - 1:
+            exclude = _shown_day_indices(today)
+        if self._window_source is not None:
+            groups = []
+            for horizon, bucket in self._store_window(day, 1)[0]:
+                bucket = [
+                    bday for bday in bucket
+                    if _day_index(bday.date_obj) not in exclude]
+                if bucket:
+                    groups.append((horizon, bucket))
+            return groups
+        groups = []
+        for horizon, buckets in self._horizon_groups:
+            bucket = self._bucket_for(day, buckets, exclude)
+            if bucket:
+                groups.append((horizon, bucket))
+        return groups
+    
+    def _advance_window(self, today: date) -> None:
+        # The window covers days until up to 365, as in a span of a year
+        # with 29 February yesterday's month and day is 365 days ahead.
+        window_days = min(self._max_horizon, _MAX_WINDOW_DAYS)
+        # Days at the end of the window that depend on today's exclusions.
+        tail = max(0, window_days - _MAX_WINDOW_DAYS + 2)
+        if (self._window_start is not None
+                and today == self._window_start + timedelta(1)):
+            self._window.popleft()
+            for _ in range(tail):
+                self._window.pop()
+            self._window.extend(
+                self._window_groups(today, days_until)
+                for days_until in range(window_days - tail, window_days + 1)
+                )
+        elif today != self._window_start and self._window_source is not None:
+            first_tail_day = window_days + 1 - tail
+            self._window = collections.deque(
+                self._store_window(today, first_tail_day))
+            self._window.extend(
+                self._window_groups(today, days_until)
+                for days_until in range(first_tail_day, window_days + 1)
+                )
+        elif today != self._window_start:
+            self._window = collections.deque(
+                self._window_groups(today, days_until)
+                for days_until in range(window_days + 1)
+                )
+        if today != self._window_start:
+            self._build_descriptors(today, window_days)
+        self._window_start = today
+    
+    def _iter_proximities(self, today: date) -> Iterator[_Proximity]:
+        self._advance_window(today)
+        for days_until, groups in enumerate(self._window):
+            # Groups are in descending order of horizon, so only the
+            # groups whose horizon reaches the day are scanned.
+            buckets = []
+            for horizon, bucket in groups:
+                if horizon < days_until:
+                    break
+                buckets.append(bucket)
+            if not buckets:
+                continue
+            next_bd_year = (today + timedelta(days_until)).year
+            desc = self._descriptors[days_until]
+            for bday in (buckets[0] if len(buckets) == 1
+                         else heapq.merge(*buckets, key=_sort_key)):
+                yield self._Proximity(
+                    days_until, bday.name, _age(bday, next_bd_year), desc,
+                    bday.event_type)
+    
+    def _build_descriptors(self, today: date, window_days: int) -> None:
+        self._descriptors = [
+            self._describe(today, days_until)
+            for days_until in range(window_days + 1)
+            ]
+    
+    def _describe(self, today: date, days_until: int) -> str:
+        # Weeks are counted from Monday to Monday.
+        weeks_ahead, weekday = divmod(today.weekday() + days_until, 7)
+        if weeks_ahead <= 1 and days_until > 1:
+            desc = f' on {self._WEEKDAYS[weekday]}'
+            if weeks_ahead == 1 and days_until >= 7:
+                desc += ' next week'
+            return desc
+        return self._format_days_until(days_until)
+    
+    def _write_proximities(
+            self, writer: BannerWriter, proximities: Iterator[_Proximity],
+            total: int
+            ) -> None:
+        # When limited, the proximities shown are written as if they were
+        # the whole list and followed by ' and N more'. For `max_lines`
+        # each candidate ending is tried out on a snapshot of the writer.
+        fallback = None
+        shown = 0
+        prox = next(proximities, None)
+        prev_days = None
+        prev_type = None
+        while prox is not None:
+            next_prox = next(proximities, None)
+            next_days = None if next_prox is None else next_prox.days_until
+            shown += 1
+            name = prox.name if prox.name.strip() else '<empty>'
+            if prox.bd_age:
+                name += ' (' + EVENT_TYPES[prox.event_type].age_format.format(
+                    prox.bd_age)
+                if (self.milestone_ages is not None
+                        and prox.bd_age in self.milestone_ages):
+                    name += '!'
+                name += ')'
+
+            if shown == self.max_names or self.max_lines is not None:
+                more = total - shown
+                ending = (
+                    self._separator(
+                        prev_days, prox.days_until, None, prev_type,
+                        prox.event_type)
+                    + name + prox.desc
+                    + (f' and {more} more' if more > 0 else '')
+                    )
+                state = writer.snapshot()
+                writer.write(ending)
+                if self.max_lines is not None:
+                    writer.close()
+                    if writer.line_count > self.max_lines:
+                        if fallback:
+                            writer.restore(fallback[0])
+                            writer.write(fallback[1])
+                        return
+                if shown == self.max_names or more <= 0:
+                    return
+                writer.restore(state)
+                fallback = (state, ending)
+
+            writer.write(
+                self._separator(
+                    prev_days, prox.days_until, next_days, prev_type,
+                    prox.event_type)
+                + name)
+            if next_days != prox.days_until:
+                writer.write(prox.desc)
+            prev_days = prox.days_until
+            prev_type = prox.event_type
+            prox = next_prox
+    
+    def _separator(
+            self, prev_days: int | None, days_until: int,
+            next_days: int | None, prev_type: str | None, event_type: str
+            ) -> str:
+        # The title of the event type starts the names of each run of the
+        # same type, e.g. 'Birthday of A, B, name day of C'.
+        title = EVENT_TYPES[event_type].title
+        if prev_days is None:
+            return title + ' '
+        elif prev_days == days_until and next_days != days_until:
+            separator = ' and '
         else:
-            return  f'Birthday of {bday_str}'
+            separator = ', '
+        if event_type != prev_type:
+            separator += title[0].lower() + title[1:] + ' '
+        return separator
     
     def _format_days_until(self, days_until) -> str:
         if days_until == 0:
@@ -251,3 +852,47 @@ class BirthdayNotifier:
             return ' tomorrow'
         else:
             return f' in {days_until} days'
+
+
+def _sort_key(bday: Birthday) -> Tuple[int, str, int]:
+    return _EVENT_ORDER[bday.event_type], bday.name, -bday.date_obj.year
+
+
+def _age(bday: Birthday, year: int) -> int | None:
+    """
+    Return the years from the birth year of `bday` to `year`, or None if
+    the year is not known or the event type has no age.
+    """
+    if (bday.date_obj.year == date.min.year
+            or EVENT_TYPES[bday.event_type].age_format is None):
+        return None
+    return year - bday.date_obj.year
+
+
+def _day_index(day: date) -> int:
+    """Return the index of the month and day of `day` in a leap year."""
+    return date(_LEAP_YEAR, day.month, day.day).toordinal() - _LEAP_YEAR_START
+
+
+_LEAP_DAY_INDEX = _day_index(date(_LEAP_YEAR, 2, 29))
+
+
+def _shown_day_indices(day: date) -> Tuple[int, ...]:
+    """
+    Return the indices of the days of year whose birthdays are shown on
+    `day`, including 29 February on 28 February of a common year.
+    """
+    if day.month == 2 and day.day == 28 and not calendar.isleap(day.year):
+        return _day_index(day), _LEAP_DAY_INDEX
+    return (_day_index(day),)
+
+
+def _fold_name(name: str) -> str:
+    """
+    Return `name` casefolded and NFC-normalized with accents removed,
+    e.g. 'Pääkkönen' becomes 'paakkonen'.
+    """
+    decomposed = unicodedata.normalize('NFKD', name)
+    stripped = ''.join(
+        c for c in decomposed if not unicodedata.combining(c))
+    return unicodedata.normalize('NFC', stripped.casefold())
@@ -0,0 +1,296 @@
+"""
+Define `BirthdayStore` class for reading birthdays and time tags from a
+SQLite data file.
+
+`BirthdayStore` objects can be given to `PrimaryPrompt` instead of a
+`DataLoader`. They implement `WindowedDataSource`, so the birthday
+notifier queries only the birthdays within the notification window from
+the store.
+
+"""
+
+from datetime import date, timedelta
+from typing import AbstractSet, Any, List, Tuple
+import calendar
+import json
+import sqlite3
+
+from .birthday import Birthday
+from .data_loader import DataLoader
+from .time_tag import TimeTag
+
+SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS birthdays (
+    position INTEGER PRIMARY KEY,
+    date TEXT NOT NULL,
+    name TEXT NOT NULL,
+    month INTEGER NOT NULL,
+    day INTEGER NOT NULL,
+    ordinal INTEGER NOT NULL,
+    notify_days INTEGER,
+    groups TEXT,
+    event_type TEXT NOT NULL DEFAULT 'birthday'
+);
+CREATE INDEX IF NOT EXISTS birthdays_month_day ON birthdays (month, day);
+CREATE TABLE IF NOT EXISTS time_tags (
+    position INTEGER PRIMARY KEY,
+    start TEXT NOT NULL,
+    stop TEXT NOT NULL,
+    text TEXT NOT NULL,
+    weekdays TEXT,
+    dates TEXT
+);
+"""
+_BIRTHDAY_COLUMNS = 'date, name, ordinal, notify_days, groups, event_type'
+# Statements upgrading the schema from the version of the key to the next.
+_MIGRATIONS = {
+    1: "ALTER TABLE birthdays ADD COLUMN event_type TEXT NOT NULL "
+       "DEFAULT 'birthday'",
+    }
+_TIME_TAG_COLUMNS = 'start, stop, text, weekdays, dates'
+
+
+class BirthdayStore:
+    """
+    Class for reading birthdays and time tags from a SQLite data file.
+
+    The birthdays are indexed by month and day, so the birthdays of a
+    window of days are read with a range query touching only the
+    matching rows. Group labels are matched in the query, so birthdays
+    of other groups are not read. The connection is opened once and
+    reused by all queries until `close()`.
+
+    Attributes
+    ----------
+    path : str
+        Path of the SQLite file.
+    birthdays_disabled : bool
+        True if the birthdays were null in the imported JSON data.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Open a birthday store. A new file is created if it does not
+        exist.
+
+        Parameters
+        ----------
+        path : str
+            Path of the SQLite file.
+
+        Raises
+        ------
+        sqlite3.DatabaseError
+            The file is not a SQLite database or its schema version is
+            newer than this package supports.
+
+        Files of older schema versions are upgraded when opened.
+        """
+        self.path = path
+        """Path of the SQLite file."""
+
+        self._connection = sqlite3.connect(path)
+        try:
+            version = self._connection.execute(
+                'PRAGMA user_version').fetchone()[0]
+            if version > SCHEMA_VERSION:
+                raise sqlite3.DatabaseError(
+                    f'schema version {version} of {path!r} is not supported')
+            with self._connection:
+                if version > 0:
+                    for from_version in range(version, SCHEMA_VERSION):
+                        self._connection.execute(_MIGRATIONS[from_version])
+                self._connection.executescript(_SCHEMA)
+                self._connection.execute(
+                    f'PRAGMA user_version = {SCHEMA_VERSION}')
+        except sqlite3.DatabaseError:
+            self._connection.close()
+            raise
+
+        self.birthdays_disabled = self._get_meta('birthdays') == 'null'
+        """True if the birthdays were null in the imported JSON data."""
+
+    def close(self) -> None:
+        """Close the connection of the store."""
+        self._connection.close()
+
+    def import_data(self, data_loader: DataLoader) -> Tuple[int, int]:
+        """
+        Replace the contents of the store with the data of `data_loader`.
+
+        The birthdays are inserted while they are read with
+        `DataLoader.iter_birthdays()`, so records given to
+        `DataLoader.from_records()` are imported in constant memory. The
+        import is one transaction, so the store is left unchanged if the
+        data has errors. Returns the number of birthdays and time tags
+        imported.
+
+        Parameters
+        ----------
+        data_loader : DataLoader
+            Data loader of a JSON data file.
+
+        Raises
+        ------
+        ConstructBirthdaysGroup
+            Birthday records of the data are invalid.
+        ConstructTimeTagsGroup
+            Time tag records of the data are invalid.
+        """
+        time_tags = data_loader.construct_time_tags()
+        disabled = data_loader.birthdays_disabled
+        with self._connection:
+            self._connection.execute('DELETE FROM birthdays')
+            self._connection.execute('DELETE FROM time_tags')
+            birthday_count = self._connection.executemany(
+                'INSERT INTO birthdays (date, name, month, day, ordinal, '
+                'notify_days, groups, event_type) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (
+                    (bday.date, bday.name, bday.date_obj.month,
+                     bday.date_obj.day, bday.date_obj.toordinal(),
+                     bday.notify_days,
+                     None if bday.groups is None else json.dumps(bday.groups),
+                     bday.event_type)
+                    for bday in data_loader.iter_birthdays()
+                    )
+                ).rowcount
+            self._connection.executemany(
+                f'INSERT INTO time_tags ({_TIME_TAG_COLUMNS}) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (
+                    (tag.start, tag.stop, tag.text, tag.weekdays, tag.dates)
+                    for tag in time_tags or ()
+                    )
+                )
+            self._set_meta('birthdays', 'null' if disabled else 'array')
+            self._set_meta(
+                'timeTags', 'null' if time_tags is None else 'array')
+        self.birthdays_disabled = disabled
+        return max(birthday_count, 0), len(time_tags or ())
+
+    def construct_birthdays(self) -> List[Birthday] | None:
+        """Construct list of all `Birthday` objects in the store."""
+        if self.birthdays_disabled:
+            return None
+        return self._query_birthdays(
+            f'SELECT {_BIRTHDAY_COLUMNS} FROM birthdays ORDER BY position')
+
+    def construct_time_tags(self) -> List[TimeTag] | None:
+        """Construct list of all `TimeTag` objects in the store."""
+        if self._get_meta('timeTags') == 'null':
+            return None
+        rows = self._connection.execute(
+            f'SELECT {_TIME_TAG_COLUMNS} FROM time_tags ORDER BY position')
+        time_tags = []
+        for start, stop, text, weekdays, dates in rows:
+            options = {}
+            if weekdays is not None:
+                options['weekdays'] = weekdays
+            if dates is not None:
+                options['dates'] = dates
+            time_tags.append(TimeTag(start, stop, text, **options))
+        return time_tags
+
+    def has_birthdays(self) -> bool:
+        """Return True if the store has any birthdays."""
+        return self._connection.execute(
+            'SELECT EXISTS (SELECT 1 FROM birthdays)').fetchone()[0] == 1
+
+    def max_notify_days(self, default: int) -> int:
+        """
+        Return the longest notify horizon of the birthdays.
+
+        Parameters
+        ----------
+        default : int
+            Horizon of the birthdays without their own notify days.
+        """
+        horizon = self._connection.execute(
+            'SELECT MAX(COALESCE(notify_days, ?)) FROM birthdays',
+            (default,)
+            ).fetchone()[0]
+        return default if horizon is None else horizon
+
+    def birthday_window(
+            self, first: date, days: int,
+            groups: AbstractSet[str] | None = None
+            ) -> List[Birthday]:
+        """
+        Return the birthdays celebrated within `days` days from `first`.
+
+        Birthdays on 29 February are included when 28 February of a
+        common year is within the window. A window of 365 days or more
+        returns all birthdays.
+
+        Parameters
+        ----------
+        first : date
+            First day of the window.
+        days : int
+            Number of days in the window.
+        groups : set of str, optional
+            Only return the birthdays with any of these group labels.
+        """
+        if days <= 0:
+            return []
+        group_sql = ''
+        group_params: Tuple[str, ...] = ()
+        if groups is not None:
+            group_params = tuple(groups)
+            group_sql = (
+                ' AND EXISTS (SELECT 1 FROM json_each(groups) WHERE value IN '
+                f'({", ".join("?" * len(group_params))}))')
+        last = first + timedelta(days - 1)
+        if days >= 365:
+            return self._query_birthdays(
+                f'SELECT {_BIRTHDAY_COLUMNS} FROM birthdays WHERE 1'
+                + group_sql, group_params)
+        if (last.month == 2 and last.day == 28
+                and not calendar.isleap(last.year)):
+            last_md = (2, 29)
+        else:
+            last_md = (last.month, last.day)
+        first_md = (first.month, first.day)
+        if first_md <= last_md:
+            return self._query_birthdays(
+                f'SELECT {_BIRTHDAY_COLUMNS} FROM birthdays '
+                'WHERE (month, day) BETWEEN (?, ?) AND (?, ?)' + group_sql,
+                first_md + last_md + group_params
+                )
+        # The window wraps over the new year.
+        return self._query_birthdays(
+            f'SELECT {_BIRTHDAY_COLUMNS} FROM birthdays '
+            'WHERE (month, day) >= (?, ?)' + group_sql
+            + f' UNION ALL SELECT {_BIRTHDAY_COLUMNS} FROM birthdays '
+            'WHERE (month, day) <= (?, ?)' + group_sql,
+            first_md + group_params + last_md + group_params
+            )
+
+    def _query_birthdays(
+            self, sql: str, parameters: Tuple[Any, ...] = ()
+            ) -> List[Birthday]:
+        fromordinal = date.fromordinal
+        return [
+            Birthday.from_parsed(
+                date_str, name, fromordinal(ordinal), notify_days,
+                None if groups is None else json.loads(groups), event_type)
+            for date_str, name, ordinal, notify_days, groups, event_type
+            in self._connection.execute(sql, parameters)
+            ]
+
+    def _get_meta(self, key: str) -> str | None:
+        row = self._connection.execute(
+            'SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return None if row is None else row[0]
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self._connection.execute(
+            'INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)',
+            (key, value))
@@ -0,0 +1,410 @@
+"""
+Define a compiled binary data file format for birthdays and time tags.
+
+A compiled data file ('.ttbp') is written once from a data source with
+`compile_data()` and read with `CompiledDataFile`, which maps the file
+into memory and unpacks records only when they are asked for. Like
+`BirthdayStore`, it implements `WindowedDataSource`, so the birthday
+notifier reads only the birthdays within its notification window.
+
+All integers are little-endian. The file consists of
+
+- a header: magic b'TTBP', format version, flags, record counts, the
+  longest explicit notify days and the offsets of the other sections,
+- fixed-width birthday records sorted by month and day, with the index
+  of the event type in `EVENT_TYPES` since format version 2,
+- a day-of-year index of 367 record indices, where entry `i` is the
+  first record on day `i` of a leap year and the last entry is the
+  number of records,
+- fixed-width time tag records, and
+- a string table of UTF-8 strings referenced by (offset, length) pairs
+  from the records.
+
+"""
+
+from datetime import date, timedelta
+from typing import AbstractSet, Dict, Iterable, List, Tuple
+import calendar
+import contextlib
+import json
+import mmap
+import os
+import struct
+
+from .birthday import EVENT_TYPES, Birthday
+from .data_source import DataSource
+from .exceptions import CompiledDataFileError
+from .time_tag import TimeTag
+
+FORMAT_VERSION = 2
+
+_MAGIC = b'TTBP'
+_HEADER = struct.Struct('<4sHHIIiQQQQ')
+# position, ordinal, notify days, (offset, length) of name, date and
+# groups in the string table, and the index of the event type by format
+# version.
+_BIRTHDAY_FORMATS = {
+    1: struct.Struct('<IIiIIIIII'),
+    2: struct.Struct('<IIiIIIIIII'),
+    }
+_BIRTHDAY = _BIRTHDAY_FORMATS[FORMAT_VERSION]
+_EVENT_TYPE_KEYS = list(EVENT_TYPES)
+_EVENT_TYPE_INDEX = {key: i for i, key in enumerate(_EVENT_TYPE_KEYS)}
+# (offset, length) of start, stop, text, weekdays and dates.
+_TIME_TAG = struct.Struct('<IIIIIIIIII')
+_DAY_COUNT = 366
+_DAY_INDEX = struct.Struct(f'<{_DAY_COUNT + 1}I')
+_NULL_OFFSET = 0xFFFFFFFF
+
+_BIRTHDAYS_NULL = 1
+_TIME_TAGS_NULL = 2
+_DEFAULT_NOTIFY_DAYS = 4
+
+# Day of a leap year of each (month, day), starting from 0.
+_DAY_OF_YEAR = {
+    (day.month, day.day): i
+    for i, day in enumerate(
+        date(2000, 1, 1) + timedelta(i) for i in range(_DAY_COUNT))
+    }
+
+
+class _StringTable:
+    """Table of UTF-8 strings, each stored only once."""
+
+    def __init__(self) -> None:
+        self.data = bytearray()
+        self._offsets: Dict[str, Tuple[int, int]] = {}
+
+    def add(self, text: str | None) -> Tuple[int, int]:
+        if text is None:
+            return _NULL_OFFSET, 0
+        ref = self._offsets.get(text)
+        if ref is None:
+            encoded = text.encode('utf-8')
+            ref = (len(self.data), len(encoded))
+            self.data += encoded
+            self._offsets[text] = ref
+        return ref
+
+
+def compile_data(data_source: DataSource, path: str) -> Tuple[int, int]:
+    """
+    Write the birthdays and time tags of `data_source` into compiled data
+    file `path`.
+
+    The file is first written next to `path` and then renamed over it,
+    so a file in use is never seen half written. Returns the number of
+    birthdays and time tags written.
+
+    Parameters
+    ----------
+    data_source : DataSource
+        Source of the data, e.g. a `DataLoader`.
+    path : str
+        Path of the compiled data file.
+
+    Raises
+    ------
+    ConstructBirthdaysGroup
+        Birthday records of the data are invalid.
+    ConstructTimeTagsGroup
+        Time tag records of the data are invalid.
+    """
+    time_tags = data_source.construct_time_tags()
+    iter_birthdays = getattr(data_source, 'iter_birthdays', None)
+    if iter_birthdays is not None:
+        birthdays: Iterable[Birthday] = iter_birthdays()
+    else:
+        birthdays = data_source.construct_birthdays() or ()
+
+    strings = _StringTable()
+    records = []
+    max_notify_days = -1
+    flags = 0
+    for position, bday in enumerate(birthdays):
+        date_obj = bday.date_obj
+        if bday.notify_days is None:
+            flags |= _DEFAULT_NOTIFY_DAYS
+        else:
+            max_notify_days = max(max_notify_days, bday.notify_days)
+        groups = None if bday.groups is None else json.dumps(bday.groups)
+        records.append((
+            _DAY_OF_YEAR[date_obj.month, date_obj.day], position,
+            date_obj.toordinal(),
+            -1 if bday.notify_days is None else bday.notify_days,
+            *strings.add(bday.name), *strings.add(bday.date),
+            *strings.add(groups), _EVENT_TYPE_INDEX[bday.event_type]
+            ))
+    records.sort()
+    if data_source.birthdays_disabled:
+        flags |= _BIRTHDAYS_NULL
+    if time_tags is None:
+        flags |= _TIME_TAGS_NULL
+
+    day_index = [0] * (_DAY_COUNT + 1)
+    for day_of_year, *_ in records:
+        day_index[day_of_year + 1] += 1
+    for i in range(_DAY_COUNT):
+        day_index[i + 1] += day_index[i]
+
+    records_offset = _HEADER.size
+    day_index_offset = records_offset + len(records) * _BIRTHDAY.size
+    time_tags_offset = day_index_offset + _DAY_INDEX.size
+    strings_offset = (
+        time_tags_offset + len(time_tags or ()) * _TIME_TAG.size)
+
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as fp:
+            fp.write(_HEADER.pack(
+                _MAGIC, FORMAT_VERSION, flags, len(records),
+                len(time_tags or ()), max_notify_days, records_offset,
+                day_index_offset, time_tags_offset, strings_offset
+                ))
+            for record in records:
+                fp.write(_BIRTHDAY.pack(*record[1:]))
+            fp.write(_DAY_INDEX.pack(*day_index))
+            for tag in time_tags or ():
+                fp.write(_TIME_TAG.pack(
+                    *strings.add(tag.start), *strings.add(tag.stop),
+                    *strings.add(tag.text), *strings.add(tag.weekdays),
+                    *strings.add(tag.dates)
+                    ))
+            fp.write(strings.data)
+    except BaseException:
+        # The file does not exist if opening it failed.
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, path)
+    return len(records), len(time_tags or ())
+
+
+class CompiledDataFile:
+    """
+    Class for reading birthdays and time tags from a compiled data file.
+
+    The file is mapped into memory with `mmap` when opened, and records
+    are unpacked from the mapping only when they are read, so opening a
+    large file takes the same time as opening a small one. The mapping
+    is kept until `close()`.
+
+    Group labels are numbered with bits. Each groups string of the
+    string table gets a bitmask of its labels when first read, so the
+    group filter of a window is one bitwise and per record and records
+    of other groups are not unpacked further.
+
+    Attributes
+    ----------
+    path : str
+        Path of the compiled data file.
+    birthdays_disabled : bool
+        True if the birthdays were null in the compiled data.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Open a compiled data file.
+
+        Parameters
+        ----------
+        path : str
+            Path of the compiled data file.
+
+        Raises
+        ------
+        OSError
+            The file cannot be opened.
+        CompiledDataFileError
+            The file is not a compiled data file, its format version is
+            not supported or it is truncated. Files of older format
+            versions are read as well.
+        """
+        self.path = path
+        """Path of the compiled data file."""
+
+        with open(path, 'rb') as fp:
+            if os.fstat(fp.fileno()).st_size < _HEADER.size:
+                raise CompiledDataFileError(path, 'not a compiled data file')
+            self._buffer = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            (magic, version, self._flags, self._birthday_count,
+             self._time_tag_count, self._max_notify_days,
+             self._records_offset, self._day_index_offset,
+             self._time_tags_offset, self._strings_offset
+             ) = _HEADER.unpack_from(self._buffer)
+            if magic != _MAGIC:
+                raise CompiledDataFileError(path, 'not a compiled data file')
+            if version not in _BIRTHDAY_FORMATS:
+                raise CompiledDataFileError(
+                    path, f'format version {version} is not supported')
+            self._record = _BIRTHDAY_FORMATS[version]
+            if (self._records_offset != _HEADER.size
+                    or self._day_index_offset != self._records_offset
+                    + self._birthday_count * self._record.size
+                    or self._time_tags_offset
+                    != self._day_index_offset + _DAY_INDEX.size
+                    or self._strings_offset != self._time_tags_offset
+                    + self._time_tag_count * _TIME_TAG.size
+                    or self._strings_offset > len(self._buffer)):
+                raise CompiledDataFileError(path, 'file is truncated')
+        except CompiledDataFileError:
+            self._buffer.close()
+            raise
+
+        self.birthdays_disabled = bool(self._flags & _BIRTHDAYS_NULL)
+        """True if the birthdays were null in the compiled data."""
+
+        self._day_index = _DAY_INDEX.unpack_from(
+            self._buffer, self._day_index_offset)
+        self._group_bits: Dict[str, int] = {}
+        # Bitmask of the groups string at each offset of the string table.
+        self._group_masks: Dict[int, int] = {_NULL_OFFSET: 0}
+
+    def close(self) -> None:
+        """Close the memory mapping of the file."""
+        self._buffer.close()
+
+    def construct_birthdays(self) -> List[Birthday] | None:
+        """Construct list of all `Birthday` objects in the file."""
+        if self.birthdays_disabled:
+            return None
+        positioned = self._read_birthdays(0, self._birthday_count)
+        positioned.sort(key=lambda pos_bday: pos_bday[0])
+        return [bday for _, bday in positioned]
+
+    def construct_time_tags(self) -> List[TimeTag] | None:
+        """Construct list of all `TimeTag` objects in the file."""
+        if self._flags & _TIME_TAGS_NULL:
+            return None
+        time_tags = []
+        for refs in _TIME_TAG.iter_unpack(self._buffer[
+                self._time_tags_offset:self._strings_offset]):
+            start, stop, text, weekdays, dates = (
+                self._get_str(refs[i], refs[i + 1]) for i in range(0, 10, 2))
+            options = {}
+            if weekdays is not None:
+                options['weekdays'] = weekdays
+            if dates is not None:
+                options['dates'] = dates
+            time_tags.append(TimeTag(start, stop, text, **options))
+        return time_tags
+
+    def has_birthdays(self) -> bool:
+        """Return True if the file has any birthdays."""
+        return self._birthday_count > 0
+
+    def max_notify_days(self, default: int) -> int:
+        """
+        Return the longest notify horizon of the birthdays.
+
+        Parameters
+        ----------
+        default : int
+            Horizon of the birthdays without their own notify days.
+        """
+        if (self._birthday_count == 0
+                or self._flags & _DEFAULT_NOTIFY_DAYS):
+            return max(default, self._max_notify_days)
+        return self._max_notify_days
+
+    def birthday_window(
+            self, first: date, days: int,
+            groups: AbstractSet[str] | None = None
+            ) -> List[Birthday]:
+        """
+        Return the birthdays celebrated within `days` days from `first`.
+
+        Birthdays on 29 February are included when 28 February of a
+        common year is within the window. A window of 365 days or more
+        returns all birthdays.
+
+        Parameters
+        ----------
+        first : date
+            First day of the window.
+        days : int
+            Number of days in the window.
+        groups : set of str, optional
+            Only return the birthdays with any of these group labels.
+        """
+        if days <= 0:
+            return []
+        if days >= 365:
+            ranges = [(0, _DAY_COUNT)]
+        else:
+            last = first + timedelta(days - 1)
+            first_i = _DAY_OF_YEAR[first.month, first.day]
+            last_i = _DAY_OF_YEAR[last.month, last.day]
+            if (last.month == 2 and last.day == 28
+                    and not calendar.isleap(last.year)):
+                last_i += 1
+            if first_i <= last_i:
+                ranges = [(first_i, last_i + 1)]
+            else:
+                # The window wraps over the new year.
+                ranges = [(first_i, _DAY_COUNT), (0, last_i + 1)]
+        wanted = None
+        if groups is not None:
+            wanted = 0
+            for group in groups:
+                wanted |= self._group_bit(group)
+        birthdays = []
+        for start_day, stop_day in ranges:
+            birthdays.extend(bday for _, bday in self._read_birthdays(
+                self._day_index[start_day], self._day_index[stop_day],
+                wanted))
+        return birthdays
+
+    def _read_birthdays(
+            self, start: int, stop: int, wanted: int | None = None
+            ) -> List[Tuple[int, Birthday]]:
+        """
+        Return (position, birthday) of records `start` to `stop`, only
+        of the records whose group mask has any bit of `wanted` if given.
+        """
+        offset = self._records_offset
+        size = self._record.size
+        fromordinal = date.fromordinal
+        get_str = self._get_str
+        group_masks = self._group_masks
+        birthdays = []
+        for (position, ordinal, notify_days, name_offset, name_len,
+             date_offset, date_len, groups_offset, groups_len, *type_index
+             ) in self._record.iter_unpack(self._buffer[
+                offset + start * size:offset + stop * size]):
+            if wanted is not None:
+                mask = group_masks.get(groups_offset)
+                if mask is None:
+                    mask = self._index_groups(groups_offset, groups_len)
+                if not mask & wanted:
+                    continue
+            groups = get_str(groups_offset, groups_len)
+            birthdays.append((position, Birthday.from_parsed(
+                get_str(date_offset, date_len),
+                get_str(name_offset, name_len),
+                fromordinal(ordinal),
+                None if notify_days < 0 else notify_days,
+                None if groups is None else json.loads(groups),
+                _EVENT_TYPE_KEYS[type_index[0]] if type_index else 'birthday'
+                )))
+        return birthdays
+
+    def _group_bit(self, group: str) -> int:
+        bit = self._group_bits.get(group)
+        if bit is None:
+            bit = self._group_bits[group] = 1 << len(self._group_bits)
+        return bit
+
+    def _index_groups(self, offset: int, length: int) -> int:
+        mask = 0
+        for group in json.loads(self._get_str(offset, length)):
+            mask |= self._group_bit(group)
+        self._group_masks[offset] = mask
+        return mask
+
+    def _get_str(self, offset: int, length: int) -> str | None:
+        if offset == _NULL_OFFSET:
+            return None
+        start = self._strings_offset + offset
+        return self._buffer[start:start + length].decode('utf-8')
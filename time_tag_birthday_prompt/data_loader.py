@@ -1,40 +1,97 @@
 """
 Defines `DataLoader` class for reading birthdays and time tags from a
-JSON data file.
+JSON data file or from iterables of records.
 
 """
 
 from io import TextIOWrapper
-from typing import Dict, List
+from typing import (
+    Any, Callable, Dict, Iterable, Iterator, List, Sequence, Set, TextIO,
+    Tuple)
+import gc
+import gzip
+import itertools
 import json
+import lzma
+import os
+import os.path
+import threading
+import zlib
 
-from .birthday import Birthday
+from .birthday import EVENT_TYPES, Birthday
 from .exceptions import (
     ConstructBirthdaysGroup, ConstructTimeTagsGroup, DataLoaderInitGroup,
-    TimeTagInitGroup, BirthdayInitGroup, CorruptJSONFileError
+    TimeTagInitGroup, BirthdayInitGroup, CorruptJSONFileError,
+    IncludedFileError
     )
+from .parsers import parse_dates
 from .time_tag import TimeTag
 
-DataObjectType = Dict[str, List[List[str]]]
+DataObjectType = Dict[str, List[List[Any]]]
+
+_TYPE_DESCS = {str: 'a string', int: 'an integer', list: 'an array'}
+_BIRTHDAY_OPTIONS = {
+    'notifyDays': 'notify_days', 'groups': 'groups', 'type': 'event_type'}
+_BIRTHDAY_FIELDS = ['birthday date', 'name']
+_BIRTHDAY_RECORD_OPTIONS = {'notifyDays': int, 'groups': list, 'type': str}
+_TIME_TAG_FIELDS = ['start time', 'stop time', 'text']
+_TIME_TAG_RECORD_OPTIONS = {'weekdays': str, 'dates': str}
+_RECORD_CHUNK_SIZE = 4096
+_COMPRESSED_OPENERS = {'.gz': gzip.open, '.xz': lzma.open}
+compressed_suffixes = tuple(_COMPRESSED_OPENERS)
+_MAX_INCLUDE_WORKERS = 8
+_MAX_INCLUDE_CACHE_SIZE = 64
+
+# Constructed birthdays and time tags of an included file by key
+# 'birthdays' and 'timeTags', each a tuple of the records or None and
+# the error group or None.
+_IncludeResults = Dict[str, Tuple[Any, ExceptionGroup | None]]
+
+# Results of included files by absolute path with the stat signature of
+# the file when it was loaded, in order of last use.
+_include_cache: Dict[
+    str, Tuple[Tuple[int, int, int], _IncludeResults]] = {}
+_include_cache_lock = threading.Lock()
 
 
 class DataLoader:
     """
     Class for reading birthdays and time tags from a file object of a
     JSON data file.
+
+    A data loader can also be created from iterables of records with
+    `from_records()`. The iterables are only consumed by the construct
+    methods, which validate and construct the records in chunks while
+    streaming them.
+
+    The root object may list other data files in field 'include'. They
+    are loaded in parallel on a thread pool and validated on their own,
+    and their records come before the records of the root file. Loaded
+    included files are cached by their path and stat signature, so an
+    unchanged file is neither read nor constructed again when a data
+    file including it is loaded again. Only the constructed records are
+    cached, and the least recently used files are dropped from the cache
+    when it has more than 64 files.
     """
 
-    def __init__(self, file_obj: TextIOWrapper, path: str):
+    def __init__(
+            self, file_obj: TextIOWrapper, path: str, included: bool = False
+            ) -> None:
         """
         Initiate a DataLoader object. Invoked by PrimaryPrompt.
 
         Parameters
         ----------
         file_obj : TextIOWrapper
-            File object to be read for JSON.
+            File object to be read for JSON, e.g. from
+            `open_data_file()`.
         path : str
             Path describing the location of the file object in file
-            system.
+            system. Included files are relative to its directory.
+        included : bool, default False
+            The file is included by another data file. Its fields
+            'birthdays' and 'timeTags' are optional and it cannot
+            include other files.
         
         Raises
         ------
@@ -42,7 +99,8 @@ class DataLoader:
             Problems reading JSON file from file object.
         DataLoaderInitGroup
             JSON data file does not conform to the correct format.
-            Contains exceptions of class `CorruptJSONFileError`.
+            Contains exceptions of class `CorruptJSONFileError`, and
+            `IncludedFileError` for the errors of included files.
         """
         try:
             self.data_object: DataObjectType = json.load(file_obj)
@@ -51,9 +109,18 @@ class DataLoader:
                 f'Corrupt JSON on row {err.lineno}, col {err.colno}: {err.msg}'
                 )
             raise DataLoaderInitGroup(path, (cjfe,))
+        except (gzip.BadGzipFile, lzma.LZMAError, zlib.error,
+                EOFError) as err:
+            cjfe = CorruptJSONFileError(f'Corrupt compressed data: {err}')
+            raise DataLoaderInitGroup(path, (cjfe,))
         self.birthdays_disabled = False
+        self._record_sources: Dict[str, Iterable[Sequence[Any]] | None] = {}
+        self._includes: List[Tuple[str, _IncludeResults]] = []
 
         err_list: List[Exception] = []
+        if included and isinstance(self.data_object, dict):
+            self.data_object.setdefault('birthdays', [])
+            self.data_object.setdefault('timeTags', [])
         if 'birthdays' not in self.data_object:
             err_list.append(
                 CorruptJSONFileError("Field 'birthdays' missing from root."))
@@ -67,8 +134,9 @@ class DataLoader:
             self._validate_list(
                 list_obj=self.data_object['birthdays'],
                 list_name='birthdays',
-                rec_fields=['birthday date', 'name'],
-                err_list=err_list
+                rec_fields=_BIRTHDAY_FIELDS,
+                err_list=err_list,
+                rec_options=_BIRTHDAY_RECORD_OPTIONS
                 )
         
         if 'timeTags' not in self.data_object:
@@ -83,42 +151,151 @@ class DataLoader:
             self._validate_list(
                 list_obj=self.data_object['timeTags'],
                 list_name='timeTags',
-                rec_fields=['start time', 'stop time', 'text'],
-                err_list=err_list
+                rec_fields=_TIME_TAG_FIELDS,
+                err_list=err_list,
+                rec_options=_TIME_TAG_RECORD_OPTIONS
                 )
+
+        if 'include' in self.data_object:
+            includes = self.data_object['include']
+            if included:
+                err_list.append(CorruptJSONFileError(
+                    "Field 'include' is not allowed in an included file."))
+            elif not (isinstance(includes, list)
+                    and all(isinstance(inc, str) for inc in includes)):
+                err_list.append(CorruptJSONFileError(
+                    "Field 'include' is not an array of strings."))
+            else:
+                self._load_includes(includes, path, err_list)
         
         if len(err_list) > 0:
             raise DataLoaderInitGroup(path, tuple(err_list))
+
+    def _load_includes(
+            self, includes: List[str], path: str, err_list: List[Exception]
+            ) -> None:
+        base_dir = os.path.dirname(os.path.abspath(path))
+        include_paths = [
+            os.path.normpath(
+                os.path.join(base_dir, os.path.expanduser(include)))
+            for include in includes
+            ]
+        workers = min(len(includes), _MAX_INCLUDE_WORKERS)
+        if workers == 0:
+            return
+        # Imported here, as concurrent.futures slows down the interpreter
+        # startup and only files with includes need it.
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_load_include, include_paths))
+        for include, (include_results, errors) in zip(includes, results):
+            err_list.extend(IncludedFileError(include, err) for err in errors)
+            if include_results is not None:
+                self._includes.append((include, include_results))
+
+    @classmethod
+    def from_records(
+            cls, birthdays: Iterable[Sequence[Any]] | None,
+            time_tags: Iterable[Sequence[Any]] | None = None
+            ) -> 'DataLoader':
+        """
+        Create a data loader from iterables of records, e.g. generators.
+
+        The records have the same fields as the arrays of the JSON data
+        file, e.g. ('2000-01-31', 'Name', {'notifyDays': 7}). Nothing is
+        read before `construct_birthdays()` or `construct_time_tags()`,
+        which consume their iterable once. The format of the records is
+        validated while constructing them, so a `CorruptJSONFileError`
+        is found in the `ExceptionGroup` of the construct method.
+
+        Parameters
+        ----------
+        birthdays : iterable of sequence or None
+            Birthday records, or None to turn off birthday notifications.
+        time_tags : iterable of sequence, optional
+            Time tag records. None for no time tags.
+        """
+        data_loader = cls.__new__(cls)
+        data_loader.data_object = None
+        data_loader.birthdays_disabled = birthdays is None
+        data_loader._record_sources = {
+            'birthdays': birthdays, 'timeTags': time_tags}
+        data_loader._includes = []
+        return data_loader
     
     def _validate_list(
             self, list_obj: List | None, list_name: str, rec_fields: List[str],
-            err_list: List[Exception]
+            err_list: List[Exception], rec_options: Dict[str, type] | None = None
             ) -> None:
         if list_obj is None:
             return
-        
+        for list_i, rec in enumerate(list_obj):
+            self._validate_record(
+                rec, list_i, list_name, rec_fields, err_list, rec_options)
+
+    def _validate_record(
+            self, rec: Any, list_i: int, list_name: str,
+            rec_fields: List[str], err_list: List[Exception],
+            rec_options: Dict[str, type] | None = None
+            ) -> None:
+        # Error messages are formatted only for invalid records.
+        if isinstance(rec, (list, tuple)) and len(rec) == len(rec_fields):
+            for fld_val in rec:
+                if not isinstance(fld_val, str):
+                    break
+            else:
+                return
+        if not isinstance(rec, (list, tuple)):
+            err_list.append(CorruptJSONFileError(
+                f"Array '{list_name}' index {list_i} is not an array."))
+            return
+
         nas = ' is not a string.'
         name_field = 'name' if 'name' in rec_fields else 'text'
         name_field_i = rec_fields.index(name_field)
+        max_len = len(rec_fields) + 1 if rec_options else len(rec_fields)
+        if not len(rec_fields) <= len(rec) <= max_len:
+            expected_len = str(len(rec_fields))
+            if max_len > len(rec_fields):
+                expected_len += f' or {max_len}'
+            err_list.append(CorruptJSONFileError(
+                f"Array '{list_name}' index {list_i} length is not "
+                f"{expected_len}."
+                ))
+        
+        def field_msg(fld_i: int) -> str:
+            msg = f"Array '{list_name}' index {list_i} "
+            if fld_i != name_field_i and len(rec) > name_field_i:
+                msg += f"({name_field} {rec[name_field_i]!r}) "
+            return msg + f"field[{fld_i}]"
 
-        for list_i, rec in enumerate(list_obj):
-            if not isinstance(rec, list):
+        for fld_i, fld_val in enumerate(rec[:max_len]):
+            if fld_i == len(rec_fields):
+                self._validate_options(
+                    fld_val, rec_options,
+                    lambda: field_msg(len(rec_fields)) + ' options', err_list)
+            elif not isinstance(fld_val, str):
                 err_list.append(CorruptJSONFileError(
-                    f"Array '{list_name}' index {list_i} is not an array."))
-                continue
-            if len(rec) != len(rec_fields):
+                    f"{field_msg(fld_i)} {rec_fields[fld_i]}{nas}"))
+
+    def _validate_options(
+            self, options: Any, rec_options: Dict[str, type],
+            options_msg: Callable[[], str], err_list: List[Exception]
+            ) -> None:
+        if not isinstance(options, dict):
+            err_list.append(CorruptJSONFileError(
+                f'{options_msg()} is not an object.'))
+            return
+        for key, value in options.items():
+            if key not in rec_options:
+                err_list.append(CorruptJSONFileError(
+                    f'{options_msg()} key {key!r} is unknown.'))
+            elif (not isinstance(value, rec_options[key])
+                    or isinstance(value, bool)):
                 err_list.append(CorruptJSONFileError(
-                    f"Array '{list_name}' index {list_i} length is not "
-                    f"{len(rec_fields)}."
+                    f'{options_msg()} key {key!r} is not '
+                    f'{_TYPE_DESCS[rec_options[key]]}.'
                     ))
-            
-            for fld_i, fld_val in enumerate(rec):
-                if not isinstance(fld_val, str):
-                    msg = f"Array '{list_name}' index {list_i} "
-                    if fld_i != name_field_i:
-                        msg += f"({name_field} {rec[name_field_i]!r}) "
-                    msg += f"field[{fld_i}] {rec_fields[fld_i]}{nas}"
-                    err_list.append(CorruptJSONFileError(msg))
 
     def construct_birthdays(self) -> List[Birthday] | None:
         """
@@ -129,28 +306,134 @@ class DataLoader:
         ConstructBirthdaysGroup
             The `ExceptionGroup` may contain errors
             `IncorrectParameterTypeError`, `IncorrectDateFormatError`,
-            `NullYearError` and/or `DateDoesntExistError`.
+            `NullYearError`, `DateDoesntExistError` and/or
+            `NotifyDaysLessThanZeroError`, and `CorruptJSONFileError`
+            for records given to `from_records()`. Errors of included
+            files are wrapped in `IncludedFileError`.
         """
         if self.data_object is None:
-            return None
+            if self._record_sources.get('birthdays') is None:
+                return None
+            return list(self.iter_birthdays())
         birthdays: List[List[str]] = self.data_object['birthdays']
         if birthdays is None:
             return None
         
-        bdays = []
-        err_list = []
-        for bday_values in birthdays:
-            bday = None
+        constructed: List[Birthday] = []
+        err_list: List[Exception] = []
+        for include, include_results in self._includes:
             try:
-                bday = Birthday(*bday_values)
-            except BirthdayInitGroup as err_group:
-                for err in err_group.exceptions:
-                    err_list.append(err)
-            else:
-                bdays.append(bday)
+                constructed.extend(
+                    _memoized_result(include_results['birthdays']) or ())
+            except ConstructBirthdaysGroup as err_group:
+                err_list.extend(
+                    IncludedFileError(include, err)
+                    for err in err_group.exceptions)
+        own_birthdays, errors = self._construct_birthday_chunk(birthdays)
+        constructed.extend(own_birthdays)
+        err_list.extend(err for _, err in errors)
         if len(err_list) > 0:
-            raise ConstructBirthdaysGroup('ConstructBirthdaysGroup', tuple(err_list))
-        return bdays
+            raise ConstructBirthdaysGroup(
+                'ConstructBirthdaysGroup', tuple(err_list))
+        return constructed
+
+    def iter_birthdays(self) -> Iterator[Birthday]:
+        """
+        Yield `Birthday` objects while reading the records.
+
+        The records given to `from_records()` are read in chunks, so
+        only a chunk of them is held in memory at a time. After the
+        first invalid record no more birthdays are yielded, but the
+        rest of the records are still validated. The errors are raised
+        when the records run out.
+
+        Raises
+        ------
+        ConstructBirthdaysGroup
+            The same errors as in `construct_birthdays()`.
+        """
+        if self.data_object is not None:
+            yield from self.construct_birthdays() or ()
+            return
+        if self._record_sources.get('birthdays') is None:
+            return
+        err_list: List[Exception] = []
+        for offset, chunk in _iter_chunks(self._record_sources['birthdays']):
+            rows = []
+            errors: List[Tuple[int, Exception]] = []
+            rec_errors: List[Exception] = []
+            for i, rec in enumerate(chunk):
+                self._validate_record(
+                    rec, offset + i, 'birthdays', _BIRTHDAY_FIELDS,
+                    rec_errors, _BIRTHDAY_RECORD_OPTIONS)
+                if rec_errors:
+                    errors.extend((i, err) for err in rec_errors)
+                    rec_errors.clear()
+                else:
+                    rows.append(i)
+            birthdays, chunk_errors = self._construct_birthday_chunk(
+                [chunk[i] for i in rows])
+            if chunk_errors:
+                errors.extend((rows[j], err) for j, err in chunk_errors)
+                errors.sort(key=lambda row_err: row_err[0])
+            err_list.extend(err for _, err in errors)
+            if not err_list:
+                yield from birthdays
+        if len(err_list) > 0:
+            raise ConstructBirthdaysGroup(
+                'ConstructBirthdaysGroup', tuple(err_list))
+
+    def _construct_birthday_chunk(
+            self, birthdays: Sequence[Sequence[Any]]
+            ) -> Tuple[List[Birthday], List[Tuple[int, Exception]]]:
+        # Records of the expected types are parsed as columns. The rest
+        # go through `Birthday()` for its parameter errors. The columns
+        # are checked by type as a whole, so records without options are
+        # not visited one by one.
+        date_strs: List[str] = [rec[0] for rec in birthdays]
+        names: List[str] = [rec[1] for rec in birthdays]
+        options: List[Dict[str, Any] | None] = [None] * len(birthdays)
+        others: Set[int] = set()
+        if max(map(len, birthdays), default=0) > 2:
+            for i, rec in enumerate(birthdays):
+                if len(rec) > 2:
+                    options[i] = _birthday_options(rec)
+                    if not _birthday_options_valid(options[i]):
+                        others.add(i)
+        if not {str}.issuperset(
+                map(type, itertools.chain(date_strs, names))):
+            others.update(
+                i for i, (date_str, name) in enumerate(zip(date_strs, names))
+                if not (isinstance(date_str, str) and isinstance(name, str)))
+        rows: Sequence[int] = range(len(birthdays))
+        if others:
+            rows = [i for i in rows if i not in others]
+            date_strs = [date_strs[i] for i in rows]
+            names = [names[i] for i in rows]
+            options = [options[i] for i in rows]
+        ordinals, errors = parse_dates(date_strs, names)
+        if others:
+            errors = [(rows[j], err) for j, err in errors]
+            for i in sorted(others):
+                try:
+                    Birthday(
+                        *birthdays[i][:2], **_birthday_options(birthdays[i]))
+                except BirthdayInitGroup as err_group:
+                    errors.extend((i, err) for err in err_group.exceptions)
+            errors.sort(key=lambda row_err: row_err[0])
+        if len(errors) > 0:
+            return [], errors
+
+        # Creating many objects triggers the cyclic garbage collector over
+        # and over although none of them can form cycles.
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return Birthday.from_parsed_columns(
+                date_strs, names, ordinals, options), errors
+        finally:
+            if gc_was_enabled:
+                gc.enable()
 
     def construct_time_tags(self) -> List[TimeTag] | None:
         """
@@ -161,20 +444,40 @@ class DataLoader:
         ConstructTimeTagsGroup
             The `ExceptionGroup` may contain errors
             `IncorrectParameterTypeError`, `IncorrectTimeFormatError`
-            and/or `TimeDoesntExistError`.
+            and/or `TimeDoesntExistError`, and `CorruptJSONFileError` for
+            records given to `from_records()`. Errors of included files
+            are wrapped in `IncludedFileError`.
         """
-        if self.data_object is None:
-            return None
-        time_tags: List[List[str]] = self.data_object['timeTags']
+        streamed = self.data_object is None
+        if streamed:
+            time_tags = self._record_sources.get('timeTags')
+        else:
+            time_tags = self.data_object['timeTags']
         if time_tags is None:
             return None
         
         ttags = []
         err_list = []
-        for ttag_values in time_tags:
+        for include, include_results in self._includes:
+            try:
+                ttags.extend(
+                    _memoized_result(include_results['timeTags']) or ())
+            except ConstructTimeTagsGroup as err_group:
+                err_list.extend(
+                    IncludedFileError(include, err)
+                    for err in err_group.exceptions)
+        for list_i, ttag_values in enumerate(time_tags):
+            if streamed:
+                err_count = len(err_list)
+                self._validate_record(
+                    ttag_values, list_i, 'timeTags', _TIME_TAG_FIELDS,
+                    err_list, _TIME_TAG_RECORD_OPTIONS)
+                if len(err_list) > err_count:
+                    continue
             ttag = None
+            options = ttag_values[3] if len(ttag_values) > 3 else {}
             try:
-                ttag = TimeTag(*ttag_values)
+                ttag = TimeTag(*ttag_values[:3], **options)
             except TimeTagInitGroup as err_group:
                 for err in err_group.exceptions:
                     err_list.append(err)
@@ -184,3 +487,108 @@ class DataLoader:
         if len(err_list) > 0:
             raise ConstructTimeTagsGroup('ConstructTimeTagsGroup', tuple(err_list))
         return ttags
+
+
+def open_data_file(
+        path: str, mode: str = 'r', encoding: str = 'utf-8',
+        newline: str | None = None
+        ) -> TextIO:
+    """
+    Open a data file as text, decompressing it if it is compressed.
+
+    Files with suffix '.gz' are opened with `gzip` and files with suffix
+    '.xz' with `lzma`, e.g. 'time_tag_birthday.json.gz'. The data is
+    decompressed in blocks while it is read.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file.
+    mode : str, default 'r'
+        'r' for reading or 'w' for writing.
+    encoding : str, default 'utf-8'
+        Encoding of the text.
+    newline : str, optional
+        Newline mode as in `open()`.
+    """
+    opener = _COMPRESSED_OPENERS.get(os.path.splitext(path)[1].lower(), open)
+    return opener(path, mode + 't', encoding=encoding, newline=newline)
+
+
+def _load_include(
+        path: str) -> Tuple[_IncludeResults | None, List[Exception]]:
+    """
+    Return the constructed records of included file `path` and its
+    errors.
+
+    Runs on the include thread pool. The records are constructed here,
+    so that the files are validated in parallel, and only the results
+    are kept in the include cache, not the parsed JSON of the file.
+    """
+    try:
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        with _include_cache_lock:
+            cached = _include_cache.pop(path, None)
+            if cached is not None and cached[0] == signature:
+                _include_cache[path] = cached
+                return cached[1], []
+        with open_data_file(path) as fp:
+            data_loader = DataLoader(fp, path, included=True)
+        include_results: _IncludeResults = {}
+        for key, construct in (
+                ('birthdays', data_loader.construct_birthdays),
+                ('timeTags', data_loader.construct_time_tags)):
+            try:
+                include_results[key] = (construct(), None)
+            except (ConstructBirthdaysGroup,
+                    ConstructTimeTagsGroup) as err_group:
+                include_results[key] = (None, err_group)
+        with _include_cache_lock:
+            _include_cache[path] = (signature, include_results)
+            while len(_include_cache) > _MAX_INCLUDE_CACHE_SIZE:
+                del _include_cache[next(iter(_include_cache))]
+    except DataLoaderInitGroup as err_group:
+        return None, list(err_group.exceptions)
+    except OSError as err:
+        with _include_cache_lock:
+            _include_cache.pop(path, None)
+        return None, [CorruptJSONFileError(
+            f'Could not read file: {err.strerror or err}')]
+    return include_results, []
+
+
+def _memoized_result(result: Tuple[Any, ExceptionGroup | None]) -> Any:
+    value, err_group = result
+    if err_group is not None:
+        raise err_group
+    return value
+
+
+def _birthday_options(rec: Sequence[Any]) -> Dict[str, Any]:
+    """Return the options of a birthday record as `Birthday` arguments."""
+    if len(rec) <= 2:
+        return {}
+    return {_BIRTHDAY_OPTIONS[key]: value for key, value in rec[2].items()}
+
+
+def _birthday_options_valid(options: Dict[str, Any]) -> bool:
+    return (
+        options.get('notify_days', 0) >= 0
+        and all(isinstance(group, str) for group in options.get('groups', ()))
+        and options.get('event_type', 'birthday') in EVENT_TYPES
+        )
+
+
+def _iter_chunks(
+        records: Iterable[Sequence[Any]]
+        ) -> Iterator[Tuple[int, List[Sequence[Any]]]]:
+    """Yield (index of first record, list of records) in chunks."""
+    iterator = iter(records)
+    offset = 0
+    while True:
+        chunk = list(itertools.islice(iterator, _RECORD_CHUNK_SIZE))
+        if not chunk:
+            return
+        yield offset, chunk
+        offset += len(chunk)
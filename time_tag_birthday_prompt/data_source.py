@@ -0,0 +1,81 @@
+"""
+Define the protocols of the data sources of `PrimaryPrompt`.
+
+`DataLoader` and `BirthdayStore` implement them, but any object with
+the same attributes and methods can be given to `PrimaryPrompt` as its
+`data_loader`.
+
+"""
+
+from datetime import date
+from typing import AbstractSet, List, Protocol, runtime_checkable
+
+from .birthday import Birthday
+from .time_tag import TimeTag
+
+
+@runtime_checkable
+class DataSource(Protocol):
+    """
+    Protocol of a source of birthdays and time tags.
+
+    Attributes
+    ----------
+    birthdays_disabled : bool
+        True if birthday notifications are turned off, i.e., the
+        birthdays are null in the data.
+    """
+
+    birthdays_disabled: bool
+
+    def construct_birthdays(self) -> List[Birthday] | None:
+        """
+        Construct list of `Birthday` objects, or None if the birthdays
+        are null.
+
+        Raises `ConstructBirthdaysGroup` if records are invalid.
+        """
+        ...
+
+    def construct_time_tags(self) -> List[TimeTag] | None:
+        """
+        Construct list of `TimeTag` objects, or None if the time tags
+        are null.
+
+        Raises `ConstructTimeTagsGroup` if records are invalid.
+        """
+        ...
+
+
+@runtime_checkable
+class WindowedDataSource(DataSource, Protocol):
+    """
+    Protocol of a data source that can be queried for the birthdays of
+    a window of days, such as `BirthdayStore`.
+
+    `BirthdayNotifier` reads only the birthdays of its notification
+    window from such a source.
+    """
+
+    def has_birthdays(self) -> bool:
+        """Return True if the source has any birthdays."""
+        ...
+
+    def max_notify_days(self, default: int) -> int:
+        """
+        Return the longest notify horizon of the birthdays, counting
+        `default` for the birthdays without their own notify days.
+        """
+        ...
+
+    def birthday_window(
+            self, first: date, days: int,
+            groups: AbstractSet[str] | None = None
+            ) -> List[Birthday]:
+        """
+        Return at least the birthdays celebrated within `days` days from
+        `first`, including birthdays on 29 February when 28 February of
+        a common year is within the window. If `groups` is given, only
+        the birthdays with any of these group labels are returned.
+        """
+        ...
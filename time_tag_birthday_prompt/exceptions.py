@@ -65,6 +65,49 @@ class BirthdayNotifyDaysLessThanZeroError(Exception):
             )
 
 
+class BirthdayLimitLessThanOneError(Exception):
+    def __init__(self, param_name: str, value: int):
+        self.param_name = param_name
+        self.value = value
+
+    def __str__(self):
+        return (
+            f"Parameter '{self.param_name}' value {self.value} is less than "
+            'one.'
+            )
+
+
+class TimeZoneNotFoundError(Exception):
+    def __init__(self, time_zone: str):
+        self.time_zone = time_zone
+
+    def __str__(self):
+        return f"Parameter 'time_zone' value {self.time_zone!r} is not found."
+
+
+# Exceptions raised by importers
+
+
+class ImportColumnMissingError(Exception):
+    def __init__(self, column: str):
+        self.column = column
+
+    def __str__(self):
+        return f"Column {self.column!r} missing from CSV header."
+
+
+# Exceptions raised by compiled data files
+
+
+class CompiledDataFileError(Exception):
+    def __init__(self, path: str, msg: str):
+        self.path = path
+        self.msg = msg
+
+    def __str__(self):
+        return f'Could not read compiled data file {self.path}: {self.msg}'
+
+
 # Internally handled JSON exceptions
 
 
@@ -88,6 +131,15 @@ class CorruptJSONFileError(Exception):
         return f'{self.msg}'
 
 
+class IncludedFileError(Exception):
+    def __init__(self, include: str, error: Exception):
+        self.include = include
+        self.error = error
+
+    def __str__(self):
+        return f'{self.include}: {self.error}'
+
+
 class ConstructBirthdaysGroup(ExceptionGroup):
     pass
 
@@ -132,6 +184,30 @@ class DateDoesntExistError(Exception):
             )
 
 
+class NotifyDaysLessThanZeroError(Exception):
+    def __init__(self, notify_days: int, name: str):
+        self.notify_days = notify_days
+        self.name = name
+    
+    def __str__(self):
+        return (
+            f"Notify days {self.notify_days} for '{self.name}' is less than "
+            "zero."
+            )
+
+
+class UnknownEventTypeError(Exception):
+    def __init__(self, event_type: str, name: str):
+        self.event_type = event_type
+        self.name = name
+    
+    def __str__(self):
+        return (
+            f"Unknown event type '{self.event_type}' for '{self.name}'. "
+            "Expected birthday, anniversary, nameday or deadline."
+            )
+
+
 class ConstructTimeTagsGroup(ExceptionGroup):
     pass
 
@@ -149,7 +225,7 @@ class IncorrectTimeFormatError(Exception):
     def __str__(self):
         return (
             f"Incorrect {self.field_name} time format '{self.time_value}' for "
-            f"tag '{self.tag_text}'. Expected HH:MM."
+            f"tag '{self.tag_text}'. Expected HH:MM or HH:MM:SS."
             )
 
 
@@ -164,3 +240,27 @@ class TimeDoesntExistError(Exception):
             f"Incorrect numeric values in {self.field_name} time "
             f"'{self.time_value}' for '{self.tag_text}'."
             )
+
+
+class IncorrectWeekdaysError(Exception):
+    def __init__(self, weekdays: str, tag_text: str):
+        self.weekdays = weekdays
+        self.tag_text = tag_text
+    
+    def __str__(self):
+        return (
+            f"Incorrect weekdays '{self.weekdays}' for tag '{self.tag_text}'. "
+            f"Expected e.g. 'Mon-Fri' or 'Sat,Sun'."
+            )
+
+
+class IncorrectDateRangeError(Exception):
+    def __init__(self, dates: str, tag_text: str):
+        self.dates = dates
+        self.tag_text = tag_text
+    
+    def __str__(self):
+        return (
+            f"Incorrect dates '{self.dates}' for tag '{self.tag_text}'. "
+            f"Expected MM-DD..MM-DD or YYYY-MM-DD..YYYY-MM-DD."
+            )
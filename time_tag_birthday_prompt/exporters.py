@@ -0,0 +1,171 @@
+"""
+Define exporters that write birthdays into other file formats.
+
+The exporters take an iterable of `Birthday` objects, such as
+`DataLoader.iter_birthdays()`, and write each birthday as soon as it is
+read, so a large data file is exported in constant memory.
+
+"""
+
+from datetime import date, datetime, timezone
+from typing import Iterable, Iterator, TextIO, Tuple
+import calendar
+import hashlib
+
+from . import package_name
+from .birthday import EVENT_TYPES, Birthday
+
+# Year of birthdays without a year in iCalendar files. It is a leap year
+# and marked with parameter X-APPLE-OMIT-YEAR, as in Apple's calendars.
+OMIT_YEAR = 1604
+# Property of the event type of events other than birthdays.
+EVENT_TYPE_PROPERTY = 'X-TTBP-EVENT-TYPE'
+
+_MAX_LINE_OCTETS = 75
+
+
+def write_ical(
+        birthdays: Iterable[Birthday], file_obj: TextIO,
+        years: int | None = None, first_year: int | None = None,
+        stamp: datetime | None = None
+        ) -> int:
+    """
+    Write birthdays into an iCalendar file as all-day events and return
+    the number of events written.
+
+    By default each birthday is one event recurring yearly. Birthdays on
+    29 February recur on the last day of February, i.e., on 28 February
+    in common years as in the birthday notifications. Birthdays without
+    a year start in year 1604 marked with parameter X-APPLE-OMIT-YEAR.
+    The name is the summary, the groups are the categories and event
+    types other than birthday are in property X-TTBP-EVENT-TYPE, so the
+    file can be read back with `read_ical_records()`. The UID of an event
+    is derived from the position, date and name of the birthday, so it
+    stays the same when the same data is exported again.
+
+    With `years` the birthdays are expanded into one event per year,
+    with the age turned in the summary for event types that show it,
+    for calendars that do not support recurrence rules.
+
+    Parameters
+    ----------
+    birthdays : iterable of Birthday
+        Birthdays to write, e.g. `DataLoader.iter_birthdays()`.
+    file_obj : file object
+        Text file to write to, opened with `newline=''`.
+    years : int, optional
+        Expand the birthdays into occurrences over this many years.
+    first_year : int, optional
+        First year of the expanded occurrences. Defaults to the current
+        year.
+    stamp : datetime, optional
+        Creation time of the events. Defaults to the current time.
+    """
+    if stamp is None:
+        stamp = datetime.now(timezone.utc)
+    if first_year is None:
+        first_year = date.today().year
+    stamp_str = stamp.astimezone(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+    write = file_obj.write
+    write(f'BEGIN:VCALENDAR\r\nVERSION:2.0\r\n'
+          f'PRODID:-//{package_name}//Birthdays//EN\r\n'
+          f'CALSCALE:GREGORIAN\r\n')
+    count = 0
+    for position, bday in enumerate(birthdays):
+        uid = _uid(bday, position)
+        if years is None:
+            events = [_recurring_event(bday, uid)]
+        else:
+            events = _expanded_events(bday, uid, first_year, years)
+        properties = ''
+        if bday.groups:
+            properties = _fold('CATEGORIES:' + ','.join(
+                _escape(group) for group in bday.groups)) + '\r\n'
+        if bday.event_type != 'birthday':
+            properties += f'{EVENT_TYPE_PROPERTY}:{bday.event_type}\r\n'
+        # Only the summary and the categories can be longer than a line.
+        for event_uid, dtstart, summary, rrule in events:
+            write(
+                f'BEGIN:VEVENT\r\nUID:{event_uid}@{package_name}\r\n'
+                f'DTSTAMP:{stamp_str}\r\n{dtstart}\r\n'
+                + (rrule + '\r\n' if rrule else '')
+                + _fold('SUMMARY:' + _escape(summary)) + '\r\n'
+                + properties + 'TRANSP:TRANSPARENT\r\nEND:VEVENT\r\n'
+                )
+            count += 1
+    write('END:VCALENDAR\r\n')
+    return count
+
+
+def _recurring_event(
+        bday: Birthday, uid: str) -> Tuple[str, str, str, str]:
+    date_obj = bday.date_obj
+    if date_obj.year == date.min.year:
+        dtstart = (
+            f'DTSTART;VALUE=DATE;X-APPLE-OMIT-YEAR={OMIT_YEAR}:'
+            f'{OMIT_YEAR}{date_obj:%m%d}'
+            )
+    else:
+        dtstart = f'DTSTART;VALUE=DATE:{date_obj.year:04}{date_obj:%m%d}'
+    rrule = 'RRULE:FREQ=YEARLY'
+    if date_obj.month == 2 and date_obj.day == 29:
+        rrule += ';BYMONTH=2;BYMONTHDAY=-1'
+    return uid, dtstart, bday.name, rrule
+
+
+def _expanded_events(
+        bday: Birthday, uid: str, first_year: int, years: int
+        ) -> Iterator[Tuple[str, str, str, str]]:
+    date_obj = bday.date_obj
+    has_year = date_obj.year != date.min.year
+    age_format = EVENT_TYPES[bday.event_type].age_format
+    for year in range(first_year, first_year + years):
+        if has_year and year < date_obj.year:
+            continue
+        day = date_obj.day
+        if date_obj.month == 2 and day == 29 and not calendar.isleap(year):
+            day = 28
+        summary = bday.name
+        if has_year and age_format and year > date_obj.year:
+            summary += f' ({age_format.format(year - date_obj.year)})'
+        yield (
+            f'{uid}-{year}',
+            f'DTSTART;VALUE=DATE:{year:04}{date_obj.month:02}{day:02}',
+            summary, ''
+            )
+
+
+def _uid(bday: Birthday, position: int) -> str:
+    """
+    Return a UID that stays the same when the data is exported again.
+    The position tells apart duplicate records of the same date and name.
+    """
+    return hashlib.sha1(
+        f'{position}\0{bday.date}\0{bday.name}'.encode('utf-8')).hexdigest()
+
+
+def _escape(text: str) -> str:
+    return (
+        text.replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,')
+        .replace('\r\n', '\\n').replace('\n', '\\n')
+        )
+
+
+def _fold(line: str) -> str:
+    """Fold `line` into lines of at most 75 octets."""
+    if (len(line) <= _MAX_LINE_OCTETS
+            and len(line.encode('utf-8')) <= _MAX_LINE_OCTETS):
+        return line
+    parts = []
+    octets = 0
+    start = 0
+    for i, c in enumerate(line):
+        size = len(c.encode('utf-8'))
+        if octets + size > _MAX_LINE_OCTETS - (1 if parts else 0):
+            parts.append(line[start:i])
+            start = i
+            octets = 0
+        octets += size
+    parts.append(line[start:])
+    return '\r\n '.join(parts)
@@ -0,0 +1,304 @@
+"""
+Define readers that stream birthday records from CSV, vCard and
+iCalendar files.
+
+The readers yield records in the format of the JSON array 'birthdays',
+e.g. ('1980-07-15', 'Name', {'groups': ['family']}), one record at a
+time. They are meant to be given to `DataLoader.from_records()`, which
+validates the records with the same errors as JSON data. Values are
+passed on as they are when they cannot be converted, so that the
+validation reports them.
+
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+import csv
+import os.path
+import re
+
+from .data_loader import compressed_suffixes, open_data_file
+from .exceptions import ImportColumnMissingError
+
+Record = Tuple[Any, ...]
+
+_ESCAPE_RE = re.compile(r'\\(.)')
+_LIST_SEPARATOR_RE = re.compile(r'(?<!\\),')
+_BASIC_DATE_RE = re.compile(r'(\d{4})(\d{2})(\d{2})')
+_NO_YEAR_DATE_RE = re.compile(r'--(\d{2})-?(\d{2})')
+
+
+def read_csv_records(
+        file_obj: Iterable[str], date_column: str = 'date',
+        name_column: str = 'name', notify_days_column: str = 'notifyDays',
+        groups_column: str = 'groups', group_separator: str = ';'
+        ) -> Iterator[Record]:
+    """
+    Yield birthday records from the rows of a CSV file with a header.
+
+    Columns for notify days and groups are optional. Empty values are
+    left out of the record options.
+
+    Parameters
+    ----------
+    file_obj : iterable of str
+        CSV file object, opened with `newline=''`.
+    date_column : str, default 'date'
+        Column of the dates in format YYYY-MM-DD or MM-DD.
+    name_column : str, default 'name'
+        Column of the names.
+    notify_days_column : str, default 'notifyDays'
+        Column of the notify days.
+    groups_column : str, default 'groups'
+        Column of the group labels.
+    group_separator : str, default ';'
+        Separator of the group labels within the column.
+
+    Raises
+    ------
+    ImportColumnMissingError
+        The date or name column is missing from the header.
+    """
+    reader = csv.reader(file_obj)
+    header = next(reader, [])
+    columns = {}
+    for key, column, required in (
+            ('date', date_column, True), ('name', name_column, True),
+            ('notifyDays', notify_days_column, False),
+            ('groups', groups_column, False)):
+        if column in header:
+            columns[key] = header.index(column)
+        elif required:
+            raise ImportColumnMissingError(column)
+    date_i, name_i = columns.pop('date'), columns.pop('name')
+
+    for row in reader:
+        if not row:
+            continue
+        values = [row[i] if i < len(row) else '' for i in range(len(header))]
+        options: Dict[str, Any] = {}
+        notify_days_i = columns.get('notifyDays')
+        if notify_days_i is not None and values[notify_days_i].strip():
+            options['notifyDays'] = _to_int(values[notify_days_i].strip())
+        groups_i = columns.get('groups')
+        if groups_i is not None and values[groups_i].strip():
+            options['groups'] = [
+                group.strip()
+                for group in values[groups_i].split(group_separator)
+                if group.strip()
+                ]
+        yield _record(values[date_i].strip(), values[name_i], options)
+
+
+def read_vcard_records(file_obj: Iterable[str]) -> Iterator[Record]:
+    """
+    Yield birthday records from the contacts of a vCard file.
+
+    Contacts without a birthday (BDAY) are skipped. The name is taken
+    from FN, or from N if there is no FN, and the groups from
+    CATEGORIES. Birthdays without a year, e.g. '--0715', become dates in
+    format MM-DD.
+
+    Parameters
+    ----------
+    file_obj : iterable of str
+        vCard file object with one or more contacts.
+    """
+    card: Dict[str, Tuple[Dict[str, str], str]] | None = None
+    for name, params, value in _iter_content_lines(file_obj):
+        if name == 'BEGIN' and value.upper() == 'VCARD':
+            card = {}
+        elif name == 'END' and value.upper() == 'VCARD':
+            if card is not None and 'BDAY' in card:
+                yield _vcard_record(card)
+            card = None
+        elif card is not None and name not in card:
+            card[name] = (params, value)
+
+
+def read_ical_records(file_obj: Iterable[str]) -> Iterator[Record]:
+    """
+    Yield birthday records from the yearly events of an iCalendar file.
+
+    Events without a yearly recurrence rule are skipped. The name is
+    taken from SUMMARY, the date from DTSTART, the groups from
+    CATEGORIES and the event type from X-TTBP-EVENT-TYPE. Dates whose
+    year is marked with X-APPLE-OMIT-YEAR, as written by `write_ical()`,
+    become dates in format MM-DD.
+
+    Parameters
+    ----------
+    file_obj : iterable of str
+        iCalendar file object.
+    """
+    event: Dict[str, Tuple[Dict[str, str], str]] | None = None
+    for name, params, value in _iter_content_lines(file_obj):
+        if name == 'BEGIN' and value.upper() == 'VEVENT':
+            event = {}
+        elif name == 'END' and value.upper() == 'VEVENT':
+            if event is not None and _is_yearly(event):
+                options = {}
+                if 'CATEGORIES' in event:
+                    options['groups'] = _split_list(event['CATEGORIES'][1])
+                if 'X-TTBP-EVENT-TYPE' in event:
+                    options['type'] = _unescape(
+                        event['X-TTBP-EVENT-TYPE'][1]).strip()
+                params, dtstart = event.get('DTSTART', ({}, ''))
+                yield _record(
+                    _omit_year(params, _convert_date(dtstart)),
+                    _unescape(event.get('SUMMARY', ({}, ''))[1]), options)
+            event = None
+        elif event is not None and name not in event:
+            event[name] = (params, value)
+
+
+def iter_file_records(path: str) -> Iterator[Record]:
+    """
+    Yield birthday records from a CSV, vCard or iCalendar file.
+
+    The reader is chosen by the suffix of `path`: '.csv', '.vcf' or
+    '.ics', optionally followed by '.gz' or '.xz' for compressed files.
+    The file is opened when the first record is read and closed when
+    the records run out.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file.
+
+    Raises
+    ------
+    ValueError
+        The suffix of `path` is not known.
+    """
+    root, suffix = os.path.splitext(path.lower())
+    if suffix in compressed_suffixes:
+        suffix = os.path.splitext(root)[1]
+    if suffix not in _READERS:
+        raise ValueError(f'unknown birthday file suffix {suffix!r}')
+    return _iter_file_records(path, _READERS[suffix])
+
+
+def _iter_file_records(path: str, reader: Any) -> Iterator[Record]:
+    with open_data_file(path, encoding='utf-8-sig', newline='') as fp:
+        yield from reader(fp)
+
+
+_READERS = {
+    '.csv': read_csv_records,
+    '.vcf': read_vcard_records,
+    '.ics': read_ical_records,
+    }
+import_suffixes = tuple(
+    suffix + compression
+    for suffix in _READERS for compression in ('',) + compressed_suffixes
+    )
+
+
+def _iter_content_lines(
+        file_obj: Iterable[str]) -> Iterator[Tuple[str, Dict[str, str], str]]:
+    """
+    Yield (name, parameters, value) of the unfolded content lines of a
+    vCard or iCalendar file.
+    """
+    pending = None
+    for line in file_obj:
+        line = line.rstrip('\r\n')
+        if line[:1] in (' ', '\t'):
+            if pending is not None:
+                pending += line[1:]
+            continue
+        if pending:
+            yield _parse_content_line(pending)
+        pending = line
+    if pending:
+        yield _parse_content_line(pending)
+
+
+def _parse_content_line(line: str) -> Tuple[str, Dict[str, str], str]:
+    in_quotes = False
+    for i, c in enumerate(line):
+        if c == '"':
+            in_quotes = not in_quotes
+        elif c == ':' and not in_quotes:
+            break
+    else:
+        return line.upper(), {}, ''
+    name, *param_strs = line[:i].split(';')
+    params = {}
+    for param in param_strs:
+        key, _, value = param.partition('=')
+        params[key.upper()] = value.strip('"')
+    # Drop the group prefix of names such as 'item1.BDAY'.
+    name = name.rpartition('.')[2].upper()
+    return name, params, line[i+1:]
+
+
+def _vcard_record(card: Dict[str, Tuple[Dict[str, str], str]]) -> Record:
+    params, bday = card['BDAY']
+    date_str = _omit_year(params, _convert_date(bday))
+
+    name: str | None = None
+    if 'FN' in card:
+        name = _unescape(card['FN'][1])
+    elif 'N' in card:
+        parts = [_unescape(part) for part in re.split(
+            r'(?<!\\);', card['N'][1])]
+        family, given = (parts + ['', ''])[:2]
+        name = ' '.join(part for part in (given, family) if part)
+    options = {}
+    if 'CATEGORIES' in card:
+        options['groups'] = _split_list(card['CATEGORIES'][1])
+    return _record(date_str, name, options)
+
+
+def _record(date_str: Any, name: Any, options: Dict[str, Any]) -> Record:
+    if options:
+        return (date_str, name, options)
+    return (date_str, name)
+
+
+def _convert_date(value: str) -> str:
+    """
+    Convert vCard and iCalendar dates, e.g. '19800715', '1980-07-15',
+    '--0715' or '19800715T000000', to format YYYY-MM-DD or MM-DD.
+    """
+    value = value.strip().partition('T')[0]
+    match = _BASIC_DATE_RE.fullmatch(value)
+    if match:
+        return '-'.join(match.groups())
+    match = _NO_YEAR_DATE_RE.fullmatch(value)
+    if match:
+        return '-'.join(match.groups())
+    return value
+
+
+def _omit_year(params: Dict[str, str], date_str: str) -> str:
+    omit_year = params.get('X-APPLE-OMIT-YEAR')
+    if omit_year and date_str.startswith(omit_year + '-'):
+        return date_str[len(omit_year) + 1:]
+    return date_str
+
+
+def _is_yearly(event: Dict[str, Tuple[Dict[str, str], str]]) -> bool:
+    rule = event.get('RRULE', ({}, ''))[1].upper()
+    return 'FREQ=YEARLY' in rule.split(';')
+
+
+def _split_list(value: str) -> List[str]:
+    return [
+        _unescape(item).strip() for item in _LIST_SEPARATOR_RE.split(value)
+        if item.strip()
+        ]
+
+
+def _unescape(value: str) -> str:
+    return _ESCAPE_RE.sub(
+        lambda match: '\n' if match.group(1) in 'nN' else match.group(1),
+        value)
+
+
+def _to_int(value: str) -> int | str:
+    try:
+        return int(value)
+    except ValueError:
+        return value
@@ -0,0 +1,203 @@
+"""
+Define parsers for the date and time strings of the JSON data.
+
+The single value parsers `parse_date()` and `parse_time()` are used by
+`Birthday` and `TimeTag`. The batch parsers `parse_dates()` and
+`parse_times()` convert whole columns of strings into integer arrays,
+e.g. for `DataLoader`. Both share the same error classification.
+
+"""
+
+from array import array
+from typing import List, Sequence, Tuple
+import datetime
+
+from .exceptions import (
+    IncorrectDateFormatError, NullYearError, DateDoesntExistError,
+    IncorrectTimeFormatError, TimeDoesntExistError
+    )
+
+_NULL_YEAR = datetime.date.min.year
+_NULL_YEAR_DAYS = 365
+_NULL_YEAR_PREFIX = f'{_NULL_YEAR:04}-'
+
+DateColumns = Tuple[array, List[Tuple[int, Exception]]]
+TimeColumns = Tuple[array, array, List[Tuple[int, Exception]]]
+
+
+def parse_date(
+        date_str: str, name: str, err_list: List[Exception]
+        ) -> datetime.date | None:
+    """
+    Parse `date_str` in format YYYY-MM-DD or MM-DD.
+
+    Returns None and appends an error to `err_list` if the string is
+    not a valid date. Dates without a year get year
+    `datetime.date.min.year`.
+
+    Parameters
+    ----------
+    date_str : str
+        Date string to be parsed.
+    name : str
+        Name of the birthday, used in error messages.
+    err_list : list of Exception
+        List to append the `IncorrectDateFormatError`, `NullYearError`
+        or `DateDoesntExistError` to.
+    """
+    # Well-formed dates are handled without splitting the string. Any
+    # string the fast path rejects is classified by the general path.
+    try:
+        if len(date_str) == 10 and date_str[4] == date_str[7] == '-':
+            date_obj = datetime.date.fromisoformat(date_str)
+            if date_obj.year != _NULL_YEAR:
+                return date_obj
+        elif len(date_str) == 5 and date_str[2] == '-':
+            return datetime.date(
+                _NULL_YEAR, int(date_str[:2]), int(date_str[3:]))
+    except ValueError:
+        pass
+
+    date_parts = date_str.split('-', 2)
+    try:
+        date_parts = [int(pt) for pt in date_parts]
+    except ValueError:
+        err_list.append(IncorrectDateFormatError(date_str, name))
+        return None
+
+    if len(date_parts) == 3:
+        if date_parts[0] == _NULL_YEAR:
+            err_list.append(NullYearError(date_str, name, _NULL_YEAR))
+            return None
+    elif len(date_parts) == 2:
+        date_parts.insert(0, _NULL_YEAR)
+    else:
+        err_list.append(IncorrectDateFormatError(date_str, name))
+        return None
+
+    try:
+        return datetime.date(*date_parts)
+    except (ValueError, OverflowError):
+        err_list.append(DateDoesntExistError(date_str, name))
+        return None
+
+
+def parse_dates(
+        date_strs: Sequence[str], names: Sequence[str]) -> DateColumns:
+    """
+    Parse a column of date strings in format YYYY-MM-DD or MM-DD.
+
+    Returns an array of proleptic Gregorian ordinals of the dates and a
+    list of (row index, error) tuples in row order. Rows that failed to
+    parse have ordinal 0. Dates without a year get year
+    `datetime.date.min.year`, i.e., ordinals from 1 to 365.
+
+    Parameters
+    ----------
+    date_strs : sequence of str
+        Date strings to be parsed.
+    names : sequence of str
+        Names of the birthdays on the same rows, used in error messages.
+    """
+    ordinals: List[int] = []
+    errors: List[Tuple[int, Exception]] = []
+    err_list: List[Exception] = []
+    append = ordinals.append
+    fromisoformat = datetime.date.fromisoformat
+    for i, date_str in enumerate(date_strs):
+        # Fast path of `parse_date()`. The separators are checked so that
+        # `fromisoformat()` does not accept other ISO 8601 formats.
+        try:
+            if len(date_str) == 10 and date_str[4] == date_str[7] == '-':
+                ordinal = fromisoformat(date_str).toordinal()
+                if ordinal > _NULL_YEAR_DAYS:
+                    append(ordinal)
+                    continue
+            elif len(date_str) == 5 and date_str[2] == '-':
+                append(fromisoformat(_NULL_YEAR_PREFIX + date_str).toordinal())
+                continue
+        except ValueError:
+            pass
+
+        date_obj = parse_date(date_str, names[i], err_list)
+        if date_obj is None:
+            errors.append((i, err_list.pop()))
+            append(0)
+        else:
+            append(date_obj.toordinal())
+    return array('l', ordinals), errors
+
+
+def parse_time(
+        field_name: str, time_value: str, text: str,
+        err_list: List[Exception]
+        ) -> Tuple[int, ...] | None:
+    """
+    Parse `time_value` in format HH:MM or HH:MM:SS.
+
+    Returns a tuple of (hours, minutes) or (hours, minutes, seconds), or
+    None after appending an error to `err_list` if the string is not a
+    valid time.
+
+    Parameters
+    ----------
+    field_name : str
+        Name of the field, used in error messages.
+    time_value : str
+        Time string to be parsed.
+    text : str
+        Text of the time tag, used in error messages.
+    err_list : list of Exception
+        List to append the `IncorrectTimeFormatError` or
+        `TimeDoesntExistError` to.
+    """
+    sp = time_value.split(':', 2)
+    if len(sp) == 1:
+        err_list.append(IncorrectTimeFormatError(field_name, time_value, text))
+        return None
+
+    try:
+        time_tuple = tuple(int(pt) for pt in sp)
+    except ValueError:
+        err_list.append(IncorrectTimeFormatError(field_name, time_value, text))
+        return None
+
+    h, m, s = (time_tuple + (0,))[:3]
+    if h < 0 or h > 23 or m < 0 or m > 59 or s < 0 or s > 59:
+        err_list.append(TimeDoesntExistError(field_name, time_value, text))
+        return None
+    return time_tuple
+
+
+def parse_times(
+        field_name: str, time_values: Sequence[str], texts: Sequence[str]
+        ) -> TimeColumns:
+    """
+    Parse a column of time strings in format HH:MM or HH:MM:SS.
+
+    Returns an array of seconds since midnight, an array of the number
+    of parts in each string (2 or 3), and a list of (row index, error)
+    tuples in row order. Rows that failed to parse have both values 0.
+
+    Parameters
+    ----------
+    field_name : str
+        Name of the column, used in error messages.
+    time_values : sequence of str
+        Time strings to be parsed.
+    texts : sequence of str
+        Texts of the time tags on the same rows, used in error messages.
+    """
+    seconds = array('l', bytes(array('l').itemsize * len(time_values)))
+    parts = array('B', bytes(len(time_values)))
+    errors: List[Tuple[int, Exception]] = []
+    err_list: List[Exception] = []
+    for i, time_value in enumerate(time_values):
+        time_tuple = parse_time(field_name, time_value, texts[i], err_list)
+        if time_tuple is None:
+            errors.append((i, err_list.pop()))
+            continue
+        seconds[i] = sum(
+            unit * value for unit, value in zip((3600, 60, 1), time_tuple))
+        parts[i] = len(time_tuple)
+    return seconds, parts, errors
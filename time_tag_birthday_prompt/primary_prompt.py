@@ -5,23 +5,30 @@ The method `get_str()` defines the output of the object.
 
 """
 
-from datetime import datetime, date
+from datetime import datetime, date, tzinfo
 from pathlib import Path
-from typing import List
+from typing import Any, Iterable, List, Sequence
 import os.path
 import shutil
 import textwrap
+import zoneinfo
 
 from .birthday_notifier import BirthdayNotifier
-from .data_loader import DataLoader
+from .data_loader import DataLoader, open_data_file
+from .data_source import DataSource
 from .exceptions import (
     ConstructTimeTagsGroup, IncorrectParameterTypeError,
     BirthdayNotifyDaysLessThanZeroError, LineWidthLessThanTenError,
-    DataLoaderInitGroup
+    DataLoaderInitGroup, TimeZoneNotFoundError, BirthdayLimitLessThanOneError,
+    CompiledDataFileError
     )
 from .time_tag import TimeTag
+from .time_tag_schedule import TimeTagSchedule
+from .zone_clock import ZoneClock
 
 sample_json_path = str(Path(__file__).parent / 'sample_time_tag_birthday.json')
+sqlite_suffixes = ('.sqlite', '.sqlite3', '.db')
+compiled_suffixes = ('.ttbp',)
 
 
 class PrimaryPrompt:
@@ -37,16 +44,26 @@ class PrimaryPrompt:
     Attributes
     ----------
     birthday_notifier
+    time_tag_schedule
     default_prompt
     tag_end_prompt
     line_width
+    time_zone
+    messages
+    load_failed
 
     Methods
     -------
     print_birthdays
         Print the list of birthdays.
+    find_birthdays
+        Return the birthdays whose name starts with a prefix.
     print_time_tags
         Print the list of time tags.
+    get_time_tags_bulk
+        Resolve the time tag text for every timestamp in one pass.
+    now
+        Return the current time in the time zone of the prompt.
     time_machine
         Print birthday notifications from another date.
     """
@@ -58,7 +75,12 @@ class PrimaryPrompt:
             default_prompt: str = '>>> ',
             tag_end_prompt: str = '> ',
             line_width: int = 70,
-            data_loader: DataLoader | None = None
+            data_loader: DataSource | None = None,
+            time_zone: str | tzinfo | None = None,
+            birthday_max_names: int | None = None,
+            birthday_max_lines: int | None = None,
+            birthday_groups: Iterable[str] | None = None,
+            birthday_milestones: Iterable[int] | None = None
             ) -> None:
         """
         Initialize a primary prompt object.
@@ -68,6 +90,11 @@ class PrimaryPrompt:
         json_path : str, default '~/time_tag_birthday.json'
             Path to the data file for birthdays and time tags. Strings
             '~' and '~user' are replaced by the user's home directory.
+            Paths ending with '.sqlite', '.sqlite3' or '.db' are opened
+            as a `BirthdayStore` and paths ending with '.ttbp' as a
+            `CompiledDataFile`. JSON files compressed with gzip or xz,
+            e.g. '~/time_tag_birthday.json.gz', are decompressed while
+            they are read.
         birthday_notify_days : int, default 30
             How many days before the birthday a notification is shown.
         default_prompt: str, default '>>> '
@@ -76,8 +103,27 @@ class PrimaryPrompt:
             Text to be written in prompt after the time tag.
         line_width : int, default 70
             How many characters fit on one line.
-        data_loader : DataLoader, optional
-            Override `data_loader` for testing purposes.
+        data_loader : DataSource, optional
+            Override `data_loader` for testing purposes, or give another
+            data source, e.g. `DataLoader.from_records()` or an open
+            `BirthdayStore` or `CompiledDataFile`.
+        time_zone : str or tzinfo, optional
+            Time zone for time tags and the date of birthday reminders,
+            such as 'Europe/Helsinki'. By default the local time of the
+            system is used.
+        birthday_max_names : int, optional
+            Maximum number of names in the birthday notification. The
+            rest are summarized as "and N more". By default all names
+            within `birthday_notify_days` are shown.
+        birthday_max_lines : int, optional
+            Maximum number of lines in the birthday notification. Names
+            that do not fit are summarized as "and N more".
+        birthday_groups : set of str, optional
+            Only notify of birthdays with any of these group labels,
+            such as {'family'}. By default all birthdays are notified of.
+        birthday_milestones : set of int, optional
+            Ages to highlight in the birthday notification, such as
+            {50, 60}. A birthday turning 60 is shown as 'Name (60!)'.
         
         Raises
         ------
@@ -85,8 +131,13 @@ class PrimaryPrompt:
             Any of the parameter values have unexpected type.
         BirthdayNotifyDaysLessThanZeroError
             Raised when parameter `birthday_notify_days` is less than 0.
+        BirthdayLimitLessThanOneError
+            Raised when parameter `birthday_max_names` or
+            `birthday_max_lines` is less than one.
         LineWidthLessThanTenError
             Raised when parameter `line_width` is less than ten.
+        TimeZoneNotFoundError
+            Raised when parameter `time_zone` is not a known time zone.
         OSError
             Raised if JSON file could not be read or created.
         """
@@ -100,16 +151,41 @@ class PrimaryPrompt:
         """Text to be written in prompt after the time tag."""
         self.line_width = line_width
         """How many characters fit on one line."""
+        self.time_zone: tzinfo | None = None
+        """Time zone of the prompt or None for the system local time."""
+        self.load_failed = False
+        """True if the data file could not be read or has invalid
+        birthdays or time tags.
+        """
 
         self.time_tags: List[TimeTag] | None = None
+        self.time_tag_schedule: TimeTagSchedule
+        """Time tags compiled for looking up the active tag and the
+        next change of the prompt text.
+        """
         self._messages: List[str] = []
-        self._last_prompt_date = date.today()
+        self._zone_clock: ZoneClock | None = None
         self._print_init = True
         
-        if not (isinstance(data_loader, DataLoader) or data_loader is None):
+        if isinstance(time_zone, str):
+            try:
+                time_zone = zoneinfo.ZoneInfo(time_zone)
+            except (zoneinfo.ZoneInfoNotFoundError, ValueError):
+                raise TimeZoneNotFoundError(time_zone) from None
+        elif not (isinstance(time_zone, tzinfo) or time_zone is None):
+            raise IncorrectParameterTypeError(
+                'time_zone', type(time_zone).__name__, 'primary prompt',
+                expected_type='string, tzinfo or None'
+                )
+        if time_zone is not None:
+            self.time_zone = time_zone
+            self._zone_clock = ZoneClock(time_zone)
+        self._last_prompt_date = self.now().date()
+        
+        if not (isinstance(data_loader, DataSource) or data_loader is None):
             raise IncorrectParameterTypeError(
                 'data_loader', type(data_loader).__name__, 'primary prompt',
-                expected_type='DataLoader or None'
+                expected_type='DataSource or None'
                 )
         if data_loader is None:
             if not isinstance(json_path, str):
@@ -118,18 +194,22 @@ class PrimaryPrompt:
                     expected_type='string'
                     )
             json_path = os.path.abspath(os.path.expanduser(json_path))
-            try:
-                data_loader = self._construct_data_loader(json_path)
-            except FileNotFoundError:
-                shutil.copy(sample_json_path, json_path)
-                self._messages.append(
-                    'Created a JSON file with sample data and using it. '
-                    f'Creation path: {json_path}'
-                    )
-                data_loader = self._construct_data_loader(json_path)
-        
-        self.birthday_notifier = BirthdayNotifier(
-            data_loader, birthday_notify_days, line_width)
+            if json_path.endswith(sqlite_suffixes):
+                data_loader = self._construct_store(json_path)
+            elif json_path.endswith(compiled_suffixes):
+                data_loader = self._construct_compiled(json_path)
+            else:
+                try:
+                    data_loader = self._construct_data_loader(json_path)
+                except FileNotFoundError:
+                    with open(sample_json_path, 'r', encoding='utf-8') as src:
+                        with open_data_file(json_path, 'w') as dst:
+                            shutil.copyfileobj(src, dst)
+                    self._messages.append(
+                        'Created a JSON file with sample data and using it. '
+                        f'Creation path: {json_path}'
+                        )
+                    data_loader = self._construct_data_loader(json_path)
         
         if not isinstance(birthday_notify_days, int):
             raise IncorrectParameterTypeError(
@@ -138,7 +218,54 @@ class PrimaryPrompt:
                 )
         elif birthday_notify_days < 0:
             raise BirthdayNotifyDaysLessThanZeroError(birthday_notify_days)
-
+        
+        for param_name, limit in (
+                ('birthday_max_names', birthday_max_names),
+                ('birthday_max_lines', birthday_max_lines)):
+            if not (isinstance(limit, int) or limit is None):
+                raise IncorrectParameterTypeError(
+                    param_name, type(limit).__name__, 'primary prompt',
+                    expected_type='integer or None'
+                    )
+            elif limit is not None and limit < 1:
+                raise BirthdayLimitLessThanOneError(param_name, limit)
+        
+        if birthday_groups is not None:
+            if (isinstance(birthday_groups, str)
+                    or not isinstance(birthday_groups, Iterable)):
+                raise IncorrectParameterTypeError(
+                    'birthday_groups', type(birthday_groups).__name__,
+                    'primary prompt', expected_type='set of strings or None'
+                    )
+            birthday_groups = frozenset(birthday_groups)
+            for group in birthday_groups:
+                if not isinstance(group, str):
+                    raise IncorrectParameterTypeError(
+                        'birthday_groups', type(group).__name__,
+                        'primary prompt', expected_type='set of strings or None'
+                        )
+        
+        if birthday_milestones is not None:
+            if not isinstance(birthday_milestones, Iterable):
+                raise IncorrectParameterTypeError(
+                    'birthday_milestones', type(birthday_milestones).__name__,
+                    'primary prompt', expected_type='set of integers or None'
+                    )
+            birthday_milestones = frozenset(birthday_milestones)
+            for age in birthday_milestones:
+                if not isinstance(age, int):
+                    raise IncorrectParameterTypeError(
+                        'birthday_milestones', type(age).__name__,
+                        'primary prompt',
+                        expected_type='set of integers or None'
+                        )
+        
+        self.birthday_notifier = BirthdayNotifier(
+            data_loader, birthday_notify_days, line_width,
+            birthday_max_names, birthday_max_lines, birthday_groups,
+            birthday_milestones
+            )
+        
         if not isinstance(default_prompt, str):
             raise IncorrectParameterTypeError(
                 'default_prompt', type(default_prompt).__name__, 'primary prompt',
@@ -163,13 +290,20 @@ class PrimaryPrompt:
             try:
                 self.time_tags = data_loader.construct_time_tags()
             except ConstructTimeTagsGroup as err_group:
+                self.load_failed = True
                 self._messages.extend([
                     str(exc) for exc in err_group.exceptions])
-        self._messages.extend(self.birthday_notifier.messages)
+        else:
+            self.load_failed = True
+        self.time_tag_schedule = TimeTagSchedule(self.time_tags)
+        if self.birthday_notifier.messages:
+            self.load_failed = True
+            self._messages.extend(self.birthday_notifier.messages)
         
         # Method aliases from BirthdayNotifier
         self.print_birthdays = self.birthday_notifier.print_birthdays
         self.time_machine = self.birthday_notifier.time_machine
+        self.find_birthdays = self.birthday_notifier.find
     
     def print_time_tags(self) -> None:
         """Print the list of time tags."""
@@ -184,11 +318,27 @@ class PrimaryPrompt:
             for tag in self.time_tags:
                 start_txt = ':'.join([f'{num:02}' for num in tag.start_tuple])
                 stop_txt = ':'.join([f'{num:02}' for num in tag.stop_tuple])
-                print(f'{start_txt} to {stop_txt}  {tag.text}{self.tag_end_prompt}')
+                when = ', '.join(
+                    [txt for txt in (tag.weekdays, tag.dates) if txt])
+                when = f'  ({when})' if when else ''
+                print(f'{start_txt} to {stop_txt}  {tag.text}{self.tag_end_prompt}{when}')
         print()
     
+    @property
+    def messages(self) -> List[str]:
+        """Messages from reading the data file, such as validation
+        errors, shown before the first prompt.
+        """
+        return list(self._messages)
+
     def __str__(self) -> str:
-        return self.get_str(datetime.now())
+        return self.get_str(self.now())
+    
+    def now(self) -> datetime:
+        """Return the current time in the time zone of the prompt."""
+        if self._zone_clock is None:
+            return datetime.now()
+        return self._zone_clock.now()
     
     def get_str(self, now: datetime):
         prolog = ''
@@ -223,33 +373,77 @@ class PrimaryPrompt:
         return '\n'.join(msg_list)
     
     def get_time_tag(self, now: datetime) -> str | None:
-        txt = None
-        if self.time_tags:
-            for tag in self.time_tags:
-                time_start = datetime(
-                    now.year, now.month, now.day, *tag.start_tuple)
-                time_stop = datetime(
-                    now.year, now.month, now.day, *tag.stop_tuple)
-                
-                if time_start < time_stop:
-                    if time_start <= now < time_stop:
-                        txt = tag.text
-                
-                elif time_start == time_stop:
-                    if now.hour == time_stop.hour and now.minute == time_stop.minute:
-                        txt = tag.text
-                
-                else:
-                    if now >= time_start or now < time_stop:
-                        txt = tag.text
-        return txt
+        tag = self.time_tag_schedule.active_at(now)
+        return tag.text if tag else None
+    
+    def get_time_tags_bulk(
+            self, timestamps: Sequence[datetime] | Any,
+            as_indices: bool = False
+            ) -> List[str | None] | Any:
+        """
+        Resolve the time tag text for every timestamp in one pass.
+
+        Parameters
+        ----------
+        timestamps : sequence of datetime or numpy.ndarray
+            Points in time. NumPy `datetime64` arrays are evaluated
+            vectorized and return NumPy arrays.
+        as_indices : bool, default False
+            Return indices to `time_tags` (-1 for no tag) instead of tag
+            texts (None for no tag).
+        """
+        owners = self.time_tag_schedule.active_bulk(timestamps)
+        if as_indices:
+            return owners
+        texts = [tag.text for tag in self.time_tag_schedule.time_tags]
+        texts.append(None)
+        if isinstance(owners, list):
+            return [texts[owner] for owner in owners]
+        import numpy as np
+        return np.array(texts, dtype=object)[owners]
     
     def _construct_data_loader(self, json_path: str) -> DataLoader | None:
         data_loader = None
-        with open(json_path, 'r', encoding='utf-8') as fp:
+        with open_data_file(json_path) as fp:
             try:
                 data_loader = DataLoader(fp, json_path)
             except DataLoaderInitGroup as err_group:
                 self._messages.extend(err_group.get_messages())
                 return None
         return data_loader
+
+    def _construct_store(self, store_path: str) -> DataSource | None:
+        # The SQLite and compiled data backends are imported only for
+        # their files, to keep them out of the interpreter startup.
+        import sqlite3
+        from .birthday_store import BirthdayStore
+        created = not os.path.exists(store_path)
+        try:
+            store = BirthdayStore(store_path)
+        except sqlite3.DatabaseError as err:
+            self._messages.append(
+                f'Could not open SQLite file {store_path}: {err}')
+            return None
+        if created:
+            with open(sample_json_path, 'r', encoding='utf-8') as fp:
+                store.import_data(DataLoader(fp, sample_json_path))
+            self._messages.append(
+                'Created a SQLite file with sample data and using it. '
+                f'Creation path: {store_path}'
+                )
+        return store
+
+    def _construct_compiled(self, compiled_path: str) -> DataSource | None:
+        from .compiled_data import CompiledDataFile, compile_data
+        if not os.path.exists(compiled_path):
+            with open(sample_json_path, 'r', encoding='utf-8') as fp:
+                compile_data(DataLoader(fp, sample_json_path), compiled_path)
+            self._messages.append(
+                'Created a compiled data file with sample data and using it. '
+                f'Creation path: {compiled_path}'
+                )
+        try:
+            return CompiledDataFile(compiled_path)
+        except (OSError, CompiledDataFileError) as err:
+            self._messages.append(str(err))
+            return None
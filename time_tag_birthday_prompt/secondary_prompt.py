@@ -55,7 +55,7 @@ class SecondaryPrompt:
                 )
 
     def __str__(self):
-        return self.get_str(datetime.now())
+        return self.get_str(self._primary_prompt.now())
     
     def get_str(self, now: datetime):
         time_tag = self._primary_prompt.get_time_tag(now)
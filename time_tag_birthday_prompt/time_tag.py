@@ -6,12 +6,19 @@ Define `TimeTag` class.
 
 """
 
-from typing import Tuple, List
+from typing import FrozenSet, Tuple, List
+import datetime
 
 from .exceptions import (
-    TimeTagInitGroup, IncorrectParameterTypeError, IncorrectTimeFormatError,
-    TimeDoesntExistError
+    TimeTagInitGroup, IncorrectParameterTypeError, IncorrectWeekdaysError,
+    IncorrectDateRangeError
     )
+from .parsers import parse_date, parse_time
+
+_WEEKDAY_NAMES = [
+    'monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday',
+    'sunday'
+    ]
 
 
 class TimeTag:
@@ -25,41 +32,72 @@ class TimeTag:
     start
     stop
     text
-    start_tuple : Tuple[int, int]
-        Tuple of (hours, minutes) resolved from string `start`.
-    stop_tuple : Tuple[int, int]
-        Tuple of (hours, minutes) resolved from string `stop`.
+    weekdays
+    dates
+    start_tuple : tuple of int
+        Tuple of (hours, minutes) or (hours, minutes, seconds) resolved
+        from string `start`.
+    stop_tuple : tuple of int
+        Tuple of (hours, minutes) or (hours, minutes, seconds) resolved
+        from string `stop`.
+    weekday_set : frozenset of int or None
+        Weekday numbers (Monday is 0) resolved from string `weekdays`.
+    date_range : tuple of two datetime.date or None
+        First and last date resolved from string `dates`. Year
+        `datetime.date.min.year` marks a range recurring every year.
     """
-    def __init__(self, start: str, stop: str, text: str):
+    def __init__(
+            self, start: str, stop: str, text: str,
+            weekdays: str | None = None, dates: str | None = None):
         """
         Initialize a `TimeTag` object.
 
         Parameters
         ----------
         start : str
-            Start time in format HH:MM.
+            Start time in format HH:MM or HH:MM:SS.
         stop : str
-            Stop time in format HH:MM.
+            Stop time in format HH:MM or HH:MM:SS.
         text : str
             Tag text printed in front of command line prompt.
+        weekdays : str, optional
+            Weekdays the tag starts on, such as 'Mon-Fri' or 'Sat,Sun'.
+            By default every day.
+        dates : str, optional
+            Dates the tag starts on in format MM-DD..MM-DD (every year)
+            or YYYY-MM-DD..YYYY-MM-DD. A single date is also accepted.
+            By default every date.
 
         Raises
         ------
         TimeTagInitGroup
             The `ExceptionGroup` may contain errors
-            `IncorrectParameterTypeError`, `IncorrectTimeFormatError`
-            and/or `TimeDoesntExistError`.
+            `IncorrectParameterTypeError`, `IncorrectTimeFormatError`,
+            `TimeDoesntExistError`, `IncorrectWeekdaysError` and/or
+            `IncorrectDateRangeError`.
         """
         self.start = start
-        """Start time in format HH:MM."""
+        """Start time in format HH:MM or HH:MM:SS."""
         self.stop = stop
-        """Stop time in format HH:MM."""
+        """Stop time in format HH:MM or HH:MM:SS."""
         self.text = text
         """Tag text printed in front of command line prompt."""
-        self.start_tuple: Tuple[int, int]
-        """Tuple of (hours, minutes) resolved from string `start`."""
-        self.stop_tuple: Tuple[int, int]
-        """Tuple of (hours, minutes) resolved from string `stop`."""
+        self.weekdays = weekdays
+        """Weekdays the tag starts on or None for every day."""
+        self.dates = dates
+        """Dates the tag starts on or None for every date."""
+        self.start_tuple: Tuple[int, ...]
+        """Tuple of (hours, minutes[, seconds]) resolved from string
+        `start`.
+        """
+        self.stop_tuple: Tuple[int, ...]
+        """Tuple of (hours, minutes[, seconds]) resolved from string
+        `stop`.
+        """
+        self.weekday_set: FrozenSet[int] | None = None
+        """Weekday numbers resolved from string `weekdays`."""
+        self.date_range: Tuple[datetime.date, datetime.date] | None = None
+        """First and last date resolved from string `dates`."""
 
         err_list = []
         if not isinstance(start, str):
@@ -78,27 +116,93 @@ class TimeTag:
             err_list.append(IncorrectParameterTypeError(
                 'text', type(text).__name__, 'time tag', expected_type='string'))
         
+        if weekdays is not None:
+            if not isinstance(weekdays, str):
+                err_list.append(IncorrectParameterTypeError(
+                    'weekdays', type(weekdays).__name__, 'time tag', text,
+                    'string'))
+            else:
+                self.weekday_set = self._resolve_weekday_set(err_list)
+        
+        if dates is not None:
+            if not isinstance(dates, str):
+                err_list.append(IncorrectParameterTypeError(
+                    'dates', type(dates).__name__, 'time tag', text,
+                    'string'))
+            else:
+                self.date_range = self._resolve_date_range(err_list)
+        
         if len(err_list) > 0:
             raise TimeTagInitGroup('TimeTagInitGroup', tuple(err_list))
     
     def _resolve_tuple(
             self, field_name: str, time_value: str, err_list: List[Exception]
-            ) -> Tuple[int] | None:
-        sp = time_value.split(':', 1)
-        if len(sp) == 1:
-            err_list.append(
-                IncorrectTimeFormatError(field_name, time_value, self.text))
-            return None
-        
-        try:
-            h, m = int(sp[0]), int(sp[1])
-        except ValueError:
-            err_list.append(
-                IncorrectTimeFormatError(field_name, time_value, self.text))
-            return None
+            ) -> Tuple[int, ...] | None:
+        return parse_time(field_name, time_value, self.text, err_list)
+    
+    def applies_on(self, day: datetime.date) -> bool:
+        """
+        Tell whether the tag starts on date `day`.
+
+        Parameters
+        ----------
+        day : datetime.date
+            Date to test against `weekday_set` and `date_range`.
+        """
+        if (self.weekday_set is not None
+                and day.weekday() not in self.weekday_set):
+            return False
+        if self.date_range is None:
+            return True
+        first, last = self.date_range
+        if first.year != datetime.date.min.year:
+            return first <= day <= last
+        md = (day.month, day.day)
+        first_md, last_md = (first.month, first.day), (last.month, last.day)
+        if first_md <= last_md:
+            return first_md <= md <= last_md
+        return md >= first_md or md <= last_md
+    
+    def _resolve_weekday_set(
+            self, err_list: List[Exception]) -> FrozenSet[int] | None:
+        weekday_set = set()
+        for part in self.weekdays.split(','):
+            ends = []
+            for name in part.split('-'):
+                name = name.strip().lower()
+                for i, weekday_name in enumerate(_WEEKDAY_NAMES):
+                    if name in (weekday_name, weekday_name[:3]):
+                        ends.append(i)
+                        break
+                else:
+                    err_list.append(
+                        IncorrectWeekdaysError(self.weekdays, self.text))
+                    return None
+            if len(ends) > 2:
+                err_list.append(
+                    IncorrectWeekdaysError(self.weekdays, self.text))
+                return None
+            first, last = ends[0], ends[-1]
+            weekday_set.update(
+                i % 7 for i in range(first, last + 1 + (first > last) * 7))
+        return frozenset(weekday_set)
+    
+    def _resolve_date_range(
+            self, err_list: List[Exception]
+            ) -> Tuple[datetime.date, datetime.date] | None:
+        ends = []
+        for date_str in self.dates.split('..'):
+            date_obj = parse_date(date_str.strip(), self.text, [])
+            if date_obj is None:
+                err_list.append(IncorrectDateRangeError(self.dates, self.text))
+                return None
+            ends.append(date_obj)
         
-        if h < 0 or h > 23 or m < 0 or m > 59:
-            err_list.append(
-                TimeDoesntExistError(field_name, time_value, self.text))
+        first, last = ends[0], ends[-1]
+        is_recurring = first.year == datetime.date.min.year
+        if (len(ends) > 2
+                or is_recurring != (last.year == datetime.date.min.year)
+                or not is_recurring and first > last):
+            err_list.append(IncorrectDateRangeError(self.dates, self.text))
             return None
-        return h, m
+        return first, last
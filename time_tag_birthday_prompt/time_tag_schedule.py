@@ -0,0 +1,345 @@
+"""
+Define `TimeTagSchedule` class.
+
+`TimeTagSchedule` objects are compiled from a list of `TimeTag` objects
+and used internally by `PrimaryPrompt` to resolve the active time tag.
+
+"""
+
+from array import array
+from bisect import bisect_right
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Sequence, Set, Tuple
+import heapq
+import math
+
+from .time_tag import TimeTag
+
+_DAY_SECONDS = 24 * 60 * 60
+_WEEK_SECONDS = 7 * _DAY_SECONDS
+_DENSE_TABLE_MAX_BYTES = 64 * 1024
+_LEAP_YEAR = 2000
+_EXCEPTION_CACHE_SIZE = 32
+
+_Timeline = Tuple[List[int], List[int]]
+
+
+class TimeTagSchedule:
+    """
+    Class of time tags compiled into a weekly schedule.
+
+    Time tags without dates are compiled into a weekly timeline at the
+    resolution of one second. Timelines are non-overlapping segments
+    stored as sorted boundaries, each owned by the time tag active
+    during it, so that the active tag and the next change of the prompt
+    text are found by bisection. When the boundaries share a coarse
+    step, e.g. whole minutes, the weekly timeline is also expanded into
+    a dense table at that step so that the active tag is a single
+    lookup. The table is only built when it takes less than 64 KiB, as
+    a table at one-second resolution would be far larger than the
+    boundaries. Dates touched by date-bound tags are kept in a small
+    exception table and compiled into day timelines on first use.
+
+    Attributes
+    ----------
+    time_tags : list of TimeTag
+        Time tags the schedule is compiled from. When tags overlap, the
+        one later in the list wins.
+    """
+
+    def __init__(self, time_tags: List[TimeTag] | None) -> None:
+        """
+        Compile a time tag schedule. Invoked by PrimaryPrompt.
+
+        Parameters
+        ----------
+        time_tags : list of TimeTag or None
+            Time tags in the order of the JSON data file.
+        """
+        self.time_tags: List[TimeTag] = list(time_tags) if time_tags else []
+        """Time tags the schedule is compiled from."""
+
+        self._week_bounds = array('l')
+        self._week_owners = array('h')
+        self._week_table: array | None = None
+        self._table_step = 0
+        self._week_days: List[_Timeline] = []
+        self._exception_mds: Set[Tuple[int, int]] = set()
+        self._exception_ordinals: Set[int] = set()
+        self._exception_days: Dict[int, _Timeline] = {}
+
+        self._compile_week()
+        self._compile_exception_table()
+
+    def active_at(self, t: datetime) -> TimeTag | None:
+        """
+        Return the time tag active at `t` or None if no tag is active.
+
+        Parameters
+        ----------
+        t : datetime
+            Point in time.
+        """
+        owner = self._owner_at(t)
+        return None if owner < 0 else self.time_tags[owner]
+
+    def next_transition(self, t: datetime) -> datetime | None:
+        """
+        Return the first moment after `t` when the active tag changes.
+
+        Returns None if the prompt text does not change within a year.
+
+        Parameters
+        ----------
+        t : datetime
+            Point in time. The returned datetime keeps its `tzinfo`.
+        """
+        owner = self._owner_at(t)
+        midnight = t.replace(hour=0, minute=0, second=0, microsecond=0)
+        search_days = 8
+        if self._exception_mds or self._exception_ordinals:
+            search_days = 367 + 8
+        for days in range(search_days):
+            bounds, owners = self._day_timeline(midnight + timedelta(days))
+            i = 0
+            if days == 0:
+                i = bisect_right(bounds, _second_of_day(t))
+            for i in range(i, len(bounds)):
+                if owners[i] != owner:
+                    return midnight + timedelta(
+                        days=days, seconds=bounds[i])
+        return None
+
+    def active_bulk(self, timestamps: Sequence[datetime] | Any) -> Any:
+        """
+        Return the index of the active time tag for every timestamp.
+
+        The indices refer to `time_tags` and -1 marks that no tag is
+        active. The semantics are the same as in `active_at()`.
+
+        Parameters
+        ----------
+        timestamps : sequence of datetime or numpy.ndarray
+            Points in time. A NumPy `datetime64` array is evaluated in
+            one vectorized pass and treated as wall-clock time, and a
+            NumPy array of indices is returned. Otherwise a list of
+            indices is returned. NaT values map to -1.
+        """
+        if getattr(getattr(timestamps, 'dtype', None), 'kind', None) == 'M':
+            return self._active_bulk_numpy(timestamps)
+        if (self._exception_mds or self._exception_ordinals
+                or self._week_table is None):
+            return [self._owner_at(t) for t in timestamps]
+        table, step = self._week_table, self._table_step
+        return [
+            table[(t.weekday() * _DAY_SECONDS + t.hour * 3600
+                   + t.minute * 60 + t.second) // step]
+            for t in timestamps
+            ]
+
+    def _active_bulk_numpy(self, timestamps: Any) -> Any:
+        import numpy as np
+
+        shape = timestamps.shape
+        timestamps = timestamps.ravel()
+        is_nat = np.isnat(timestamps)
+        seconds = timestamps.astype('datetime64[s]').astype(np.int64)
+        seconds[is_nat] = 0
+        days = seconds // _DAY_SECONDS
+        second_of_day = seconds - days * _DAY_SECONDS
+        # Day 0 of the epoch, 1970-01-01, is a Thursday.
+        week_positions = (days + 3) % 7 * _DAY_SECONDS + second_of_day
+        if self._week_table is not None:
+            table = np.frombuffer(self._week_table, dtype=np.int16)
+            owners = table[week_positions // self._table_step]
+        else:
+            bounds = np.asarray(self._week_bounds, dtype=np.int64)
+            owners = np.asarray(self._week_owners, dtype=np.int16)[
+                np.searchsorted(bounds, week_positions, side='right') - 1]
+
+        if self._exception_mds or self._exception_ordinals:
+            # Exception days are laid one after another so that a single
+            # search over their concatenated boundaries resolves them all.
+            epoch_ordinal = date(1970, 1, 1).toordinal()
+            unique_days, inverse = np.unique(days, return_inverse=True)
+            slots = np.full(len(unique_days), -1, dtype=np.int64)
+            all_bounds: List[int] = []
+            all_owners: List[int] = []
+            offset = 0
+            for i, day_number in enumerate(unique_days.tolist()):
+                day = date.fromordinal(epoch_ordinal + day_number)
+                if not self._is_exception(day):
+                    continue
+                bounds, day_owners = self._exception_day(day)
+                slots[i] = offset
+                all_bounds.extend(offset * _DAY_SECONDS + b for b in bounds)
+                all_owners.extend(day_owners)
+                offset += 1
+            slots = slots[inverse.ravel()]
+            in_exception = slots >= 0
+            positions = np.searchsorted(
+                all_bounds,
+                slots[in_exception] * _DAY_SECONDS
+                + second_of_day[in_exception],
+                side='right'
+                ) - 1
+            owners[in_exception] = np.asarray(all_owners, np.int16)[positions]
+        owners[is_nat] = -1
+        return owners.reshape(shape)
+
+    def _owner_at(self, t: datetime) -> int:
+        second = _second_of_day(t)
+        if self._is_exception(t):
+            bounds, owners = self._exception_day(t)
+            return owners[bisect_right(bounds, second) - 1]
+        position = t.weekday() * _DAY_SECONDS + second
+        if self._week_table is not None:
+            return self._week_table[position // self._table_step]
+        return self._week_owners[
+            bisect_right(self._week_bounds, position) - 1]
+
+    def _compile_week(self) -> None:
+        intervals = []
+        for i, tag in enumerate(self.time_tags):
+            if tag.date_range is not None:
+                continue
+            weekdays = tag.weekday_set
+            if weekdays is None:
+                weekdays = range(7)
+            for weekday in weekdays:
+                offset = weekday * _DAY_SECONDS
+                start, stop = _tag_span(tag)
+                start, stop = offset + start, offset + stop
+                if stop > _WEEK_SECONDS:
+                    intervals.append((0, stop - _WEEK_SECONDS, i))
+                    stop = _WEEK_SECONDS
+                intervals.append((start, stop, i))
+        bounds, owners = _paint(intervals, _WEEK_SECONDS)
+        self._week_bounds.extend(bounds)
+        self._week_owners.extend(owners)
+
+        step = math.gcd(_WEEK_SECONDS, *bounds)
+        table_bytes = _WEEK_SECONDS // step * self._week_owners.itemsize
+        if table_bytes <= _DENSE_TABLE_MAX_BYTES:
+            self._table_step = step
+            self._week_table = array('h')
+            for i, owner in enumerate(owners):
+                stop = bounds[i+1] if i + 1 < len(bounds) else _WEEK_SECONDS
+                self._week_table.extend(
+                    array('h', [owner]) * ((stop - bounds[i]) // step))
+
+        for weekday in range(7):
+            offset = weekday * _DAY_SECONDS
+            i = bisect_right(bounds, offset) - 1
+            day_bounds, day_owners = [0], [owners[i]]
+            for i in range(i + 1, len(bounds)):
+                if bounds[i] >= offset + _DAY_SECONDS:
+                    break
+                day_bounds.append(bounds[i] - offset)
+                day_owners.append(owners[i])
+            self._week_days.append((day_bounds, day_owners))
+
+    def _compile_exception_table(self) -> None:
+        for tag in self.time_tags:
+            if tag.date_range is None:
+                continue
+            first, last = tag.date_range
+            wraps = _tag_span(tag)[1] > _DAY_SECONDS
+            if first.year == date.min.year:
+                day = date(_LEAP_YEAR, first.month, first.day)
+                stop = date(_LEAP_YEAR, last.month, last.day)
+                if stop < day:
+                    stop = stop.replace(year=_LEAP_YEAR + 1)
+                while day <= stop + timedelta(wraps):
+                    self._exception_mds.add((day.month, day.day))
+                    day += timedelta(1)
+            else:
+                self._exception_ordinals.update(range(
+                    first.toordinal(), last.toordinal() + 1 + wraps))
+
+    def _is_exception(self, day: date) -> bool:
+        return (
+            (day.month, day.day) in self._exception_mds
+            or day.toordinal() in self._exception_ordinals
+            )
+
+    def _day_timeline(self, day: date) -> _Timeline:
+        if self._is_exception(day):
+            return self._exception_day(day)
+        return self._week_days[day.weekday()]
+
+    def _exception_day(self, day: date) -> _Timeline:
+        ordinal = day.toordinal()
+        timeline = self._exception_days.get(ordinal)
+        if timeline is not None:
+            return timeline
+
+        day = date.fromordinal(ordinal)
+        yesterday = date.fromordinal(ordinal - 1)
+        intervals = []
+        for i, tag in enumerate(self.time_tags):
+            start, stop = _tag_span(tag)
+            if tag.applies_on(day):
+                intervals.append((start, min(stop, _DAY_SECONDS), i))
+            if stop > _DAY_SECONDS and tag.applies_on(yesterday):
+                intervals.append((0, stop - _DAY_SECONDS, i))
+
+        if len(self._exception_days) >= _EXCEPTION_CACHE_SIZE:
+            self._exception_days.clear()
+        timeline = _paint(intervals, _DAY_SECONDS)
+        self._exception_days[ordinal] = timeline
+        return timeline
+
+
+def _second_of_day(t: datetime) -> int:
+    return t.hour * 3600 + t.minute * 60 + t.second
+
+
+def _tag_span(tag: TimeTag) -> Tuple[int, int]:
+    """
+    Return the seconds of `tag` as (start, stop) counted from the
+    midnight of the day the tag starts on. Wrapping tags end past 86400.
+
+    A tag whose start and stop are equal lasts one minute, or one second
+    if its start is given in format HH:MM:SS.
+    """
+    start, stop = (
+        sum(unit * value for unit, value in zip((3600, 60, 1), time_tuple))
+        for time_tuple in (tag.start_tuple, tag.stop_tuple)
+        )
+    if start < stop:
+        return start, stop
+    elif start == stop:
+        return start, start + (1 if len(tag.start_tuple) == 3 else 60)
+    return start, _DAY_SECONDS + stop
+
+
+def _paint(
+        intervals: List[Tuple[int, int, int]], period: int) -> _Timeline:
+    """
+    Sweep `intervals` of (start, stop, owner) into merged segments.
+
+    The highest owner index covering a position wins. Positions
+    covered by no interval are owned by -1.
+    """
+    intervals = sorted(intervals)
+    points = sorted(
+        {0}.union(*((start, stop) for start, stop, _ in intervals)))
+    bounds: List[int] = []
+    owners: List[int] = []
+    heap: List[Tuple[int, int]] = []
+    j = 0
+    for point in points:
+        if point >= period:
+            break
+        while j < len(intervals) and intervals[j][0] <= point:
+            _, stop, owner = intervals[j]
+            heapq.heappush(heap, (-owner, stop))
+            j += 1
+        while heap and heap[0][1] <= point:
+            heapq.heappop(heap)
+        owner = -heap[0][0] if heap else -1
+        if not owners or owners[-1] != owner:
+            bounds.append(point)
+            owners.append(owner)
+    return bounds, owners
@@ -0,0 +1,99 @@
+"""
+Define functions for validating many data files in parallel.
+
+Each file is validated with `DataLoader` and its construct methods,
+the same way `PrimaryPrompt` loads it, and the outcome is returned as a
+dictionary that can be written as a JSON line.
+
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List
+import csv
+import os
+
+from .data_loader import DataLoader, open_data_file
+from .exceptions import (
+    ConstructBirthdaysGroup, ConstructTimeTagsGroup, DataLoaderInitGroup,
+    ImportColumnMissingError
+    )
+from .importers import import_suffixes, iter_file_records
+
+_CHUNK_SIZE = 16
+
+
+def validate_file(path: str) -> Dict[str, Any]:
+    """
+    Validate data file `path` and return the outcome.
+
+    The returned dictionary has keys 'path', 'ok', 'birthdays' and
+    'timeTags' for the number of valid records, or None if the field is
+    null, and 'errors' for the error messages. CSV, vCard and iCalendar
+    files are read with `iter_file_records()`, other files as JSON data
+    files.
+
+    Parameters
+    ----------
+    path : str
+        Path of the data file.
+    """
+    result: Dict[str, Any] = {
+        'path': path, 'ok': False, 'birthdays': None, 'timeTags': None,
+        'errors': []
+        }
+    errors: List[str] = result['errors']
+    full_path = os.path.abspath(os.path.expanduser(path))
+    try:
+        if full_path.lower().endswith(import_suffixes):
+            data_loader = DataLoader.from_records(iter_file_records(full_path))
+        else:
+            with open_data_file(full_path) as fp:
+                data_loader = DataLoader(fp, full_path)
+        for key, construct, group_type in (
+                ('timeTags', data_loader.construct_time_tags,
+                 ConstructTimeTagsGroup),
+                ('birthdays', data_loader.construct_birthdays,
+                 ConstructBirthdaysGroup)):
+            try:
+                records = construct()
+            except group_type as err_group:
+                errors.extend(str(err) for err in err_group.exceptions)
+            else:
+                result[key] = None if records is None else len(records)
+    except DataLoaderInitGroup as err_group:
+        errors.extend(str(err) for err in err_group.exceptions)
+    except (OSError, ValueError, csv.Error, ImportColumnMissingError) as err:
+        errors.append(str(err))
+    result['ok'] = not errors
+    return result
+
+
+def validate_files(
+        paths: Iterable[str], max_workers: int | None = None
+        ) -> Iterator[Dict[str, Any]]:
+    """
+    Validate data files on a process pool and yield the outcomes of
+    `validate_file()` in the order of `paths`.
+
+    The files are handed to the worker processes in chunks, and each
+    outcome is yielded as soon as it and the outcomes before it are
+    ready.
+
+    Parameters
+    ----------
+    paths : iterable of str
+        Paths of the data files.
+    max_workers : int or None, default None
+        Number of worker processes. Defaults to the number of CPUs.
+        With 1 the files are validated in the calling process.
+    """
+    paths = list(paths)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(paths))
+    if max_workers <= 1:
+        yield from map(validate_file, paths)
+        return
+    chunk_size = max(1, min(_CHUNK_SIZE, len(paths) // (4 * max_workers)))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        yield from executor.map(validate_file, paths, chunksize=chunk_size)
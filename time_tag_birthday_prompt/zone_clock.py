@@ -0,0 +1,92 @@
+"""
+Define `ZoneClock` class.
+
+`ZoneClock` objects are initiated, stored and used internally by
+`PrimaryPrompt` when the prompt is given a time zone.
+
+"""
+
+from datetime import datetime, timedelta, timezone, tzinfo
+
+_SEARCH_STEP = timedelta(days=1)
+_SEARCH_STEPS = 400
+
+
+class ZoneClock:
+    """
+    Class for converting the current time to the wall-clock time of a
+    time zone.
+
+    The UTC offset of the zone is cached together with the period it is
+    valid for, i.e., until the next DST or other offset transition.
+    Within the period converting the current time is a single addition.
+
+    Attributes
+    ----------
+    zone : tzinfo
+        Time zone of the clock, usually a `zoneinfo.ZoneInfo` object.
+    """
+
+    def __init__(self, zone: tzinfo) -> None:
+        """
+        Initialize a zone clock. Invoked by PrimaryPrompt.
+
+        Parameters
+        ----------
+        zone : tzinfo
+            Time zone of the clock.
+        """
+        self.zone = zone
+        """Time zone of the clock."""
+
+        self._offset = timedelta(0)
+        self._valid_from = datetime.max
+        self._valid_until = datetime.min
+
+    def now(self) -> datetime:
+        """Return the current wall-clock time as a naive datetime."""
+        return self.from_utc(
+            datetime.now(timezone.utc).replace(tzinfo=None))
+
+    def from_utc(self, utc: datetime) -> datetime:
+        """
+        Convert naive UTC datetime `utc` to naive wall-clock time.
+
+        Parameters
+        ----------
+        utc : datetime
+            Naive datetime in UTC.
+        """
+        if not self._valid_from <= utc < self._valid_until:
+            self._refresh(utc)
+        return utc + self._offset
+
+    def _refresh(self, utc: datetime) -> None:
+        self._offset = self._offset_at(utc)
+        self._valid_from = utc
+        self._valid_until = datetime.max
+
+        # Step ahead a day at a time and bisect the step where the offset
+        # changes down to a second.
+        low = utc.replace(microsecond=0)
+        for _ in range(_SEARCH_STEPS):
+            if low > datetime.max - _SEARCH_STEP:
+                return
+            high = low + _SEARCH_STEP
+            if self._offset_at(high) != self._offset:
+                break
+            low = high
+        else:
+            self._valid_until = low
+            return
+        while high - low > timedelta(seconds=1):
+            mid = low + timedelta(
+                seconds=(high - low) // timedelta(seconds=2))
+            if self._offset_at(mid) == self._offset:
+                low = mid
+            else:
+                high = mid
+        self._valid_until = high
+
+    def _offset_at(self, utc: datetime) -> timedelta:
+        return self.zone.fromutc(utc.replace(tzinfo=self.zone)).utcoffset()